@@ -0,0 +1,53 @@
+"""Wall time of cubit.chunked.evaluate against the number of workers.
+
+Evaluates field -> Larmor frequency -> ppm offset over a memory-mapped array of
+magnetic fields, with threads and with processes, for 1 .. os.cpu_count() workers.
+Any speed-up only shows on a machine with several cores.
+
+    python scripts/bench_chunked.py [number of values]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from cubit import units
+from cubit.chunked import evaluate
+from cubit.memmap import QuantityMemmap
+from cubit.physical_data import ELEMENTARY_CHARGE, PROTON_MASS
+
+REFERENCE = 400 * units.mega * units.second**-1
+
+
+def ppm_offset(field):
+    larmor = ELEMENTARY_CHARGE * field / (2 * PROTON_MASS)
+    return 1e6 * (larmor - REFERENCE) / REFERENCE
+
+
+def main(n: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "field.f64"
+        fields = QuantityMemmap.create(path, n, units.tesla)
+        for chunk in range(0, n, 1 << 22):
+            size = min(1 << 22, n - chunk)
+            fields[chunk : chunk + size] = np.linspace(9.39, 9.41, size) * units.tesla
+        fields.flush()
+        fields = QuantityMemmap.open(path)
+        out = QuantityMemmap.create(Path(directory) / "ppm.f64", n, units.unum)
+
+        print(f"{n:,} values, {os.cpu_count()} cores")
+        print(f"{'workers':>8} {'threads [s]':>12} {'processes [s]':>14}")
+        for workers in range(1, (os.cpu_count() or 1) + 1):
+            timings = []
+            for processes in (False, True):
+                start = time.perf_counter()
+                evaluate(ppm_offset, field=fields, out=out, workers=workers, processes=processes)
+                timings.append(time.perf_counter() - start)
+            print(f"{workers:>8} {timings[0]:>12.3f} {timings[1]:>14.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000)
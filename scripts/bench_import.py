@@ -0,0 +1,48 @@
+"""Import time and peak RSS of ``import cubit.physical_data`` and of loading its tables.
+
+Each case runs in a fresh interpreter, with pandas importable and with it blocked, as
+if it were not installed.
+
+    python scripts/bench_import.py [repeats]
+"""
+import subprocess
+import sys
+
+CASE = """
+import resource, sys, time
+if {block}:
+    sys.modules["pandas"] = None  # importing pandas now raises ImportError
+start = time.perf_counter()
+import cubit.physical_data
+imported = time.perf_counter()
+cubit.physical_data.ISOTOPES
+loaded = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(imported - start, loaded - start, rss, "pandas" in sys.modules and sys.modules["pandas"] is not None)
+"""
+
+
+def run(*, block: bool) -> tuple[float, float, float, bool] | None:
+    process = subprocess.run([sys.executable, "-c", CASE.format(block=block)], capture_output=True, text=True)
+    if process.returncode != 0:
+        return None
+    output = process.stdout.split()
+    return float(output[0]), float(output[1]), float(output[2]), output[3] == "True"
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    header = ("pandas", "import (ms)", "+ tables (ms)", "peak RSS (MB)", "imported pandas")
+    print(" ".join(f"{h:>{w}}" for h, w in zip(header, (10, 12, 14, 14, 16), strict=True)))
+    for block in (False, True):
+        results = [run(block=block) for _ in range(repeats)]
+        label = "blocked" if block else "installed"
+        if None in results:
+            print(f"{label:>10} {'import fails':>12}")
+            continue
+        imported, loaded, rss = (min(r[i] for r in results) for i in range(3))
+        print(f"{label:>10} {imported * 1e3:12.1f} {loaded * 1e3:14.1f} {rss:14.1f} {results[0][3]!s:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Timing of scalar Quantity arithmetic chains.
+
+    python scripts/bench_scalar.py
+"""
+import timeit
+
+from cubit import units
+from cubit.system import Quantity
+
+mass = 2.0 * units.kilogram
+velocity = 3.0 * units.meter / units.second
+time = 0.5 * units.second
+CASES = {
+    "q * q": lambda: mass * velocity,
+    "q / q": lambda: velocity / time,
+    "q * float": lambda: velocity * 2.0,
+    "q + q": lambda: velocity + velocity,
+    "0.5 m v^2 / t": lambda: 0.5 * mass * velocity * velocity / time,
+    "Quantity(v)": lambda: Quantity(1.0),
+    "Quantity(v, Unit)": lambda: Quantity(1.0, units.meter),
+}
+
+
+def main() -> None:
+    for name, case in CASES.items():
+        number, _ = timeit.Timer(case).autorange()
+        best = min(timeit.repeat(case, number=number, repeat=5)) / number
+        print(f"{name:>20} {best * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
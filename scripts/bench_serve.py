@@ -0,0 +1,94 @@
+"""Latency and throughput of the cubit.serve conversion server against in-process conversion.
+
+Starts ``python -m cubit.serve`` on a temporary unix socket and measures, with
+``cubit.serve.Client``,
+  - latency: one request at a time, so every request waits out the batching window
+  - throughput: many requests in flight over several connections, so they coalesce
+The in-process baseline converts the same requests by calling cubit directly, after
+paying the import and warm-up cost once, which the server pays once for all clients.
+
+    python scripts/bench_serve.py [requests] [window in ms]
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PAIRS = [("km/h", "m/s"), ("kJ", "J"), ("MHz", "Hz"), ("mmol/L", "mol m^-3"), ("GiB", "bit")]
+
+
+def in_process(n: int) -> tuple[float, float, float]:
+    start = time.perf_counter()
+    from cubit.serve import conversion_factor, parse_unit
+
+    parse_unit("m")  # loads the catalogue
+    warm = time.perf_counter() - start
+    latencies = []
+    for i in range(n):
+        source, target = PAIRS[i % len(PAIRS)]
+        t = time.perf_counter()
+        _ = (i * parse_unit(source)).value * conversion_factor(source, target)
+        latencies.append(time.perf_counter() - t)
+    return warm, float(np.median(latencies)), n / sum(latencies)
+
+
+async def latency(client, n: int) -> tuple[float, float]:
+    latencies = []
+    for i in range(n):
+        source, target = PAIRS[i % len(PAIRS)]
+        t = time.perf_counter()
+        await client.convert(float(i), source, target)
+        latencies.append(time.perf_counter() - t)
+    return float(np.median(latencies)), float(np.percentile(latencies, 99))
+
+
+async def throughput(clients, n: int) -> float:
+    start = time.perf_counter()
+    requests = (clients[i % len(clients)].convert(float(i), *PAIRS[i % len(PAIRS)]) for i in range(n))
+    await asyncio.gather(*requests)
+    return n / (time.perf_counter() - start)
+
+
+async def remote(path: str, n: int) -> tuple[float, float, float]:
+    from cubit.serve import Client
+
+    clients = [await Client.connect(path) for _ in range(4)]
+    await clients[0].convert(1.0, "m", "m")
+    p50, p99 = await latency(clients[0], min(n, 500))
+    rate = await throughput(clients, n)
+    for client in clients:
+        await client.close()
+    return p50, p99, rate
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    window = sys.argv[2] if len(sys.argv) > 2 else "2"
+    warm, local_latency, local_rate = in_process(n)  # first, so that it pays the import
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "cubit.sock")
+        server = subprocess.Popen([sys.executable, "-m", "cubit.serve", "--socket", path, "--window", window])
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+            p50, p99, rate = asyncio.run(remote(path, n))
+        finally:
+            server.terminate()
+            server.wait()
+    print(
+        f"server, {window} ms window: latency p50 {p50 * 1e3:.2f} ms, p99 {p99 * 1e3:.2f} ms, "
+        f"{rate:,.0f} requests/s"
+    )
+    print(
+        f"in-process: import and warm-up {warm * 1e3:.0f} ms, then {local_latency * 1e6:.1f} us, "
+        f"{local_rate:,.0f} requests/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
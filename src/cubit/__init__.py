@@ -0,0 +1,12 @@
+def __getattr__(name: str):
+    # imported on first use to keep `import cubit` cheap
+    if name == "compile":
+        from .trace import compile
+
+        return compile
+    if name == "memoize":
+        from .memo import memoize
+
+        return memoize
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,4 +1,5 @@
-import inspect
+import threading
+from abc import ABC
 from fractions import Fraction
 from typing import ClassVar, final, TypeVar
 
@@ -45,6 +46,9 @@ class MultitonMeta(type):
     """
 
     _instances: ClassVar = {}
+    # instances are compared by identity, so two threads must never both create one for
+    # the same key. Reentrant, as creating an instance may create others.
+    _lock: ClassVar = threading.RLock()
 
     def __new__(metacls, name, bases, namespace, key=None):  # noqa: N804
         cls = super().__new__(metacls, name, bases, namespace)
@@ -52,6 +56,8 @@ class MultitonMeta(type):
         return cls
 
     def __call__(cls, *args, **kwargs):
+        import inspect  # deferred, rehydrating with intern() does not need it
+
         sig = inspect.signature(cls.__init__)
         bound = sig.bind(None, *args, **kwargs)
         bound.apply_defaults()
@@ -62,17 +68,50 @@ class MultitonMeta(type):
             index = cls, tuple(sorted(standardized_args.items()))
         else:
             index = cls, tuple(sorted([(k, standardized_args[k]) for k in cls.key]))
-        if index not in cls._instances:
-            cls._instances[index] = super().__call__(
-                *args,
-                **kwargs,
-            )
-        return cls._instances[index]
+        if (instance := cls._instances.get(index)) is not None:
+            return instance
+        with MultitonMeta._lock:
+            if index not in cls._instances:
+                cls._instances[index] = super().__call__(
+                    *args,
+                    **kwargs,
+                )
+            return cls._instances[index]
+
+    def intern(cls, **attributes):
+        """Return the instance keyed on ``attributes``, creating it without calling ``__init__``.
+
+        Used to rehydrate precomputed instances. ``attributes`` must hold every argument
+        of ``__init__`` and become the new instance's ``__dict__``.
+        """
+        if cls.key is None:
+            index = cls, tuple(sorted(attributes.items()))
+        else:
+            index = cls, tuple(sorted([(k, attributes[k]) for k in cls.key]))
+        if (instance := cls._instances.get(index)) is not None:
+            return instance
+        with MultitonMeta._lock:
+            if index not in cls._instances:
+                instance = cls.__new__(cls)
+                instance.__dict__.update(attributes)
+                cls._instances[index] = instance
+            return cls._instances[index]
 
 
 NumberLike = int | float | complex | Fraction
 
 
+class ArrayLike(ABC):  # noqa: B024
+    """ArrayLike.
+    Structural type matching array values, e.g. NumPy arrays or pandas Series, without
+        importing NumPy. Any class implementing ``__array__`` is a virtual subclass.
+    """
+
+    @classmethod
+    def __subclasshook__(cls, subclass):
+        return hasattr(subclass, "__array__") or NotImplemented
+
+
 T = TypeVar("T")
 Sentinel = type[T]
 @final
@@ -0,0 +1,81 @@
+# generated by `python -m cubit.units` from cubit.units._build_catalogue(), do not edit
+# fmt: off
+# prefix: (symbol, factor)
+PREFIXES = {
+    'quetta': ('Q', 1e+30),
+    'ronna': ('R', 1e+27),
+    'yotta': ('Y', 1e+24),
+    'zetta': ('Z', 1e+21),
+    'exa': ('E', 1e+18),
+    'peta': ('P', 1000000000000000.0),
+    'tera': ('T', 1000000000000.0),
+    'giga': ('G', 1000000000.0),
+    'mega': ('M', 1000000.0),
+    'kilo': ('k', 1000.0),
+    'hecto': ('h', 100.0),
+    'deca': ('da', 10.0),
+    'deci': ('d', 0.1),
+    'centi': ('c', 0.01),
+    'milli': ('m', 0.001),
+    'micro': ('μ', 1e-06),
+    'nano': ('n', 1e-09),
+    'pico': ('p', 1e-12),
+    'femto': ('f', 1e-15),
+    'atto': ('a', 1e-18),
+    'zepto': ('z', 1e-21),
+    'yocto': ('y', 1e-24),
+    'ronto': ('r', 1e-27),
+    'quecto': ('q', 1e-30),
+    'yobi': ('Yi', 1208925819614629174706176),
+    'zebi': ('Zi', 1180591620717411303424),
+    'exbi': ('Ei', 1152921504606846976),
+    'pebi': ('Pi', 1125899906842624),
+    'tebi': ('Ti', 1099511627776),
+    'gibi': ('Gi', 1073741824),
+    'mebi': ('Mi', 1048576),
+    'kibi': ('ki', 1024),
+}
+# unit: (physical dimension, name, symbol, referent, prefix)
+BASE_UNITS = {
+    'second': ('TIME', 'second', 's', None, ''),
+    'meter': ('LENGTH', 'meter', 'm', None, ''),
+    'gram': ('MASS', 'gram', 'g', None, ''),
+    'ampere': ('CURRENT', 'ampere', 'A', None, ''),
+    'kelvin': ('TEMPERATURE', 'kelvin', 'K', None, ''),
+    'mole': ('AMOUNT_OF_SUBSTANCE', 'mole', 'mol', None, ''),
+    'candela': ('LUMINOUS_INTENSITY', 'candela', 'cd', None, ''),
+    'radian': ('NONDIMENSIONAL', 'radian', 'rad', None, ''),
+    'kilogram': ('MASS', 'gram', 'g', None, 'kilo'),
+    'cycle': ('NONDIMENSIONAL', 'cycle', '', 'cycle', ''),
+    'disintegration': ('NONDIMENSIONAL', 'disintegration', '', 'disintegration', ''),
+    'binary_digit': ('NONDIMENSIONAL', 'binary digit', '', 'bit', ''),
+}
+# unit: (name, symbol, factor, ((base unit, power), ...), factor key, coherent)
+DERIVED_UNITS = {
+    'turn': ('turn', 'turn', 6.283185307179586, (('radian', 1),), '6.28318530718+0j', False),
+    'hertz': ('hertz', 'Hz', 1.0, (('cycle', 1), ('second', -1)), '1+0j', True),
+    'steradian': ('steradian', 'sr', 1.0, (('radian', 2),), '1+0j', True),
+    'liter': ('liter', 'L', 0.001, (('meter', 3),), '0.001+0j', False),
+    'newton': ('newton', 'N', 1000.0, (('gram', 1), ('meter', 1), ('second', -2)), '1000+0j', True),
+    'joule': ('joule', 'J', 1000.0, (('meter', 2), ('gram', 1), ('second', -2)), '1000+0j', True),
+    'watt': ('watt', 'W', 1000.0, (('meter', 2), ('gram', 1), ('second', -3)), '1000+0j', True),
+    'coulomb': ('coulomb', 'C', 1.0, (('ampere', 1), ('second', 1)), '1+0j', True),
+    'volt': ('volt', 'V', 1000.0, (('meter', 2), ('gram', 1), ('second', -3), ('ampere', -1)), '1000+0j', True),
+    'farad': ('farad', 'F', 0.001, (('ampere', 2), ('second', 4), ('meter', -2), ('gram', -1)), '0.001+0j', True),
+    'ohm': ('ohm', 'Ω', 1000.0, (('meter', 2), ('gram', 1), ('second', -3), ('ampere', -2)), '1000+0j', True),
+    'siemens': ('siemens', 'S', 0.001, (('meter', -2), ('gram', -1), ('second', 3), ('ampere', 2)), '0.001+0j', True),
+    'weber': ('weber', 'Wb', 1000.0, (('meter', 2), ('gram', 1), ('second', -2), ('ampere', -1)), '1000+0j', True),
+    'tesla': ('tesla', 'T', 1000.0, (('gram', 1), ('second', -2), ('ampere', -1)), '1000+0j', True),
+    'henry': ('henry', 'H', 1000.0, (('meter', 2), ('gram', 1), ('second', -2), ('ampere', -2)), '1000+0j', True),
+    'lumen': ('lumen', 'lm', 1.0, (('radian', 2), ('candela', 1)), '1+0j', True),
+    'lux': ('lux', 'lx', 1.0, (('radian', 2), ('candela', 1), ('meter', -2)), '1+0j', True),
+    'becquerel': ('becquerel', 'Bq', 1.0, (('disintegration', 1), ('second', -1)), '1+0j', True),
+    'minute': ('minute', 'min', 60.0, (('second', 1),), '60+0j', False),
+    'hour': ('hour', 'h', 3600.0, (('second', 1),), '3600+0j', False),
+    'day': ('day', 'd', 86400.0, (('second', 1),), '86400+0j', False),
+    'year': ('year', 'a', 31557600.0, (('second', 1),), '31557600+0j', False),
+    'barn': ('barn', 'b', 1e-28, (('meter', 2),), '1e-28+0j', False),
+    'bit': ('bit', 'bit', 1.0, (('binary_digit', 1),), '1+0j', True),
+    'byte': ('byte', 'B', 8.0, (('binary_digit', 1),), '8+0j', False),
+    'dalton': ('dalton', 'Da', 1.6605390666e-24, (('gram', 1),), '1.6605390666e-24+0j', False),
+}
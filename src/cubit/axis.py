@@ -0,0 +1,251 @@
+"""Evenly spaced coordinate axes with units, stored as (start, step, n).
+
+Time, frequency and chemical shift axes of sampled signals and spectra are linear, so
+a ``LinearAxis`` keeps only its first coordinate, its spacing, its length and its unit.
+Unit conversion, reversal, slicing and scaling act on (start, step), and the index of
+a coordinate is computed rather than searched for, all in O(1). The coordinates are
+only materialized when the axis is indexed with an array, converted to an array, or
+turned into a pandas index.
+"""
+import numbers
+import operator
+
+import numpy as np
+
+from .system import _DIMENSIONLESS, CompositeUnit, Quantity, Unit
+
+
+def _composite(unit: Unit | CompositeUnit | None) -> CompositeUnit:
+    if unit is None:
+        return _DIMENSIONLESS
+    return unit.as_composite() if isinstance(unit, Unit) else unit
+
+
+def _in_unit(x, unit: CompositeUnit):
+    # x expressed in unit, plain numbers are taken to be in unit already
+    if not isinstance(x, Quantity):
+        return x
+    if x.unit.signature != unit.signature:
+        msg = f"{x} cannot be expressed in {unit}"
+        raise TypeError(msg)
+    if x.unit.factor == unit.factor:
+        return x.value
+    return x.value * (x.unit.factor / unit.factor)
+
+
+def _scalar(x):
+    # an axis is shifted or scaled by one number or scalar quantity
+    if np.ndim(x.value if isinstance(x, Quantity) else x) != 0:
+        msg = "an axis can only be shifted or scaled by a scalar, not an array"
+        raise TypeError(msg)
+    return x
+
+
+class LinearAxis:
+    """The ``n`` coordinates ``start + i step`` in ``unit``.
+
+    Parameters
+    ----------
+    start, step : number or Quantity
+        first coordinate and spacing, either in ``unit`` or as quantities of its
+        dimensions
+    n : int
+    unit : Unit | CompositeUnit | None
+        defaults to the unit of ``step`` if it is a quantity, else non-dimensional
+
+    Example
+    -------
+    >>> time = LinearAxis(0, 1e-4 * units.second, 4096)
+    >>> time[10], time.index_of(1e-3 * units.second)
+    (0.001 s, 10)
+    >>> len(time[::-2])
+    2048
+    """
+
+    __array_ufunc__ = None  # make NumPy defer to our reflected operators
+
+    def __init__(self, start, step, n: int, unit: Unit | CompositeUnit | None = None):
+        if unit is None and isinstance(step, Quantity):
+            unit = step.unit
+        self.unit: CompositeUnit = _composite(unit)
+        self.start = _in_unit(start, self.unit)
+        self.step = _in_unit(step, self.unit)
+        self.n = operator.index(n)
+        if self.n < 0:
+            msg = "an axis cannot have a negative length"
+            raise ValueError(msg)
+        if self.step == 0 and self.n > 1:
+            msg = "the coordinates of an axis must be distinct"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_quantity(cls, coordinates: Quantity, rtol: float = 1e-9) -> "LinearAxis":
+        """The axis of evenly spaced ``coordinates``, e.g. ``spectral.fft(...).frequency``.
+
+        Raises ``ValueError`` if the spacing varies by more than ``rtol`` of the step.
+        """
+        values = np.asarray(coordinates.value)
+        if values.ndim != 1:
+            msg = "an axis is one-dimensional"
+            raise ValueError(msg)
+        n = len(values)
+        if n < 2:
+            return cls(values[0] if n else 0.0, 1.0, n, coordinates.unit)
+        step = (values[-1] - values[0]) / (n - 1)
+        if not np.allclose(np.diff(values), step, rtol=0, atol=abs(step) * rtol):
+            msg = "the coordinates are not evenly spaced"
+            raise ValueError(msg)
+        return cls(values[0].item(), step.item(), n, coordinates.unit)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        return f"LinearAxis({self.start}, {self.step}, {self.n}, {self.unit.simplify()})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LinearAxis):
+            return NotImplemented
+        return (self.start, self.step, self.n, self.unit) == (other.start, other.step, other.n, other.unit)
+
+    def __hash__(self):
+        return hash((self.start, self.step, self.n, self.unit))
+
+    @property
+    def stop(self):
+        """The last coordinate, in ``unit``."""
+        return self.start + self.step * (self.n - 1)
+
+    @property
+    def value(self) -> np.ndarray:
+        """All coordinates, in ``unit``, as a new array."""
+        return self.start + self.step * np.arange(self.n, dtype=np.result_type(self.start, self.step, float))
+
+    @property
+    def base_value(self) -> np.ndarray:
+        """All coordinates, in the unscaled base units of ``unit``."""
+        return self.value * self.unit.factor
+
+    def __array__(self, dtype=None, copy=None):
+        return self.value if dtype is None else self.value.astype(dtype, copy=False)
+
+    def to_quantity(self) -> Quantity:
+        """All coordinates as an array ``Quantity``."""
+        return Quantity(self.value, self.unit)
+
+    def to_index(self, name: str | None = None):
+        """The coordinates as a pandas index, a ``RangeIndex`` if they are all integers."""
+        import pandas as pd
+
+        if all(isinstance(x, int | np.integer) for x in (self.start, self.step)):
+            # the step of an axis of at most one coordinate may be 0, which RangeIndex rejects
+            step = self.step or 1
+            return pd.RangeIndex(self.start, self.start + step * self.n, step, name=name)
+        return pd.Index(self.value, name=name)
+
+    def _position(self, i: int) -> int:
+        i = operator.index(i)
+        if not -self.n <= i < self.n:
+            msg = f"index {i} is out of range for an axis of length {self.n}"
+            raise IndexError(msg)
+        return i % self.n
+
+    def __getitem__(self, key):
+        """A coordinate as a ``Quantity`` for an integer, a ``LinearAxis`` for a slice.
+
+        Arrays of integers or booleans return the selected coordinates as a ``Quantity``.
+        """
+        if isinstance(key, slice):
+            positions = range(self.n)[key]
+            start = self.start + self.step * positions.start
+            return LinearAxis(start, self.step * positions.step, len(positions), self.unit)
+        if isinstance(key, int | np.integer):
+            return Quantity._make(self.start + self.step * self._position(key), self.unit)
+        positions = np.arange(self.n)[np.asarray(key)]
+        return Quantity(self.start + self.step * positions, self.unit)
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield Quantity._make(self.start + self.step * i, self.unit)
+
+    def index_of(self, coordinate, *, tolerance: float = 0.5):
+        """The index of the coordinate nearest to ``coordinate``, or an array of indexes.
+
+        Plain numbers are taken to be in ``unit``. Raises ``KeyError`` if a coordinate
+        is more than ``tolerance`` steps from the nearest one on the axis.
+        """
+        position = (np.asarray(_in_unit(coordinate, self.unit)) - self.start) / self.step
+        index = np.rint(position)
+        outside = (np.abs(position - index) > tolerance) | (index < 0) | (index >= self.n)
+        if np.any(outside):
+            msg = f"{coordinate} is not on the axis"
+            raise KeyError(msg)
+        index = index.astype(np.intp)
+        return int(index) if index.ndim == 0 else index
+
+    def to(self, unit: Unit | CompositeUnit) -> "LinearAxis":
+        """The same coordinates expressed in ``unit``."""
+        unit = _composite(unit)
+        if unit.signature != self.unit.signature:
+            msg = f"an axis in {self.unit} cannot be expressed in {unit}"
+            raise TypeError(msg)
+        if unit.factor == self.unit.factor:
+            return LinearAxis(self.start, self.step, self.n, unit)
+        factor = self.unit.factor / unit.factor
+        return LinearAxis(self.start * factor, self.step * factor, self.n, unit)
+
+    def flip(self) -> "LinearAxis":
+        """The coordinates in reverse order."""
+        return LinearAxis(self.stop, -self.step, self.n, self.unit)
+
+    def to_ppm(self, reference) -> "LinearAxis":
+        """The chemical shift of a frequency axis relative to ``reference``, in ppm."""
+        reference = _in_unit(reference, self.unit)
+        scale = 1e6 / reference
+        return LinearAxis((self.start - reference) * scale, self.step * scale, self.n)
+
+    def from_ppm(self, reference: Quantity) -> "LinearAxis":
+        """The frequencies of a chemical shift axis in ppm, in the unit of ``reference``."""
+        if self.unit.signature:
+            msg = "a chemical shift axis is non-dimensional"
+            raise TypeError(msg)
+        scale = reference.value * 1e-6
+        return LinearAxis(reference.value + self.start * scale, self.step * scale, self.n, reference.unit)
+
+    def __add__(self, other) -> "LinearAxis":
+        return LinearAxis(self.start + _in_unit(_scalar(other), self.unit), self.step, self.n, self.unit)
+
+    def __radd__(self, other) -> "LinearAxis":
+        return self.__add__(other)
+
+    def __sub__(self, other) -> "LinearAxis":
+        return LinearAxis(self.start - _in_unit(_scalar(other), self.unit), self.step, self.n, self.unit)
+
+    def __rsub__(self, other) -> "LinearAxis":
+        return -self + other
+
+    def __neg__(self) -> "LinearAxis":
+        return LinearAxis(-self.start, -self.step, self.n, self.unit)
+
+    def __mul__(self, other) -> "LinearAxis":
+        match _scalar(other):
+            case Quantity():
+                unit = self.unit * other.unit
+                return LinearAxis(self.start * other.value, self.step * other.value, self.n, unit)
+            case numbers.Real():
+                return LinearAxis(self.start * other, self.step * other, self.n, self.unit)
+            case _:
+                return NotImplemented
+
+    def __rmul__(self, other) -> "LinearAxis":
+        return self.__mul__(other)
+
+    def __truediv__(self, other) -> "LinearAxis":
+        match _scalar(other):
+            case Quantity():
+                unit = self.unit / other.unit
+                return LinearAxis(self.start / other.value, self.step / other.value, self.n, unit)
+            case numbers.Real():
+                return LinearAxis(self.start / other, self.step / other, self.n, self.unit)
+            case _:
+                return NotImplemented
@@ -0,0 +1,154 @@
+"""Buckingham-Pi reduction of dimensional variables to dimensionless groups.
+
+``pi_groups`` builds the integer matrix of the physical dimensions of the variables
+(one row per dimension, one column per variable) and computes a basis of its
+nullspace with exact rational arithmetic. Each basis vector holds the exponents of one
+dimensionless group. The basis only depends on the matrix, so it is cached and
+repeated variable sets, in any units of the same dimensions, reuse it.
+
+``nondimensionalize`` evaluates the groups over whole columns, with one array power
+and product per variable in a group, so no Python code runs per row.
+"""
+import functools
+import math
+from collections.abc import Mapping
+from fractions import Fraction
+from typing import NamedTuple
+
+import numpy as np
+
+from .system import CompositeUnit, PhysicalDimension, Quantity, Unit
+
+
+class PiGroup(NamedTuple):
+    """A dimensionless product of variables raised to integer powers."""
+
+    exponents: dict[str, int]  # variable name -> exponent, only non-zero exponents
+    factor: float  # value of the product of the variables' units, e.g. 1000 for km m^-1
+
+    def __str__(self):
+        return " ".join(f"{k}" if e == 1 else f"{k}^{e}" for k, e in self.exponents.items())
+
+
+def _composite(unit: Unit | CompositeUnit) -> CompositeUnit:
+    return unit.as_composite() if isinstance(unit, Unit) else unit
+
+
+def _dimensions(unit: CompositeUnit) -> dict[PhysicalDimension, Fraction]:
+    dimensions: dict[PhysicalDimension, Fraction] = {}
+    for u, p in unit.signature:
+        if u.physical_dimension is not PhysicalDimension.NONDIMENSIONAL:
+            dimensions[u.physical_dimension] = dimensions.get(u.physical_dimension, 0) + Fraction(p)
+    return dimensions
+
+
+def dimension_matrix(variables: Mapping[str, Unit | CompositeUnit]) -> tuple[tuple[int, ...], ...]:
+    """The exponents of each physical dimension (rows) in each variable (columns).
+
+    Fractional powers, e.g. of m^0.5, are cleared by scaling the whole matrix, which
+    does not change its nullspace.
+    """
+    columns = [_dimensions(_composite(u)) for u in variables.values()]
+    rows = [d for d in PhysicalDimension if any(c.get(d, 0) != 0 for c in columns)]
+    scale = math.lcm(1, *(p.denominator for c in columns for p in c.values()))
+    return tuple(tuple(int(c.get(d, 0) * scale) for c in columns) for d in rows)
+
+
+@functools.lru_cache(maxsize=256)
+def _nullspace(matrix: tuple[tuple[int, ...], ...], n: int) -> tuple[tuple[int, ...], ...]:
+    """An integer basis of the nullspace of ``matrix``, which has ``n`` columns.
+
+    The matrix is brought to reduced row echelon form with exact fractions. Each free
+    column gives one basis vector, with exponent 1 for its own variable (before clearing
+    denominators) and the pivot variables solved for, so the leading variables act as
+    the repeating variables of the classical method.
+    """
+    rows = [[Fraction(x) for x in row] for row in matrix]
+    pivots: list[int] = []
+    for column in range(n):
+        r = len(pivots)
+        pivot = next((i for i in range(r, len(rows)) if rows[i][column] != 0), None)
+        if pivot is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        rows[r] = [x / rows[r][column] for x in rows[r]]
+        for i in range(len(rows)):
+            if i != r and rows[i][column] != 0:
+                rows[i] = [x - rows[i][column] * y for x, y in zip(rows[i], rows[r], strict=True)]
+        pivots.append(column)
+
+    basis = []
+    for free in (c for c in range(n) if c not in pivots):
+        vector = [Fraction(0)] * n
+        vector[free] = Fraction(1)
+        for row, pivot in zip(rows, pivots, strict=False):
+            vector[pivot] = -row[free]
+        scale = math.lcm(*(x.denominator for x in vector))
+        integers = [int(x * scale) for x in vector]
+        divisor = math.gcd(*integers)
+        basis.append(tuple(x // divisor for x in integers))
+    return tuple(basis)
+
+
+def pi_groups(variables: Mapping[str, Unit | CompositeUnit]) -> tuple[PiGroup, ...]:
+    """The dimensionless groups that can be formed from ``variables``.
+
+    Parameters
+    ----------
+    variables : Mapping[str, Unit | CompositeUnit]
+        the unit of each variable. The first variables that together span the
+        dimensions are the repeating variables; each later variable appears in exactly
+        one group.
+
+    Example
+    -------
+    >>> [str(g) for g in pi_groups({"rho": kilogram / meter**3, "v": meter / second,
+    ...                             "L": meter, "mu": newton * second / meter**2})]
+    ['rho^-1 v^-1 L^-1 mu']
+    """
+    units = [_composite(u) for u in variables.values()]
+    basis = _nullspace(dimension_matrix(variables), len(units))
+    groups = []
+    for vector in basis:
+        exponents = {k: e for k, e in zip(variables, vector, strict=True) if e != 0}
+        factor = math.prod(u.factor**e for u, e in zip(units, vector, strict=True) if e != 0)
+        groups.append(PiGroup(exponents, factor))
+    return tuple(groups)
+
+
+def nondimensionalize(data, variables: Mapping[str, Unit | CompositeUnit] | None = None):
+    """Evaluate the Pi groups of the columns of ``data``, column by column.
+
+    Parameters
+    ----------
+    data : Mapping[str, Quantity | ArrayLike] | pandas.DataFrame
+        equally long columns, by variable name. ``Quantity`` columns carry their unit.
+    variables : Mapping[str, Unit | CompositeUnit] | None
+        the unit of each column that is not a ``Quantity``, and the order of the
+        variables; by default the columns of ``data`` in their order
+
+    Returns
+    -------
+    the groups as the columns of an array of shape (rows, groups), or of a DataFrame
+    with one column per group if ``data`` is one, and the groups themselves
+    """
+    variables = dict(variables or {})
+    names = list(variables) or list(data.keys())
+    units, columns = {}, []
+    for name in names:
+        column = data[name]
+        if isinstance(column, Quantity):
+            units[name], column = column.unit, column.value
+        else:
+            units[name] = variables[name]
+        columns.append(np.asarray(column, dtype=float))
+    groups = pi_groups(units)
+    result = np.empty((len(columns[0]) if columns else 0, len(groups)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for j, g in enumerate(groups):
+            result[:, j] = g.factor
+            for name, e in g.exponents.items():
+                result[:, j] *= columns[names.index(name)] ** e
+    if hasattr(data, "columns") and hasattr(data, "index"):
+        result = type(data)(result, index=data.index, columns=[str(g) for g in groups])
+    return result, groups
@@ -0,0 +1,179 @@
+"""Chunked, parallel evaluation of unit-bearing expressions over large arrays.
+
+``evaluate(fn, **inputs)`` traces ``fn`` once with ``cubit.compile``, so all unit
+checks and conversions happen while the expression graph is built, before any data
+is touched. The inputs are then split into blocks along their first axis and the
+fused numeric kernel runs block by block on a thread or process pool. At most a few
+blocks per worker are in flight, so memory stays bounded by the block size even for
+memory-mapped inputs and outputs far larger than RAM.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from .memmap import QuantityMemmap
+from .system import CompositeUnit, Quantity, Unit
+from .trace import compile  # noqa: A004
+
+_IN_FLIGHT_PER_WORKER = 2
+
+
+class _FileBlock(NamedTuple):
+    # rows [start, stop) of a memory-mapped file, opened by the worker itself
+    path: Path
+    dtype: str
+    shape: tuple[int, ...]
+    start: int
+    stop: int
+
+    def read(self) -> np.ndarray:
+        return np.memmap(self.path, dtype=self.dtype, mode="r", shape=self.shape)[self.start : self.stop]
+
+
+# kernels rebuilt in a worker process, keyed on their source and a digest of their
+# constants, which may be unhashable arrays. A worker lives as long as one evaluate call.
+_WORKER_KERNELS: dict[tuple[str, bytes], Callable] = {}
+
+
+def _constants_digest(constants: tuple) -> bytes:
+    return hashlib.blake2b(pickle.dumps(constants), digest_size=16).digest()
+
+
+def _evaluate_block(source: str, constants: tuple, digest: bytes, block: dict) -> np.ndarray:
+    # runs in a worker process, where kernels are rebuilt from their source once
+    if (kernel := _WORKER_KERNELS.get((source, digest))) is None:
+        namespace = {f"c{i}": c for i, c in enumerate(constants)}
+        exec(source, namespace)  # noqa: S102
+        kernel = _WORKER_KERNELS[(source, digest)] = namespace["kernel"]
+    return np.asarray(kernel(**{k: v.read() if isinstance(v, _FileBlock) else v for k, v in block.items()}))
+
+
+_OPTIONS = frozenset({"output_unit", "block_size", "workers", "processes", "out"})
+
+
+def _check_input_names(fn: Callable) -> None:
+    # an input named like an option of evaluate would be taken as that option
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return
+    if colliding := sorted(_OPTIONS & parameters.keys()):
+        msg = (
+            f"the inputs {', '.join(colliding)} of {getattr(fn, '__qualname__', fn)!r} have the names "
+            "of options of evaluate, rename them"
+        )
+        raise TypeError(msg)
+
+
+def _length(inputs: dict[str, Quantity | QuantityMemmap]) -> int:
+    lengths = {len(x) if isinstance(x, QuantityMemmap) else len(x.value) for x in inputs.values() if _is_array(x)}
+    if len(lengths) != 1:
+        msg = "array inputs must have the same, non-zero number of rows" if lengths else "no array inputs"
+        raise ValueError(msg)
+    return lengths.pop()
+
+
+def _is_array(x: Quantity | QuantityMemmap) -> bool:
+    return isinstance(x, QuantityMemmap) or np.ndim(x.value) > 0
+
+
+def _block(x: Quantity | QuantityMemmap, start: int, stop: int, *, processes: bool):
+    if not _is_array(x):
+        return x.value
+    if isinstance(x, QuantityMemmap):
+        if processes and x.path is not None:
+            return _FileBlock(x.path, x.dtype.str, x.shape, start, stop)
+        return np.asarray(x.data[start:stop])
+    return x.value[start:stop]
+
+
+def evaluate(
+    fn: Callable[..., Quantity],
+    /,
+    output_unit: Unit | CompositeUnit | None = None,
+    *,
+    block_size: int = 1 << 18,
+    workers: int | None = None,
+    processes: bool = False,
+    out: QuantityMemmap | None = None,
+    **inputs: Quantity | QuantityMemmap,
+) -> Quantity | QuantityMemmap:
+    """Evaluate ``fn`` on large array quantities, block by block and in parallel.
+
+    Parameters
+    ----------
+    fn : Callable[..., Quantity]
+        unit-bearing function of the keyword arguments in ``inputs``, see ``cubit.compile``
+    output_unit : Unit | CompositeUnit | None
+        unit of the result, by default the simplified unit ``fn`` produces
+    block_size : int
+        number of rows along the first axis evaluated per task
+    workers : int | None
+        number of threads or processes, ``os.cpu_count()`` by default. With one worker
+        the blocks are evaluated in the calling thread.
+    processes : bool
+        use a process pool instead of threads. Memory-mapped inputs are then opened by
+        each worker and only block bounds are sent to it.
+    out : QuantityMemmap | None
+        memory-mapped array the result is written to, in its unit. By default the result
+        is returned as an in-memory ``Quantity``.
+    inputs : Quantity | QuantityMemmap
+        array inputs, which must share their first dimension, and scalar constants. Their
+        names must differ from the options above, which ``fn`` may not take as parameters.
+
+    Example
+    -------
+    ppm = evaluate(lambda field: (larmor(field) - reference) / reference, field=QuantityMemmap.open(path))
+    """
+    _check_input_names(fn)
+    if out is not None:
+        # the conversion to the unit of out is folded into the kernel
+        output_unit = out.unit
+    kernel = compile(fn, output_unit, **{k: x.unit for k, x in inputs.items()})
+    n = _length(inputs)
+    workers = workers or os.cpu_count() or 1
+    result = out.data if out is not None else None
+
+    def store(start: int, values: np.ndarray) -> None:
+        nonlocal result
+        if values.ndim == 0:  # the result does not depend on the array inputs
+            values = np.broadcast_to(values, min(block_size, n - start))
+        if result is None:
+            result = np.empty((n, *values.shape[1:]), dtype=values.dtype)
+        result[start : start + len(values)] = values
+
+    starts = range(0, n, block_size)
+    if workers == 1:
+        for start in starts:
+            block = {k: _block(x, start, start + block_size, processes=False) for k, x in inputs.items()}
+            store(start, np.asarray(kernel(**block)))
+    else:
+        pool: Executor = (ProcessPoolExecutor if processes else ThreadPoolExecutor)(max_workers=workers)
+        digest = _constants_digest(kernel.constants) if processes else b""
+        with pool:
+            pending: deque = deque()
+            for start in starts:
+                block = {k: _block(x, start, start + block_size, processes=processes) for k, x in inputs.items()}
+                if processes:
+                    future = pool.submit(_evaluate_block, kernel.source, kernel.constants, digest, block)
+                else:
+                    future = pool.submit(lambda b: np.asarray(kernel(**b)), block)
+                pending.append((start, future))
+                if len(pending) >= _IN_FLIGHT_PER_WORKER * workers:
+                    start, future = pending.popleft()
+                    store(start, future.result())
+            for start, future in pending:
+                store(start, future.result())
+
+    if out is not None:
+        out.flush()
+        return out
+    return Quantity(result, kernel.unit)
@@ -0,0 +1,114 @@
+"""Readable display of quantity arrays with an automatically chosen prefix per value.
+
+``format_quantities`` picks the SI prefix, or the IEC prefix for data units such as
+bytes, that brings each value into ``[1, 1000)`` (``[1, 1024)`` for IEC), using
+vectorized logarithms over the whole array. Only the final number-to-text conversion
+runs per element. The unit-symbol fragments, e.g. ``" kHz"``, are cached per unit.
+"""
+import functools
+from itertools import repeat
+from operator import add
+
+import numpy as np
+
+from . import _catalogue
+from .system import COHERENT_UNITS, CompositeUnit, Quantity, _materialize_deferred
+
+# prefix symbols by exponent, 1000**k for SI and 1024**k for IEC
+_SI_PREFIXES = {
+    round(np.log10(factor)) // 3: symbol
+    for symbol, factor in _catalogue.PREFIXES.values()
+    if isinstance(factor, float) and round(np.log10(factor)) % 3 == 0
+}
+_IEC_PREFIXES = {
+    (factor.bit_length() - 1) // 10: symbol
+    for symbol, factor in _catalogue.PREFIXES.values()
+    if isinstance(factor, int)
+}
+# units that do not take prefixes, they are displayed in their base unit instead
+_UNPREFIXED = frozenset({"minute", "hour", "day", "year", "turn"})
+
+
+def _display_unit(unit: CompositeUnit) -> tuple[str, float, bool]:
+    """The symbol values are displayed in, its factor, and whether a prefix can be attached to it."""
+    _materialize_deferred()
+    named = unit.simplify()
+    if named.symbol is not None and named.name not in _UNPREFIXED:
+        return named.symbol, named.factor, True
+    if (coherent := COHERENT_UNITS.get(unit.signature)) is not None:
+        return coherent.symbol, coherent.factor, True
+    # a prefix on the first base unit is only unambiguous if it has power 1, e.g. km s^-1
+    components = sorted(unit.signature, key=lambda c: (c[1] != 1, str(c[0])))
+    symbol = " ".join(f"{u}" if p == 1 else f"{u}^{p}" for u, p in components)
+    return symbol, 1, bool(components) and components[0][1] == 1
+
+
+@functools.cache
+def _suffixes(symbol: str, *, binary: bool, prefixed: bool) -> tuple[np.ndarray, int]:
+    """Unit-symbol fragments per prefix exponent, and the exponent of the first fragment."""
+    prefixes = _IEC_PREFIXES if binary else _SI_PREFIXES
+    if not prefixed:
+        return np.array([f" {symbol}".rstrip()], dtype=object), 0
+    low, high = min(prefixes.keys() | {0}), max(prefixes)
+    fragments = [f" {prefixes.get(k, '')}{symbol}".rstrip() for k in range(low, high + 1)]
+    return np.array(fragments, dtype=object), low
+
+
+def format_quantities(
+    quantity: Quantity,
+    precision: int = 3,
+    binary: bool | None = None,
+) -> list[str]:
+    """Format each value of an array quantity with its own readable prefix.
+
+    Parameters
+    ----------
+    quantity : Quantity
+        quantity with an array (or scalar) value
+    precision : int
+        number of significant digits
+    binary : bool | None
+        use IEC prefixes (kibi, mebi, ...). By default they are used for data units such
+        as ``byte`` and SI prefixes otherwise.
+
+    Example
+    -------
+    >>> format_quantities(np.array([1500, 0.002, 4.2e7]) * units.hertz)
+    ['1.5 kHz', '2 mHz', '42 MHz']
+    """
+    symbol, unit_factor, prefixed = _display_unit(quantity.unit)
+    if binary is None:
+        binary = any(u.referent == "bit" for u in quantity.unit.component_units)
+    values = np.asarray(quantity.value, dtype=float).reshape(-1) * (quantity.unit.factor / unit_factor)
+    suffixes, low = _suffixes(symbol, binary=binary, prefixed=prefixed)
+    high = low + len(suffixes) - 1
+
+    magnitude = np.abs(values)
+    finite = np.isfinite(magnitude) & (magnitude > 0)
+    base = 1024.0 if binary else 1000.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponent = np.where(finite, np.floor(np.log(magnitude) / np.log(base)), 0)
+        exponent = np.clip(exponent, max(low, 0) if binary else low, high).astype(int)
+        scaled = values / base**exponent
+        # values that would need four integer digits at this precision, e.g. 999.96 or 1023,
+        # move to the next prefix
+        rounds_up = np.abs(_round_significant(scaled, precision)) >= 1000
+        bump = rounds_up & (exponent < high)
+        exponent += bump
+        scaled = np.where(bump, values / base**exponent, scaled)
+
+    spec = f".{precision}g"
+    numbers = map(format, scaled.tolist(), repeat(spec))
+    return list(map(add, numbers, suffixes[exponent - low].tolist()))
+
+
+def _round_significant(x: np.ndarray, precision: int) -> np.ndarray:
+    magnitude = np.abs(x)
+    digits = precision - 1 - np.floor(np.log10(np.where(magnitude > 0, magnitude, 1)))
+    scale = 10.0**digits
+    return np.round(x * scale) / scale
+
+
+def format_quantity(quantity: Quantity, precision: int = 3, binary: bool | None = None) -> str:
+    """Format a scalar quantity with a readable prefix, see ``format_quantities``."""
+    return format_quantities(quantity, precision, binary)[0]
@@ -0,0 +1,347 @@
+"""Molecular formulas and their isotope patterns.
+
+``isotopic_distribution`` computes the isotopic envelope of a formula on a mass grid
+of width ``resolution``. Each element contributes its natural abundance spectrum,
+and the spectrum of the molecule is the convolution of the element spectra, one
+per atom. The convolution is done in the Fourier domain, where raising an element's
+transformed spectrum to the power of its atom count replaces enumerating isotope
+combinations. The abundance-weighted mass offsets are propagated alongside, so each
+peak is reported at the exact centroid of the combinations that fall into its bin.
+
+``monoisotopic_masses`` and ``average_masses`` stack parsed formulas into a sparse
+composition matrix, one row per formula and one column per element or labelled
+isotope, and compute all masses with a single matrix-vector product.
+"""
+import functools
+import itertools
+import math
+import re
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
+
+from .reduce import values_in
+from .system import Quantity
+from .units import dalton
+
+Composition = dict[str | tuple[str, int], int]
+
+# an element, a labelled isotope or a parenthesis, followed by an optional count
+_TOKEN = re.compile(
+    r"(?:\[(?P<A>\d+)(?P<isotope>[A-Z][a-z]?)\]|(?P<element>[A-Z][a-z]?)|(?P<open>\()|\))(?P<count>\d*)"
+)
+_FLAT = re.compile(r"(?:[A-Z][a-z]?\d*)+")
+_ELEMENT = re.compile(r"([A-Z][a-z]?)(\d*)")
+
+
+def parse_formula(formula: str) -> Composition:
+    """Parse a molecular formula into atom counts.
+
+    Elements are written by their symbol, specific isotopes as ``[13C]``, and groups in
+    parentheses may carry a count, e.g. ``Ca(OH)2``. Elements in their natural isotopic
+    composition are keyed by symbol, specific isotopes by ``(symbol, mass number)``.
+    Parsed formulas are memoized.
+    """
+    return dict(_parse(formula))
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _parse(formula: str) -> tuple[tuple[str | tuple[str, int], int], ...]:
+    counts: dict = {}
+    if _FLAT.fullmatch(formula):
+        # fast path for the common case without groups or labelled isotopes
+        for symbol, n in _ELEMENT.findall(formula):
+            counts[symbol] = counts.get(symbol, 0) + (int(n) if n else 1)
+        return tuple((k, v) for k, v in counts.items() if v)
+
+    stack = [counts]
+    position = 0
+    for match in _TOKEN.finditer(formula):
+        if match.start() != position:
+            break
+        position = match.end()
+        n = int(match["count"]) if match["count"] else 1
+        if match["open"]:
+            if match["count"]:
+                break
+            stack.append({})
+            continue
+        if match["element"] or match["isotope"]:
+            group = {match["element"] or (match["isotope"], int(match["A"])): 1}
+        elif len(stack) > 1:
+            group = stack.pop()
+        else:
+            break
+        for k, v in group.items():
+            stack[-1][k] = stack[-1].get(k, 0) + v * n
+    if position != len(formula) or len(stack) != 1 or not formula:
+        msg = f"invalid molecular formula {formula!r}"
+        raise ValueError(msg)
+    return tuple((k, v) for k, v in counts.items() if v)
+
+
+class IsotopicDistribution(NamedTuple):
+    """The isotope peaks of a molecule, in ascending order of mass."""
+
+    mass: Quantity  # peak centroids, in dalton
+    abundance: np.ndarray  # fraction of molecules in each peak
+
+
+def _resolution(resolution: float | Quantity) -> float:
+    if isinstance(resolution, Quantity):
+        resolution = float(values_in(resolution, dalton)[0])
+    if not resolution > 0:
+        msg = "resolution must be positive"
+        raise ValueError(msg)
+    return resolution
+
+
+@functools.cache
+def _isotope_mass(symbol: str, mass_number: int) -> float:
+    from .physical_data import ISOTOPES
+
+    try:
+        isotope = ISOTOPES[(symbol, mass_number)]
+    except KeyError:
+        msg = f"unknown isotope {mass_number}{symbol}"
+        raise ValueError(msg) from None
+    return isotope.monoisotopic_mass.value
+
+
+@functools.cache
+def _element_spectrum(symbol: str, resolution: float) -> tuple[float, np.ndarray, np.ndarray]:
+    """The natural isotope spectrum of an element on the mass grid.
+
+    Returns the mass of the lightest isotope, and per bin offset from it the abundance
+    and the abundance-weighted exact mass offset.
+    """
+    from .physical_data import ISOTOPES
+
+    isotopes = [i for (s, _), i in ISOTOPES.items() if s == symbol and i.natural_abundance > 0]
+    if not isotopes:
+        msg = f"{symbol} has no natural isotopic composition, specify an isotope such as [{symbol}]"
+        raise ValueError(msg)
+    masses = np.array([i.monoisotopic_mass.value for i in isotopes])
+    abundances = np.array([i.natural_abundance for i in isotopes])
+    abundances /= abundances.sum()
+    lightest = masses.min()
+    offsets = masses - lightest
+    bins = np.rint(offsets / resolution).astype(int)
+    abundance = np.bincount(bins, weights=abundances)
+    weighted_offset = np.bincount(bins, weights=abundances * offsets)
+    return lightest, abundance, weighted_offset
+
+
+@functools.cache
+def _element_transform(symbol: str, resolution: float, size: int) -> tuple[np.ndarray, np.ndarray]:
+    _, abundance, weighted_offset = _element_spectrum(symbol, resolution)
+    return np.fft.rfft(abundance, size), np.fft.rfft(weighted_offset, size)
+
+
+def _span(symbol: str, resolution: float) -> int:
+    # the number of bins between the lightest and heaviest isotope of an element
+    return len(_element_spectrum(symbol, resolution)[1]) - 1
+
+
+def _lightest_mass(key: str | tuple[str, int], resolution: float) -> float:
+    return _element_spectrum(key, resolution)[0] if isinstance(key, str) else _isotope_mass(*key)
+
+
+def _power(z: np.ndarray, n: np.ndarray) -> np.ndarray:
+    # z**n in polar form, which is exact for n = 0 and does not overflow for z = 0
+    return np.abs(z) ** n * np.exp(1j * n * np.angle(z))
+
+
+def _envelopes(
+    compositions: list[Composition], resolution: float, threshold: float
+) -> list[IsotopicDistribution]:
+    """Isotope patterns of compositions that share a grid size, in one vectorized pass."""
+    symbols = sorted({k for c in compositions for k in c if isinstance(k, str)})
+    counts = np.array([[c.get(s, 0) for s in symbols] for c in compositions], dtype=float)
+    base_mass = np.array([sum(n * _lightest_mass(k, resolution) for k, n in c.items()) for c in compositions])
+    spans = np.array([_span(s, resolution) for s in symbols], dtype=int)
+    size = 1 << int((counts @ spans).max()).bit_length() if symbols else 1
+
+    if symbols:
+        transforms = [_element_transform(s, resolution, size) for s in symbols]
+        p = np.stack([t[0] for t in transforms])[None]  # (1, elements, frequencies)
+        q = np.stack([t[1] for t in transforms])[None]
+        n = counts[:, :, None]  # (formulas, elements, 1)
+        powers = _power(p, n)
+        # product of the other elements' powers, from exclusive prefix and suffix products
+        ones = np.ones_like(powers[:, :1])
+        prefix = np.cumprod(np.concatenate([ones, powers[:, :-1]], axis=1), axis=1)
+        suffix = np.cumprod(np.concatenate([ones, powers[:, :0:-1]], axis=1), axis=1)[:, ::-1]
+        spectrum = np.prod(powers, axis=1)
+        weighted = np.sum(n * q * _power(p, np.maximum(n - 1, 0)) * prefix * suffix, axis=1)
+        abundance = np.fft.irfft(spectrum, size, axis=-1)
+        weighted_offset = np.fft.irfft(weighted, size, axis=-1)
+    else:
+        abundance = np.ones((len(compositions), 1))
+        weighted_offset = np.zeros((len(compositions), 1))
+
+    results = []
+    for i in range(len(compositions)):
+        (peaks,) = np.nonzero(abundance[i] > threshold)
+        a = abundance[i, peaks]
+        mass = base_mass[i] + weighted_offset[i, peaks] / a
+        results.append(IsotopicDistribution(Quantity(mass, dalton), a))
+    return results
+
+
+def isotopic_distributions(
+    formulas: list[str | Composition], resolution: float | Quantity = 1.0, threshold: float = 1e-6
+) -> list[IsotopicDistribution]:
+    """Isotope patterns of many formulas, see ``isotopic_distribution``.
+
+    Formulas of similar size share their FFT grid, so their element spectra are
+    transformed once and their envelopes are computed in a single vectorized pass.
+    """
+    resolution = _resolution(resolution)
+    compositions = [parse_formula(f) if isinstance(f, str) else f for f in formulas]
+    groups: dict[int, list[int]] = {}
+    for i, c in enumerate(compositions):
+        span = sum(n * _span(k, resolution) for k, n in c.items() if isinstance(k, str))
+        groups.setdefault(span.bit_length(), []).append(i)
+    results: list[IsotopicDistribution | None] = [None] * len(compositions)
+    for indices in groups.values():
+        envelopes = _envelopes([compositions[i] for i in indices], resolution, threshold)
+        for i, result in zip(indices, envelopes, strict=True):
+            results[i] = result
+    return results
+
+
+def isotopic_distribution(
+    formula: str | Composition, resolution: float | Quantity = 1.0, threshold: float = 1e-6
+) -> IsotopicDistribution:
+    """Isotope pattern of a molecule.
+
+    Parameters
+    ----------
+    formula : str | Composition
+        molecular formula such as ``C6H12O6`` or ``[13C]H4``, or its parsed composition
+    resolution : float | Quantity
+        width of the mass bins, in dalton if a plain number. Isotope combinations whose
+        masses fall into the same bin are reported as one peak at their centroid.
+    threshold : float
+        peaks with a smaller abundance are dropped
+
+    Example
+    -------
+    >>> isotopic_distribution("C2H6O").abundance.round(4)
+    array([0.9757, 0.0221, 0.0021, 0.    ])
+    """
+    return isotopic_distributions([formula], resolution, threshold)[0]
+
+
+class CompositionMatrix:
+    """Atom counts of many formulas as a sparse matrix in compressed sparse row layout.
+
+    Row ``i`` holds the counts of formula ``i``. Columns are the elements in their natural
+    isotopic composition followed by individual isotopes, see ``composition_columns``.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, n_columns: int):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = (len(indptr) - 1, n_columns)
+
+    def __matmul__(self, vector: np.ndarray) -> np.ndarray:
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return np.bincount(rows, weights=self.data * vector[self.indices], minlength=self.shape[0])
+
+    def toarray(self) -> np.ndarray:
+        dense = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        np.add.at(dense, (rows, self.indices), self.data)
+        return dense
+
+
+@functools.cache
+def composition_columns() -> dict[str | tuple[str, int], int]:
+    """The column of each element and isotope in a ``CompositionMatrix``."""
+    from .physical_data import ELEMENTS, ISOTOPES
+
+    # elements with no known isotopes are listed with a NaN mass number
+    keys = [*ELEMENTS, *((symbol, int(a)) for symbol, a in ISOTOPES if not math.isnan(a))]
+    return {k: i for i, k in enumerate(keys)}
+
+
+@functools.cache
+def _column_masses() -> tuple[np.ndarray, np.ndarray]:
+    # monoisotopic and average mass in dalton per column, NaN for elements without a natural composition
+    from .physical_data import ISOTOPES
+
+    columns = composition_columns()
+    monoisotopic = np.full(len(columns), np.nan)
+    average = np.full(len(columns), np.nan)
+    by_element: dict[str, list] = {}
+    for (symbol, a), isotope in ISOTOPES.items():
+        if math.isnan(a):
+            continue
+        mass = isotope.monoisotopic_mass.value
+        monoisotopic[columns[(symbol, int(a))]] = average[columns[(symbol, int(a))]] = mass
+        if isotope.natural_abundance > 0:
+            by_element.setdefault(symbol, []).append((isotope.natural_abundance, mass))
+    for symbol, isotopes in by_element.items():
+        abundances, masses = np.array(isotopes).T
+        # the monoisotopic mass of an element is that of its most abundant isotope
+        monoisotopic[columns[symbol]] = masses[np.argmax(abundances)]
+        average[columns[symbol]] = abundances @ masses / abundances.sum()
+    return monoisotopic, average
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _composition_vector(formula: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    columns = composition_columns()
+    parsed = _parse(formula)
+    if not parsed:
+        # e.g. "C0", which has no atoms
+        return (), ()
+    keys, counts = zip(*parsed, strict=True)
+    try:
+        return tuple(columns[k] for k in keys), counts
+    except KeyError as e:
+        msg = f"unknown element or isotope {e.args[0]!r} in {formula!r}"
+        raise ValueError(msg) from None
+
+
+def composition_matrix(formulas: Iterable[str]) -> CompositionMatrix:
+    """Stack the memoized composition vectors of ``formulas`` into a sparse matrix."""
+    vectors = list(map(_composition_vector, formulas))
+    lengths = np.fromiter((len(i) for i, _ in vectors), dtype=np.intp, count=len(vectors))
+    indptr = np.zeros(len(vectors) + 1, dtype=np.intp)
+    np.cumsum(lengths, out=indptr[1:])
+    chain = itertools.chain.from_iterable
+    indices = np.fromiter(chain(i for i, _ in vectors), dtype=np.intp, count=indptr[-1])
+    data = np.fromiter(chain(n for _, n in vectors), dtype=float, count=indptr[-1])
+    return CompositionMatrix(indptr, indices, data, len(composition_columns()))
+
+
+def _masses(formulas: Iterable[str] | CompositionMatrix, column_masses: np.ndarray) -> Quantity:
+    if not isinstance(formulas, CompositionMatrix):
+        formulas = list(formulas)
+    matrix = formulas if isinstance(formulas, CompositionMatrix) else composition_matrix(formulas)
+    masses = matrix @ column_masses
+    if np.isnan(masses).any():
+        row = int(np.argmax(np.isnan(masses)))
+        formula = f"{formulas[row]!r}" if isinstance(formulas, list) else f"row {row}"
+        msg = f"{formula} contains an element without a natural isotopic composition, specify its isotopes"
+        raise ValueError(msg)
+    return Quantity(masses, dalton)
+
+
+def monoisotopic_masses(formulas: Iterable[str] | CompositionMatrix) -> Quantity:
+    """Monoisotopic masses of ``formulas``, as an array in dalton.
+
+    Elements contribute their most abundant isotope, labelled isotopes such as ``[13C]``
+    their own mass.
+    """
+    return _masses(formulas, _column_masses()[0])
+
+
+def average_masses(formulas: Iterable[str] | CompositionMatrix) -> Quantity:
+    """Average masses of ``formulas`` over the natural isotopic composition, as an array in dalton."""
+    return _masses(formulas, _column_masses()[1])
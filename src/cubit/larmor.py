@@ -0,0 +1,166 @@
+"""Reverse lookup of nuclear states by their Larmor frequency in a given magnetic field.
+
+Every row of ``physical_data.NUCLEAR_MOMENTS`` is a ``NuclearState``, so isomers and
+excited states are included alongside the ground states that ``ISOTOPES`` keeps. The
+gyromagnetic ratios of all states are computed once as one array. A ``LarmorIndex``
+sorts the Larmor frequencies |gamma B| of all states at one field strength, and
+answers batches of window queries with two vectorized binary searches. ``larmor_index``
+keeps the indexes of the most recently used field strengths.
+"""
+import functools
+import math
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+from . import physical_data
+from .memo import memoize
+from .physical_data import PLANCK_CONSTANT, Isotope
+from .system import Quantity
+from .units import hertz, joule, second, tesla
+
+FIELD_CACHE_SIZE = 16  # field strengths whose indexes larmor_index keeps
+
+
+class NuclearState(NamedTuple):
+    """A nuclear ground or excited state with a magnetic moment."""
+
+    isotope: Isotope
+    energy_level_keV: float  # excitation energy, 0 for ground states, NaN if not known as a number
+    half_life_s: float  # NaN if not known as a number
+    spin: float
+    gyromagnetic_ratio: float  # in Hz T^-1
+
+    def __repr__(self):
+        level = "" if self.energy_level_keV == 0 else f" at {self.energy_level_keV:g} keV"
+        nucleus = f"{self.isotope.element.symbol}-{self.isotope.mass_number:g}"
+        return f"<NuclearState: {nucleus}{level}, I={self.spin:g}>"
+
+
+class LarmorMatches(NamedTuple):
+    """All (observation, state) pairs within the window, as parallel arrays."""
+
+    observation: np.ndarray  # index into the observed frequencies
+    state: np.ndarray  # index into LarmorIndex.states
+    offset: np.ndarray  # Larmor frequency of the state - observed frequency, in Hz
+
+
+@functools.cache
+def nuclear_states() -> tuple[NuclearState, ...]:
+    """All states in the nuclear moment table with a non-zero magnetic moment."""
+    rows = [r for r in physical_data.NUCLEAR_MOMENTS if r["spin"] != 0]
+    moments = np.array([r["magnetic_dipole_moment_J_T"] for r in rows])
+    spins = np.array([r["spin"] for r in rows])
+    h = PLANCK_CONSTANT.base_value / (joule * second).factor  # in J s
+    gammas = moments / spins / h
+    isotopes = physical_data.ISOTOPES
+    return tuple(
+        NuclearState(isotopes[(r["symbol"], r["A"])], r["energy_level_keV"], r["half_life_s"], r["spin"], g)
+        for r, g in zip(rows, gammas.tolist(), strict=True)
+        if math.isfinite(g) and g != 0
+    )
+
+
+def _tesla(field: Quantity) -> float:
+    if not isinstance(field, Quantity) or field.unit.signature != tesla.signature:
+        msg = "the field must be a magnetic flux density quantity"
+        raise TypeError(msg)
+    return float(field.base_value / tesla.factor)
+
+
+def _hertz(frequencies) -> np.ndarray:
+    # observed frequencies in Hz or s^-1, plain numbers in Hz
+    if not isinstance(frequencies, Quantity):
+        return np.atleast_1d(np.asarray(frequencies, dtype=float))
+    if frequencies.unit.signature not in (hertz.signature, (second**-1).signature):
+        msg = "the observed frequencies must be frequency quantities"
+        raise TypeError(msg)
+    return np.atleast_1d(np.asarray(frequencies.base_value, dtype=float))
+
+
+class LarmorIndex:
+    """The Larmor frequencies of all nuclear states at one field strength, sorted once."""
+
+    def __init__(self, field: Quantity, states: Sequence[NuclearState] | None = None):
+        self.field = field
+        self.states = nuclear_states() if states is None else tuple(states)
+        gammas = np.fromiter((s.gyromagnetic_ratio for s in self.states), dtype=float, count=len(self.states))
+        frequencies = np.abs(gammas) * _tesla(field)
+        self.order = np.argsort(frequencies, kind="stable")
+        self.sorted_frequencies = frequencies[self.order]
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    @property
+    def frequencies(self) -> Quantity:
+        """The Larmor frequency of each state, in the order of ``states``."""
+        frequencies = np.empty_like(self.sorted_frequencies)
+        frequencies[self.order] = self.sorted_frequencies
+        return Quantity(frequencies, hertz)
+
+    def match_pairs(
+        self,
+        observed,
+        *,
+        window: Quantity | None = None,
+        ppm: float | None = None,
+    ) -> LarmorMatches:
+        """Vectorized matching of observed frequencies, within ``window`` (a frequency) or ``ppm``.
+
+        Plain numbers are taken to be in hertz.
+        """
+        observed = _hertz(observed)
+        if (window is None) == (ppm is None):
+            msg = "give exactly one of window and ppm"
+            raise ValueError(msg)
+        half_width = _hertz(window)[0] if window is not None else np.abs(observed) * ppm * 1e-6
+        starts = np.searchsorted(self.sorted_frequencies, observed - half_width, side="left")
+        stops = np.searchsorted(self.sorted_frequencies, observed + half_width, side="right")
+        counts = stops - starts
+        observation = np.repeat(np.arange(len(counts)), counts)
+        # positions in the sorted order: the start of each window plus the offset within it
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(starts, counts) + offsets
+        offset = self.sorted_frequencies[positions] - observed[observation]
+        return LarmorMatches(observation, self.order[positions], offset)
+
+    def match(
+        self,
+        observed,
+        *,
+        window: Quantity | None = None,
+        ppm: float | None = None,
+    ) -> list[list[NuclearState]]:
+        """The states within the window of each observed frequency, nearest first."""
+        matches = self.match_pairs(observed, window=window, ppm=ppm)
+        result: list[list[NuclearState]] = [[] for _ in range(len(_hertz(observed)))]
+        for i in np.lexsort((np.abs(matches.offset), matches.observation)).tolist():
+            result[matches.observation[i]].append(self.states[matches.state[i]])
+        return result
+
+
+@memoize(maxsize=FIELD_CACHE_SIZE)
+def larmor_index(field: Quantity) -> LarmorIndex:
+    """The ``LarmorIndex`` of all nuclear states at ``field``, cached per field strength."""
+    return LarmorIndex(field)
+
+
+def match_frequencies(
+    observed,
+    field: Quantity,
+    *,
+    window: Quantity | None = None,
+    ppm: float | None = None,
+) -> list[list[NuclearState]]:
+    """The nuclear states resonating within the window of each observed frequency at ``field``.
+
+    Plain numbers are taken to be in hertz.
+
+    Example
+    -------
+    >>> match_frequencies(np.array([600.3e6, 150.9e6]) * units.hertz, 14.1 * units.tesla, ppm=300)
+    [[<NuclearState: H-1, I=0.5>], [<NuclearState: Ho-155, I=2.5>, <NuclearState: Br-79, I=1.5>]]
+    """
+    return larmor_index(field).match(observed, window=window, ppm=ppm)
@@ -0,0 +1,106 @@
+"""Matching of observed masses to isotopes or formulas within a ppm tolerance.
+
+A ``MassIndex`` sorts the candidate masses once. Each batch of observations is then
+matched with two vectorized binary searches for the bounds of the tolerance windows,
+which turns O(N M) scanning into O((N + M) log M).
+"""
+import functools
+import math
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+from .formula import monoisotopic_masses
+from .sorting import SortedQuantities
+from .system import Quantity
+from .units import dalton
+
+
+class MassMatches(NamedTuple):
+    """All (observation, candidate) pairs within the tolerance, as parallel arrays."""
+
+    observation: np.ndarray  # index into the observed masses
+    candidate: np.ndarray  # index into the labels of the MassIndex
+    error_ppm: np.ndarray  # (candidate - observed) / observed, in ppm
+
+
+class MassIndex:
+    """A sorted index of candidate masses, e.g. isotopes or molecular formulas.
+
+    ``labels`` name the candidates, in the order of ``masses``.
+    """
+
+    def __init__(self, masses: Quantity, labels: Sequence):
+        if len(labels) != len(masses.value):
+            msg = "there must be one label per mass"
+            raise ValueError(msg)
+        self.labels = labels
+        self.masses = masses
+        self._sorted = SortedQuantities(masses)
+
+    @classmethod
+    def isotopes(cls) -> "MassIndex":
+        """An index of the monoisotopic masses of all isotopes in ``physical_data.ISOTOPES``."""
+        from .physical_data import ISOTOPES
+
+        isotopes = [i for (_, a), i in ISOTOPES.items() if not math.isnan(a)]
+        masses = np.fromiter((i.monoisotopic_mass.value for i in isotopes), dtype=float, count=len(isotopes))
+        return cls(Quantity(masses, dalton), isotopes)
+
+    @classmethod
+    def formulas(cls, formulas: Sequence[str]) -> "MassIndex":
+        """An index of the monoisotopic masses of molecular formulas."""
+        return cls(monoisotopic_masses(formulas), formulas)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def match_pairs(self, observed: Quantity | np.ndarray, ppm: float = 5.0) -> MassMatches:
+        """Vectorized matching, see ``MassMatches``. Plain numbers are taken to be in dalton."""
+        observed = _observed(observed)
+        tolerance = ppm * 1e-6
+        starts = self._sorted.searchsorted(observed * (1 - tolerance), side="left")
+        stops = self._sorted.searchsorted(observed * (1 + tolerance), side="right")
+        counts = stops - starts
+        observation = np.repeat(np.arange(len(counts)), counts)
+        # positions in the sorted order: the start of each window plus the offset within it
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(starts, counts) + offsets
+        observed_base = np.asarray(observed.base_value, dtype=float)[observation]
+        error_ppm = (self._sorted.values[positions] - observed_base) / observed_base * 1e6
+        return MassMatches(observation, self._sorted.order[positions], error_ppm)
+
+    def match(self, observed: Quantity | np.ndarray, ppm: float = 5.0) -> list[list]:
+        """The labels of all candidates within ``ppm`` of each observed mass, nearest first."""
+        observed = _observed(observed)
+        matches = self.match_pairs(observed, ppm)
+        result: list[list] = [[] for _ in range(len(observed.value))]
+        for i in np.lexsort((np.abs(matches.error_ppm), matches.observation)).tolist():
+            result[matches.observation[i]].append(self.labels[matches.candidate[i]])
+        return result
+
+
+def _observed(observed: Quantity | np.ndarray) -> Quantity:
+    # observed masses as a 1-d array quantity, plain numbers in dalton
+    if not isinstance(observed, Quantity):
+        observed = Quantity(observed, dalton)
+    return observed.but(value=np.atleast_1d(np.asarray(observed.value, dtype=float)))
+
+
+@functools.cache
+def _isotope_index() -> MassIndex:
+    return MassIndex.isotopes()
+
+
+def match_masses(observed: Quantity | np.ndarray, ppm: float = 5.0, index: MassIndex | None = None) -> list[list]:
+    """The isotopes (or candidates of ``index``) within ``ppm`` of each observed mass.
+
+    Plain numbers are taken to be in dalton.
+
+    Example
+    -------
+    >>> match_masses(np.array([12.0, 13.00336]) * units.dalton, ppm=1)
+    [[<Isotope: C-12.0>], [<Isotope: C-13.0>]]
+    """
+    return (_isotope_index() if index is None else index).match(observed, ppm)
@@ -0,0 +1,164 @@
+"""Quantity arrays stored on disk and memory-mapped with ``np.memmap``.
+
+The raw values are kept in a flat binary file. A small JSON sidecar next to it,
+``<path>.json``, records the unit as a canonical unit string (see
+``CompositeUnit.canonical``), the storage dtype and the shape. Slicing returns
+memory-mapped views without reading or copying data. Values are only read, and
+converted to a requested unit, when a slice is materialized, so arrays much larger
+than memory can be processed chunk by chunk with constant resident memory.
+"""
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from . import units  # noqa: F401  creates the base units that unit strings refer to
+from .system import CompositeUnit, Quantity, Unit
+
+STORAGE_DTYPES = (np.dtype("float32"), np.dtype("float64"))
+_FORMAT_VERSION = 1
+
+
+def _sidecar(path: str | os.PathLike) -> Path:
+    return Path(f"{os.fspath(path)}.json")
+
+
+def _composite(unit: Unit | CompositeUnit) -> CompositeUnit:
+    return unit if isinstance(unit, CompositeUnit) else Quantity(1, unit).unit
+
+
+def _storage_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in STORAGE_DTYPES:
+        msg = f"storage dtype must be float32 or float64, not {dtype}"
+        raise ValueError(msg)
+    return dtype
+
+
+class QuantityMemmap:
+    """A memory-mapped array of values in a single unit.
+
+    Use ``create``, ``save`` or ``open`` rather than the constructor. Indexing returns
+    another ``QuantityMemmap`` viewing the same file. ``read`` materializes the values
+    of a view as an in-memory ``Quantity``.
+    """
+
+    def __init__(
+        self,
+        data: np.memmap,
+        unit: CompositeUnit,
+        read_unit: CompositeUnit | None = None,
+        path: Path | None = None,
+    ):
+        self.data = data
+        self.unit = unit  # the unit the values are stored in
+        self.read_unit = read_unit or unit  # the unit they are converted to when read
+        self.path = path  # the mapped file, if this maps all of it rather than a slice
+
+    @classmethod
+    def create(
+        cls,
+        path: str | os.PathLike,
+        shape: int | tuple[int, ...],
+        unit: Unit | CompositeUnit,
+        dtype="float64",
+    ) -> "QuantityMemmap":
+        """Create a zero-filled file of ``shape`` for values in ``unit``, and its sidecar."""
+        unit = _composite(unit)
+        dtype = _storage_dtype(dtype)
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        header = {"version": _FORMAT_VERSION, "unit": unit.canonical, "dtype": dtype.str, "shape": shape}
+        _sidecar(path).write_text(json.dumps(header) + "\n")
+        return cls(np.memmap(path, dtype=dtype, mode="w+", shape=shape), unit, path=Path(path))
+
+    @classmethod
+    def save(
+        cls,
+        path: str | os.PathLike,
+        quantity: Quantity,
+        dtype="float64",
+        chunk_size: int = 1 << 20,
+    ) -> "QuantityMemmap":
+        """Write an in-memory array quantity to ``path``, in its own unit."""
+        values = np.asarray(quantity.value)
+        array = cls.create(path, values.shape, quantity.unit, dtype=dtype)
+        flat = array.data.reshape(-1)
+        for start in range(0, values.size, chunk_size):
+            flat[start : start + chunk_size] = values.reshape(-1)[start : start + chunk_size]
+        array.flush()
+        return array
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, mode: str = "r") -> "QuantityMemmap":
+        """Map an existing file read-only, or for updates with ``mode="r+"``."""
+        header = json.loads(_sidecar(path).read_text())
+        if header.get("version") != _FORMAT_VERSION:
+            msg = f"unsupported quantity memmap version {header.get('version')!r} in {_sidecar(path)}"
+            raise ValueError(msg)
+        unit = CompositeUnit.from_canonical(header["unit"])
+        data = np.memmap(path, dtype=_storage_dtype(header["dtype"]), mode=mode, shape=tuple(header["shape"]))
+        return cls(data, unit, path=Path(path))
+
+    def __repr__(self):
+        return f"<QuantityMemmap {self.shape} {self.dtype} [{self.unit.simplify()}]>"
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.data.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key) -> "QuantityMemmap":
+        return type(self)(self.data[key], self.unit, self.read_unit)
+
+    def __setitem__(self, key, quantity: Quantity) -> None:
+        self.data[key] = self._values(quantity, self.unit)
+
+    def to(self, unit: Unit | CompositeUnit) -> "QuantityMemmap":
+        """A view whose values are converted to ``unit`` when they are read."""
+        unit = _composite(unit)
+        if unit.signature != self.unit.signature:
+            msg = f"{self.unit} cannot be converted to {unit}"
+            raise TypeError(msg)
+        return type(self)(self.data, self.unit, unit, self.path)
+
+    def _scale(self) -> float:
+        return 1 if self.read_unit.factor == self.unit.factor else self.unit.factor / self.read_unit.factor
+
+    def __array__(self, dtype=None, copy=None):
+        values = np.asarray(self.data)
+        if (scale := self._scale()) != 1:
+            values = values * scale
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def read(self) -> Quantity:
+        """Read the values of this view into memory, in ``read_unit``."""
+        return Quantity(np.array(self), self.read_unit)
+
+    def chunks(self, size: int) -> Iterator[Quantity]:
+        """Read the array in chunks of ``size`` rows along the first axis."""
+        for start in range(0, len(self), size):
+            yield self[start : start + size].read()
+
+    def flush(self) -> None:
+        self.data.flush()
+
+    @staticmethod
+    def _values(quantity: Quantity, unit: CompositeUnit):
+        if not isinstance(quantity, Quantity):
+            msg = "only quantities can be written to a QuantityMemmap"
+            raise TypeError(msg)
+        if quantity.unit.signature != unit.signature:
+            msg = f"{quantity.unit} cannot be converted to {unit}"
+            raise TypeError(msg)
+        if quantity.unit.factor == unit.factor:
+            return quantity.value
+        return np.asarray(quantity.value) * (quantity.unit.factor / unit.factor)
+
@@ -0,0 +1,168 @@
+"""Memoization of functions of quantities, keyed on unit-normalized arguments.
+
+``functools.lru_cache`` keys on ``Quantity.__hash__`` and ``__eq__``, which compare
+values in base units exactly, so ``1.001 km`` and ``1001 m`` are different keys, as
+the conversion to base units rounds them apart. Array values cannot be keys at all.
+``memoize`` instead keys each quantity on the signature of its unit and its rounded
+value in base units, so equivalent calls share one cache entry.
+
+Float base values and float arguments are rounded to about 15 significant digits,
+which absorbs the rounding of unit conversions, e.g. ``1.001 km`` and ``1001 m``. With
+``rel_tol`` they are bucketed on a logarithmic grid of that relative width instead, so
+that nearby arguments also share an entry. Integer and ``Fraction`` arguments are keyed
+exactly. Entries are evicted least recently used beyond ``maxsize``, and after ``ttl``
+seconds if given.
+"""
+import functools
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from fractions import Fraction
+from typing import NamedTuple
+
+from ._base import ArrayLike
+from .system import CompositeUnit, Quantity, Unit, _factor_key
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    evictions: int  # entries dropped because the cache was full or they expired
+
+
+_MANTISSA_BITS = 48  # about 15 significant digits
+
+
+def _bucket(x: float, rel_tol: float | None) -> float | tuple[bool, int]:
+    if x == 0 or not math.isfinite(x):
+        return x
+    if rel_tol is None:
+        mantissa, exponent = math.frexp(x)
+        return math.ldexp(round(mantissa * 2**_MANTISSA_BITS), exponent - _MANTISSA_BITS)
+    return (x > 0, math.floor(math.log(abs(x)) / math.log1p(rel_tol)))
+
+
+def _bucket_array(values, rel_tol: float | None):
+    import numpy as np
+
+    if values.dtype.kind not in "fc":
+        return values
+    if values.dtype.kind == "c":
+        return np.stack([_bucket_array(values.real, rel_tol), _bucket_array(values.imag, rel_tol)])
+    if rel_tol is None:
+        mantissa, exponent = np.frexp(values)
+        return np.ldexp(np.round(mantissa * 2.0**_MANTISSA_BITS), exponent - _MANTISSA_BITS)
+    # zeros and non-finite values are kept as they are, in a separate row
+    exact = (values == 0) | ~np.isfinite(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        buckets = np.sign(values) * (np.floor(np.log(np.abs(values)) / math.log1p(rel_tol)) + 1)
+    return np.stack([np.where(exact, 0, buckets), np.where(exact, values, 0)])
+
+
+def _normalize(arg, rel_tol: float | None):
+    """A hashable key under which equivalent arguments compare equal."""
+    match arg:
+        case Quantity():
+            return Quantity, arg.unit.signature, _normalize(arg.base_value, rel_tol)
+        case CompositeUnit():
+            return CompositeUnit, arg.signature, _factor_key(arg.factor)
+        case Unit():
+            return _normalize(arg.as_composite(), rel_tol)
+        case bool() | int() | Fraction():
+            # exact, rounding through a float would give distinct large ints one key
+            return arg
+        case float():
+            return _bucket(arg, rel_tol)
+        case complex():
+            return complex, _bucket(arg.real, rel_tol), _bucket(arg.imag, rel_tol)
+        case tuple() | list():
+            return type(arg), tuple(_normalize(a, rel_tol) for a in arg)
+        case ArrayLike():
+            import numpy as np
+
+            values = np.asarray(arg)
+            return "array", values.dtype.str, values.shape, _bucket_array(values, rel_tol).tobytes()
+        case _:
+            return arg
+
+
+def memoize(
+    fn: Callable | None = None,
+    /,
+    *,
+    maxsize: int | None = 128,
+    ttl: float | None = None,
+    rel_tol: float | None = None,
+):
+    """Cache the results of ``fn`` under unit-normalized arguments.
+
+    Use as ``@memoize`` or ``@memoize(maxsize=..., ttl=..., rel_tol=...)``.
+
+    Parameters
+    ----------
+    maxsize : int | None
+        maximum number of entries, the least recently used are evicted first; ``None``
+        for no limit
+    ttl : float | None
+        seconds after which an entry expires
+    rel_tol : float | None
+        relative width of the buckets that floats and quantity values are put in, e.g.
+        ``1e-9``. Values within ``rel_tol`` of each other usually share a bucket, but
+        two values close to a bucket boundary can fall on either side of it.
+
+    The wrapped function has ``cache_info()`` and ``cache_clear()``, like
+    ``functools.lru_cache``. A hit returns the result of the first call, which may be
+    expressed in the units of that call's arguments.
+    """
+    if fn is None:
+        return functools.partial(memoize, maxsize=maxsize, ttl=ttl, rel_tol=rel_tol)
+
+    entries: OrderedDict = OrderedDict()  # key -> (expiry, result)
+    lock = threading.Lock()
+    stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = tuple(_normalize(a, rel_tol) for a in args)
+        if kwargs:
+            key += (_KWARGS, *sorted((k, _normalize(v, rel_tol)) for k, v in kwargs.items()))
+        now = time.monotonic() if ttl is not None else 0.0
+        with lock:
+            entry = entries.get(key)
+            if entry is not None:
+                if ttl is None or entry[0] > now:
+                    entries.move_to_end(key)
+                    stats["hits"] += 1
+                    return entry[1]
+                del entries[key]
+                stats["evictions"] += 1
+            stats["misses"] += 1
+        result = fn(*args, **kwargs)
+        with lock:
+            entries[key] = (now + ttl if ttl is not None else 0.0, result)
+            entries.move_to_end(key)
+            if maxsize is not None:
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+                    stats["evictions"] += 1
+        return result
+
+    def cache_info() -> CacheInfo:
+        with lock:
+            return CacheInfo(stats["hits"], stats["misses"], maxsize, len(entries), stats["evictions"])
+
+    def cache_clear() -> None:
+        with lock:
+            entries.clear()
+            stats.update(hits=0, misses=0, evictions=0)
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+_KWARGS = object()  # separates positional from keyword arguments in keys
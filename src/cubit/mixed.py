@@ -0,0 +1,139 @@
+"""Arrays of quantities whose elements carry different units.
+
+A ``MixedQuantities`` array stores its values as float64 and its units as a small
+integer code per element. The codes index a process-wide table of interned units,
+seeded from ``UNIT_REGISTRY``, in which equal units share one code. Converting to a
+single unit gathers one factor per element from the table and multiplies once, and
+grouping by unit is a stable argsort of the codes, so no Python code runs per element.
+"""
+import threading
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
+
+import numpy as np
+
+from .system import UNIT_REGISTRY, CompositeUnit, Quantity, Unit, _factor_key, _materialize_deferred
+
+CODE_DTYPE = np.dtype("uint16")
+
+_units: list[CompositeUnit] = []
+_codes: dict[tuple[frozenset, str], int] = {}
+_factors = np.empty(0)
+_table_lock = threading.Lock()
+_unit = attrgetter("unit")
+_value = attrgetter("value")
+
+
+def _composite(unit: Unit | CompositeUnit) -> CompositeUnit:
+    return unit if isinstance(unit, CompositeUnit) else Quantity(1, unit).unit
+
+
+def unit_code(unit: Unit | CompositeUnit) -> int:
+    """The code of ``unit`` in the interned unit table, adding it if it is new."""
+    unit = _composite(unit)
+    key = (unit.signature, _factor_key(unit.factor))
+    if (code := _codes.get(key)) is not None:
+        return code
+    global _factors  # noqa: PLW0603
+    with _table_lock:
+        if (code := _codes.get(key)) is not None:
+            return code
+        new_codes: dict[tuple[frozenset, str], int] = {}
+        if not _units:
+            # seed the table from the registry, so that the named units have stable, low codes
+            _materialize_deferred()
+            for registered in list(UNIT_REGISTRY.values()):
+                _intern(_composite(registered), new_codes)
+        code = _intern(unit, new_codes)
+        _factors = np.fromiter((u.factor for u in _units), dtype=float, count=len(_units))
+        # codes are published last, as the lookup above runs without the lock and a code
+        # must not be seen before its unit and factor are in the table
+        _codes.update(new_codes)
+    return code
+
+
+def _intern(unit: CompositeUnit, new_codes: dict[tuple[frozenset, str], int]) -> int:
+    key = (unit.signature, _factor_key(unit.factor))
+    if (code := _codes.get(key, new_codes.get(key))) is not None:
+        return code
+    if len(_units) > np.iinfo(CODE_DTYPE).max:
+        msg = "the interned unit table is full"
+        raise OverflowError(msg)
+    code = new_codes[key] = len(_units)
+    _units.append(unit.simplify())
+    return code
+
+
+def unit_of(code: int) -> CompositeUnit:
+    """The unit with ``code`` in the interned unit table."""
+    return _units[code]
+
+
+class MixedQuantities:
+    """A one-dimensional array of quantities in possibly different units.
+
+    ``values`` is a float64 array and ``codes`` the interned unit code of each element.
+    """
+
+    def __init__(self, values: np.ndarray, codes: np.ndarray):
+        self.values = np.asarray(values, dtype=float)
+        self.codes = np.asarray(codes, dtype=CODE_DTYPE)
+        if self.values.shape != self.codes.shape or self.values.ndim != 1:
+            msg = "values and codes must be one-dimensional arrays of the same length"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_quantities(cls, quantities: Iterable[Quantity]) -> "MixedQuantities":
+        """Pack scalar quantities, resolving the code of each distinct unit object once."""
+        quantities = list(quantities)
+        units = list(map(_unit, quantities))
+        codes = {id(u): unit_code(u) for u in {id(u): u for u in units}.values()}
+        return cls(
+            np.fromiter(map(_value, quantities), dtype=float, count=len(quantities)),
+            np.fromiter(map(codes.__getitem__, map(id, units)), dtype=CODE_DTYPE, count=len(units)),
+        )
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, units: Iterable[Unit | CompositeUnit], codes: np.ndarray):
+        """Pack values whose unit is given as an index into ``units``, e.g. a parsed unit column."""
+        table = np.array([unit_code(u) for u in units], dtype=CODE_DTYPE)
+        return cls(values, table[np.asarray(codes)])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self):
+        return f"<MixedQuantities of {len(self)} in {len(self.unit_codes())} units>"
+
+    def __getitem__(self, key) -> "Quantity | MixedQuantities":
+        if isinstance(key, int | np.integer):
+            return Quantity(self.values[key].item(), _units[self.codes[key]])
+        return type(self)(self.values[key], self.codes[key])
+
+    def __iter__(self) -> Iterator[Quantity]:
+        units = _units
+        return (Quantity(v, units[c]) for v, c in zip(self.values.tolist(), self.codes.tolist(), strict=True))
+
+    def unit_codes(self) -> np.ndarray:
+        """The distinct unit codes in this array."""
+        return np.flatnonzero(np.bincount(self.codes, minlength=1))
+
+    def units(self) -> list[CompositeUnit]:
+        """The distinct units in this array."""
+        return [_units[c] for c in self.unit_codes()]
+
+    def to(self, unit: Unit | CompositeUnit) -> Quantity:
+        """All values converted to ``unit``, with one gather and one multiply."""
+        unit = _composite(unit)
+        if any(_units[c].signature != unit.signature for c in self.unit_codes()):
+            msg = f"not all quantities can be converted to {unit}"
+            raise TypeError(msg)
+        return Quantity(self.values * (_factors[self.codes] / unit.factor), unit)
+
+    def group_by_unit(self) -> dict[CompositeUnit, np.ndarray]:
+        """The indices of the elements in each unit, in their original order."""
+        order = np.argsort(self.codes, kind="stable")
+        codes, starts = np.unique(self.codes[order], return_index=True)
+        return {
+            _units[c]: indices for c, indices in zip(codes.tolist(), np.split(order, starts[1:]), strict=True)
+        }
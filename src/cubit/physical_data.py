@@ -1,10 +1,12 @@
+import csv
 import importlib.resources
 import itertools
 import math
-from dataclasses import dataclass
-
-import pandas as pd
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
 
+from ._base import MultitonMeta
 from .units import (
     ampere,
     coulomb,
@@ -51,46 +53,67 @@ _isotopes_path = (
     importlib.resources.files(__package__) / ".." / ".." / "data" / "isotopes.csv"
 )
 
-_isotope_quadrupolar_moment = None
-_isotope_spin = None
-_isotope_nuclear_g_factor = None
-_isotope_gyromagnetic_ratio = None
 
-_element_atomic_number = None
-_element_name = None
-_monoisotopic_mass = None
-_isotope_natural_abundance: dict[tuple[str,int],float]
+
+def _number(text: str) -> float:
+    # empty cells are missing values
+    return float(text) if text else math.nan
+
+
+def _number_or_nan(text: str) -> float:
+    # a few cells are not numbers, e.g. levels relative to an unknown one ("201+x")
+    try:
+        return _number(text)
+    except ValueError:
+        return math.nan
+
+
+def _read_csv(path, columns: dict[str, Callable[[str], object]]) -> list[dict]:
+    """The rows of a csv file, with ``columns`` converted by their callables, e.g. ``_number``."""
+    with importlib.resources.as_file(path) as _path, _path.resolve().open(newline="") as f:
+        return [{k: convert(row[k]) for k, convert in columns.items()} for row in csv.DictReader(f)]
+
+
+def _load_moments() -> dict:
+    # every state in the table, excited states and isomers included, in SI units
+    rows = _read_csv(
+        _nuclear_moment_path,
+        {
+            "symbol": str,
+            "A": int,
+            "energy_level_keV": _number_or_nan,
+            "half_life_s": _number_or_nan,
+            "spin": _number,
+            "magnetic_dipole_moment_J_T": _number,
+            "electric_quadrupole_moment_Cm2": _number,
+        },
+    )
+    return {"NUCLEAR_MOMENTS": tuple(rows)}
 
 
 def import_moment_data():
-    with importlib.resources.as_file(_nuclear_moment_path) as _path:
-        _nuclear_moment_df = pd.read_csv(_path.resolve(), index_col=False)
-
-        _isotope_quadrupolar_moment = {
-            (r["symbol"], r["A"]): r["electric_quadrupole_moment_Cm2"]
-            * coulomb
-            * meter**2
-            for i, r in _nuclear_moment_df.iterrows()
-        }
-
-        _isotope_spin = {
-            (r["symbol"], r["A"]): r["spin"] for i, r in _nuclear_moment_df.iterrows()
-        }
-
-        _isotope_nuclear_g_factor = {
-            (r["symbol"], r["A"]): -r["magnetic_dipole_moment_J_T"]
-            * (joule / tesla)
-            / (r["spin"] * NUCLEAR_MAGNETON)
-            for i, r in _nuclear_moment_df.iterrows()
-        }
-
-        _isotope_gyromagnetic_ratio = {
-            (r["symbol"], r["A"]): (
-                -(r["magnetic_dipole_moment_J_T"] * (joule / tesla) / r["spin"])
-                / PLANCK_CONSTANT
-            )
-            for i, r in _nuclear_moment_df.iterrows()
-        }
+    _nuclear_moments = _get("moments")["NUCLEAR_MOMENTS"]
+
+    _isotope_quadrupolar_moment = {
+        (r["symbol"], r["A"]): r["electric_quadrupole_moment_Cm2"] * coulomb * meter**2
+        for r in _nuclear_moments
+    }
+
+    _isotope_spin = {(r["symbol"], r["A"]): r["spin"] for r in _nuclear_moments}
+
+    _isotope_nuclear_g_factor = {
+        (r["symbol"], r["A"]): r["magnetic_dipole_moment_J_T"]
+        * (joule / tesla)
+        / (r["spin"] * NUCLEAR_MAGNETON)
+        for r in _nuclear_moments
+    }
+
+    _isotope_gyromagnetic_ratio = {
+        (r["symbol"], r["A"]): (
+            r["magnetic_dipole_moment_J_T"] * (joule / tesla) / r["spin"] / PLANCK_CONSTANT
+        )
+        for r in _nuclear_moments
+    }
     return (
         _isotope_quadrupolar_moment,
         _isotope_spin,
@@ -100,27 +123,29 @@ def import_moment_data():
 
 
 def import_isotope_data():
-    with importlib.resources.as_file(_isotopes_path) as _path:
-        _isotopes_df = pd.read_csv(_path.resolve(), index_col=False)
-
-        _element_atomic_number = {
-            r["symbol"]: r["Z"] for i, r in _isotopes_df.iterrows()
-        }
-
-        _element_name = {r["symbol"]: r["name"] for i, r in _isotopes_df.iterrows()}
-
-        # data derived from
-        # G.Audi, M.Wang, A.H.Wapstra, F.G.Kondev, M.MacCormick, X.Xu, and B.Pfeiffer.
-        # The Ame 2012 atomic mass evaluation (I). Chinese Physics C36 p. 1287-1602, December 2012.
-        _monoisotopic_mass = {
-            (r["symbol"], r["A"]): r["monoisotopic_mass"] * dalton
-            for i, r in _isotopes_df.iterrows()
-        }
-
-        _isotope_natural_abundance = {
-            (r["symbol"], r["A"]): r["natural_abundance"]
-            for i, r in _isotopes_df.iterrows()
-        }
+    # A is a float column, it is missing for elements without isotope data
+    _isotopes = _read_csv(
+        _isotopes_path,
+        {
+            "symbol": str,
+            "A": _number,
+            "Z": int,
+            "name": str,
+            "monoisotopic_mass": _number,
+            "natural_abundance": _number,
+        },
+    )
+
+    _element_atomic_number = {r["symbol"]: r["Z"] for r in _isotopes}
+
+    _element_name = {r["symbol"]: r["name"] for r in _isotopes}
+
+    # data derived from
+    # G.Audi, M.Wang, A.H.Wapstra, F.G.Kondev, M.MacCormick, X.Xu, and B.Pfeiffer.
+    # The Ame 2012 atomic mass evaluation (I). Chinese Physics C36 p. 1287-1602, December 2012.
+    _monoisotopic_mass = {(r["symbol"], r["A"]): r["monoisotopic_mass"] * dalton for r in _isotopes}
+
+    _isotope_natural_abundance = {(r["symbol"], r["A"]): r["natural_abundance"] for r in _isotopes}
     return (
         _element_atomic_number,
         _element_name,
@@ -129,22 +154,88 @@ def import_isotope_data():
     )
 
 
-@dataclass
-class Element:
+def isotopes_dataframe():
+    """isotopes_dataframe.
+        the isotope table as a pandas DataFrame, one row per isotope. Requires pandas.
+    """
+    import pandas as pd
+
+    return pd.DataFrame.from_records(
+        [
+            {
+                "symbol": iso.element.symbol,
+                "A": iso.mass_number,
+                "Z": iso.element.atomic_number,
+                "name": iso.element.name,
+                "monoisotopic_mass_Da": iso.monoisotopic_mass.value,
+                "natural_abundance": iso.natural_abundance,
+                "spin": iso.spin,
+            }
+            for iso in _get("tables")["ISOTOPES"].values()
+        ]
+    )
+
+
+class _Record(metaclass=MultitonMeta):
+    """_Record.
+    Base class for immutable records that are interned on their key fields, so that
+        equality is identity and the hash is computed once on construction.
+    """
+
+    __slots__ = ("_hash",)
+    _fields: tuple[str, ...] = ()
+
+    def _set(self, **fields):
+        for k, v in fields.items():
+            object.__setattr__(self, k, v)
+        object.__setattr__(self, "_hash", hash(tuple(fields[k] for k in type(self).key)))
+
+    def __setattr__(self, name, value):
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    __delattr__ = __setattr__
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        # unpickling goes through the multiton so that it returns the interned instance
+        return type(self), tuple(getattr(self, k) for k in self._fields)
+
+
+class Element(_Record, key=("symbol",)):
     """Element."""
 
+    __slots__ = ("symbol", "name", "atomic_number")
+    _fields = __slots__
+
     symbol: str  # atomic symbol, e.g. H for hydrogen
     name: str  # full name of the element
     atomic_number: int  # atomic number Z, the number of protons in the nucleus
 
-    def __hash__(self):
-        return hash((self.symbol, self.name, self.atomic_number))
+    def __init__(self, symbol: str, name: str, atomic_number: int):
+        self._set(symbol=symbol, name=name, atomic_number=atomic_number)
+
+    def __repr__(self):
+        return f"Element(symbol={self.symbol!r}, name={self.name!r}, atomic_number={self.atomic_number!r})"
 
 
-@dataclass
-class Isotope:
+class Isotope(_Record, key=("element", "mass_number")):
     """Isotope."""
 
+    __slots__ = (
+        "element",
+        "mass_number",
+        "monoisotopic_mass",
+        "natural_abundance",
+        "spin",
+        "nuclear_g_factor",
+        "gyromagnetic_ratio",
+        "quadrupolar_moment",
+    )
+    _fields = __slots__
+
     element: Element
     mass_number: int
     monoisotopic_mass: float
@@ -154,6 +245,28 @@ class Isotope:
     gyromagnetic_ratio: float
     quadrupolar_moment: float
 
+    def __init__(
+        self,
+        element: Element,
+        mass_number: int,
+        monoisotopic_mass: float,
+        natural_abundance: float,
+        spin: float,
+        nuclear_g_factor: float,
+        gyromagnetic_ratio: float,
+        quadrupolar_moment: float,
+    ):
+        self._set(
+            element=element,
+            mass_number=mass_number,
+            monoisotopic_mass=monoisotopic_mass,
+            natural_abundance=natural_abundance,
+            spin=spin,
+            nuclear_g_factor=nuclear_g_factor,
+            gyromagnetic_ratio=gyromagnetic_ratio,
+            quadrupolar_moment=quadrupolar_moment,
+        )
+
     @property
     def isotuple(self):
         """isotuple."""
@@ -170,21 +283,7 @@ class Isotope:
         return (
             proton_frequency
             * self.gyromagnetic_ratio
-            / _isotope_gyromagnetic_ratio[("H", 1)]
-        )
-
-    def __hash__(self):
-        return hash(
-            (
-                self.element,
-                self.mass_number,
-                self.monoisotopic_mass,
-                self.natural_abundance,
-                self.spin,
-                self.nuclear_g_factor,
-                self.gyromagnetic_ratio,
-                self.quadrupolar_moment,
-            ),
+            / _get("tables")["_isotope_gyromagnetic_ratio"][("H", 1)]
         )
 
     def __repr__(self):
@@ -196,46 +295,6 @@ class Isotope:
 
 
 
-(
-    _isotope_quadrupolar_moment,
-    _isotope_spin,
-    _isotope_nuclear_g_factor,
-    _isotope_gyromagnetic_ratio,
-) = import_moment_data()
-(
-    _element_atomic_number,
-    _element_name,
-    _monoisotopic_mass,
-    _isotope_natural_abundance,
-) = import_isotope_data()
-
-import_moment_data()
-import_isotope_data()
-
-
-
-
-ELEMENTS: dict[str,Element] = {
-    symbol: Element(symbol, _element_name[symbol], z)
-    for symbol, z in _element_atomic_number.items()
-}
-ISOTOPES: dict[tuple[str,int],Isotope] = {
-    (symbol, A): Isotope(
-        element=ELEMENTS[symbol],
-        mass_number=A,
-        monoisotopic_mass=m,
-        natural_abundance=_isotope_natural_abundance.get((symbol, A), 0.0) / 100.0,
-        spin=_isotope_spin.get((symbol, A), 0.0),
-        nuclear_g_factor=_isotope_nuclear_g_factor.get((symbol, A), 0.0),
-        gyromagnetic_ratio=_isotope_gyromagnetic_ratio.get((symbol, A), 0.0),
-        quadrupolar_moment=_isotope_quadrupolar_moment.get((symbol, A), 0.0),
-    )
-    for (symbol, A), m in _monoisotopic_mass.items()
-}
-
-gyromagnetic_ratio_ratios = {}
-
-
 def nmr_active_isotopes(element: Element | str):
     """nmr_active_isotopes.
         return a list of Isotopes of a given element that are NMR active.
@@ -246,8 +305,9 @@ def nmr_active_isotopes(element: Element | str):
         element for which to retrieve NMR-active isotopes
 
     """
+    tables = _get("tables")
     if isinstance(element, str):
-        element = ELEMENTS[element]
+        element = tables["ELEMENTS"][element]
     elif not isinstance(element, Element):
         msg = (
             "element must be a string containing the element's atomic symbol or an Element object",
@@ -255,35 +315,176 @@ def nmr_active_isotopes(element: Element | str):
         raise TypeError(msg)
     return [
         iso
-        for (symbol, A), iso in ISOTOPES.items()
-        if ELEMENTS[symbol] == element and iso.spin != 0
+        for (symbol, A), iso in tables["ISOTOPES"].items()
+        if tables["ELEMENTS"][symbol] == element and iso.spin != 0
     ]
 
-_manual_pref_order = [
-    ("H", 1),
-    ("N", 15),
-    ("C", 13),
-    ("P", 31),
-    ("F", 19),
-]
-_pref_order = _manual_pref_order + sorted(
-    [iso for iso in _isotope_natural_abundance if iso not in _manual_pref_order],
-    key=lambda iso: -_isotope_natural_abundance.get(iso, 0.0),
-)
-isotope_preference = {iso: i for i, iso in enumerate(_pref_order)}
-for isotuple_0, isotuple_1 in itertools.combinations(
-    _isotope_nuclear_g_factor.keys(),
-    2,
-):
-    if (
-        isotuple_0 not in _isotope_nuclear_g_factor
-        or isotuple_1 not in _isotope_nuclear_g_factor
+
+def _load_tables() -> dict:
+    # parsing is CPU-bound, so the two files are read one after the other: worker
+    # threads would contend for the GIL, and preload() already moves it off the caller
+    (
+        _isotope_quadrupolar_moment,
+        _isotope_spin,
+        _isotope_nuclear_g_factor,
+        _isotope_gyromagnetic_ratio,
+    ) = import_moment_data()
+    (
+        _element_atomic_number,
+        _element_name,
+        _monoisotopic_mass,
+        _isotope_natural_abundance,
+    ) = import_isotope_data()
+
+    elements: dict[str, Element] = {
+        symbol: Element(symbol, _element_name[symbol], z)
+        for symbol, z in _element_atomic_number.items()
+    }
+    isotopes: dict[tuple[str, int], Isotope] = {
+        (symbol, A): Isotope(
+            element=elements[symbol],
+            mass_number=A,
+            monoisotopic_mass=m,
+            natural_abundance=_isotope_natural_abundance.get((symbol, A), 0.0) / 100.0,
+            spin=_isotope_spin.get((symbol, A), 0.0),
+            nuclear_g_factor=_isotope_nuclear_g_factor.get((symbol, A), 0.0),
+            gyromagnetic_ratio=_isotope_gyromagnetic_ratio.get((symbol, A), 0.0),
+            quadrupolar_moment=_isotope_quadrupolar_moment.get((symbol, A), 0.0),
+        )
+        for (symbol, A), m in _monoisotopic_mass.items()
+    }
+
+    _manual_pref_order = [
+        ("H", 1),
+        ("N", 15),
+        ("C", 13),
+        ("P", 31),
+        ("F", 19),
+    ]
+    _pref_order = _manual_pref_order + sorted(
+        [iso for iso in _isotope_natural_abundance if iso not in _manual_pref_order],
+        key=lambda iso: -_isotope_natural_abundance.get(iso, 0.0),
+    )
+    return {
+        "_isotope_quadrupolar_moment": _isotope_quadrupolar_moment,
+        "_isotope_spin": _isotope_spin,
+        "_isotope_nuclear_g_factor": _isotope_nuclear_g_factor,
+        "_isotope_gyromagnetic_ratio": _isotope_gyromagnetic_ratio,
+        "_element_atomic_number": _element_atomic_number,
+        "_element_name": _element_name,
+        "_monoisotopic_mass": _monoisotopic_mass,
+        "_isotope_natural_abundance": _isotope_natural_abundance,
+        "ELEMENTS": elements,
+        "ISOTOPES": isotopes,
+        "isotope_preference": {iso: i for i, iso in enumerate(_pref_order)},
+    }
+
+
+def _load_ratios() -> dict:
+    tables = _get("tables")
+    _isotope_nuclear_g_factor = tables["_isotope_nuclear_g_factor"]
+    gyromagnetic_ratio_ratios = {}
+    for isotuple_0, isotuple_1 in itertools.combinations(
+        _isotope_nuclear_g_factor.keys(),
+        2,
     ):
-        continue
-    i_1 = ISOTOPES[isotuple_1]
-    ng_0 = _isotope_nuclear_g_factor[isotuple_0]
-    ng_1 = _isotope_nuclear_g_factor[isotuple_1]
-    i_0 = ISOTOPES[isotuple_0]
-    if abs(ng_0.value) > EPS and abs(ng_1.value) > EPS:
-        gyromagnetic_ratio_ratios[(i_0, i_1)] = ng_0 / ng_1
-        gyromagnetic_ratio_ratios[(i_1, i_0)] = ng_1 / ng_0
+        if (
+            isotuple_0 not in _isotope_nuclear_g_factor
+            or isotuple_1 not in _isotope_nuclear_g_factor
+        ):
+            continue
+        i_1 = tables["ISOTOPES"][isotuple_1]
+        ng_0 = _isotope_nuclear_g_factor[isotuple_0]
+        ng_1 = _isotope_nuclear_g_factor[isotuple_1]
+        i_0 = tables["ISOTOPES"][isotuple_0]
+        if abs(ng_0.value) > EPS and abs(ng_1.value) > EPS:
+            gyromagnetic_ratio_ratios[(i_0, i_1)] = ng_0 / ng_1
+            gyromagnetic_ratio_ratios[(i_1, i_0)] = ng_1 / ng_0
+    return {"gyromagnetic_ratio_ratios": gyromagnetic_ratio_ratios}
+
+
+# The data tables are loaded on first access through the module __getattr__, in the
+# calling thread, unless preload() has already started loading them in the background.
+# A stage may only depend on the stages before it, which preload() loads first.
+_STAGES = {"moments": _load_moments, "tables": _load_tables, "ratios": _load_ratios}
+_stage_lock = threading.Lock()
+_stage_futures: dict[str, Future] = {}
+
+
+def _claim(stage: str) -> tuple[Future, bool]:
+    with _stage_lock:
+        if stage in _stage_futures:
+            return _stage_futures[stage], False
+        future = _stage_futures[stage] = Future()
+        return future, True
+
+
+def _fulfil(stage: str, future: Future) -> None:
+    try:
+        result = _STAGES[stage]()
+    except BaseException as e:  # noqa: BLE001
+        future.set_exception(e)
+    else:
+        globals().update(result)
+        future.set_result(result)
+
+
+def _get(stage: str) -> dict:
+    future, owner = _claim(stage)
+    if owner:
+        _fulfil(stage, future)
+    return future.result()
+
+
+def preload() -> None:
+    """preload.
+        start loading the nuclear moment, isotope and element tables, and then the
+        gyromagnetic ratio ratios, in a background thread. Accessing a table blocks
+        only until it is loaded.
+    """
+    claimed = [(stage, *_claim(stage)) for stage in _STAGES]
+    owned = [(stage, future) for stage, future, owner in claimed if owner]
+    if owned:
+        threading.Thread(
+            target=lambda: [_fulfil(stage, future) for stage, future in owned],
+            name="cubit-physical-data-preload",
+            daemon=True,
+        ).start()
+
+
+async def ready(*, ratios: bool = False) -> None:
+    """ready.
+        preload the data tables without blocking the event loop, and wait until the
+        isotope and element tables (and the gyromagnetic ratio ratios, if ``ratios``)
+        are available.
+    """
+    import asyncio
+
+    preload()
+    await asyncio.wrap_future(_stage_futures["tables"])
+    if ratios:
+        await asyncio.wrap_future(_stage_futures["ratios"])
+
+
+_LAZY_NAMES = {
+    "NUCLEAR_MOMENTS": "moments",
+    "_isotope_quadrupolar_moment": "tables",
+    "_isotope_spin": "tables",
+    "_isotope_nuclear_g_factor": "tables",
+    "_isotope_gyromagnetic_ratio": "tables",
+    "_element_atomic_number": "tables",
+    "_element_name": "tables",
+    "_monoisotopic_mass": "tables",
+    "_isotope_natural_abundance": "tables",
+    "ELEMENTS": "tables",
+    "ISOTOPES": "tables",
+    "isotope_preference": "tables",
+    "gyromagnetic_ratio_ratios": "ratios",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_NAMES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return _get(_LAZY_NAMES[name])[name]
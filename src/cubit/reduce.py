@@ -0,0 +1,57 @@
+"""Single-pass reductions over collections of compatible quantities.
+
+The quantities may carry different but compatible units (e.g. km and m). One
+conversion factor is resolved per distinct unit, the values are gathered into a
+NumPy float buffer in a single pass, and the reduction returns one ``Quantity``.
+"""
+from collections.abc import Iterable
+
+import numpy as np
+
+from .sorting import Quantities, base_values
+from .system import CompositeUnit, Quantity, Unit
+
+
+def values_in(quantities: Quantities | Iterable[Quantity], unit: Unit | CompositeUnit | None = None):
+    """Return the values of ``quantities`` as a float array in ``unit``, and that unit.
+
+    ``unit`` defaults to the unit of the first quantity.
+    """
+    if not isinstance(quantities, Quantity):
+        quantities = list(quantities)
+        if unit is None:
+            if not quantities:
+                msg = "a unit is required to reduce an empty collection of quantities"
+                raise ValueError(msg)
+            unit = quantities[0].unit
+    elif unit is None:
+        unit = quantities.unit
+    if isinstance(unit, Unit):
+        unit = unit.as_composite()
+    values, signature = base_values(quantities)
+    if signature is not None and signature != unit.signature:
+        msg = f"quantities cannot be expressed in {unit}"
+        raise TypeError(msg)
+    if unit.factor != 1:
+        values /= unit.factor
+    return values, unit
+
+
+def sum(quantities: Quantities | Iterable[Quantity], unit: CompositeUnit | None = None, axis=None) -> Quantity:  # noqa: A001
+    values, unit = values_in(quantities, unit)
+    return Quantity(np.sum(values, axis=axis), unit)
+
+
+def mean(quantities: Quantities | Iterable[Quantity], unit: CompositeUnit | None = None, axis=None) -> Quantity:
+    values, unit = values_in(quantities, unit)
+    return Quantity(np.mean(values, axis=axis), unit)
+
+
+def min(quantities: Quantities | Iterable[Quantity], unit: CompositeUnit | None = None, axis=None) -> Quantity:  # noqa: A001
+    values, unit = values_in(quantities, unit)
+    return Quantity(np.min(values, axis=axis), unit)
+
+
+def max(quantities: Quantities | Iterable[Quantity], unit: CompositeUnit | None = None, axis=None) -> Quantity:  # noqa: A001
+    values, unit = values_in(quantities, unit)
+    return Quantity(np.max(values, axis=axis), unit)
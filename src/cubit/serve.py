@@ -0,0 +1,323 @@
+"""A local asyncio server for unit parsing and conversion, shared by several processes.
+
+    python -m cubit.serve [--socket PATH | --port PORT] [--window MS]
+
+Clients send newline-delimited JSON requests, e.g.
+``{"id": 7, "value": [1.5, 2], "from": "km/h", "to": "m s^-1"}``, and receive
+``{"id": 7, "value": [...]}`` or ``{"id": 7, "error": "..."}``. Replies may come out of
+order, matched to their request by ``id``.
+
+Requests arriving within a short window, a few milliseconds by default, are
+coalesced. They are grouped by (source unit, target unit), and each group is
+converted with one multiplication of all its values. The unit strings are parsed,
+and their conversion factors computed, once per distinct pair. ``Client`` is a small
+asyncio client that pipelines requests over one connection.
+
+The default socket is ``cubit.sock`` in the user's runtime directory,
+``$XDG_RUNTIME_DIR``, or else in a private ``cubit-<uid>`` directory under the
+system temporary directory.
+"""
+import argparse
+import asyncio
+import contextlib
+import functools
+import itertools
+import json
+import os
+import re
+import socket
+import stat
+import tempfile
+from collections.abc import Iterable
+
+import numpy as np
+
+from . import _catalogue, units
+from .system import CompositeUnit, Unit, _parse_number
+
+DEFAULT_WINDOW = 2e-3  # seconds requests are collected for before a batch is converted
+MAX_BATCH = 1 << 14  # requests that trigger a batch before the window ends
+
+_TERM = re.compile(r"([^\s*/^]+)(?:\^([-+]?[\d./]+))?")
+# prefix symbols and names, longest first so that "da" wins over "d"
+_PREFIXES = sorted(
+    ((text, getattr(units, k)) for k, (s, _) in _catalogue.PREFIXES.items() for text in (s, k)),
+    key=lambda p: -len(p[0]),
+)
+
+
+def default_socket() -> str:
+    """The default socket path, in a directory only the current user can access."""
+    if runtime := os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(runtime, "cubit.sock")
+    directory = os.path.join(tempfile.gettempdir(), f"cubit-{os.getuid()}")
+    with contextlib.suppress(FileExistsError):
+        os.mkdir(directory, 0o700)
+    info = os.lstat(directory)
+    # the name is predictable, so another user may have created it first
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        msg = f"{directory} is not a private directory of the current user"
+        raise PermissionError(msg)
+    return os.path.join(directory, "cubit.sock")
+
+
+def _remove_stale_socket(path: str) -> None:
+    # a socket file is left behind by a server that did not shut down cleanly
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(info.st_mode):
+        msg = f"{path} exists and is not a socket"
+        raise FileExistsError(msg)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+    msg = f"a server is already listening on {path}"
+    raise FileExistsError(msg)
+
+
+@functools.cache
+def _symbols() -> dict[str, Unit | CompositeUnit]:
+    # the catalogue units by symbol and by name. UNIT_REGISTRY is not used, as unnamed
+    # composite units are registered under the string of their components.
+    names = {k: getattr(units, k) for k in (*_catalogue.BASE_UNITS, *_catalogue.DERIVED_UNITS)}
+    return names | {str(u) if isinstance(u, Unit) else u.symbol: u for u in names.values() if str(u)}
+
+
+def _symbol(text: str) -> Unit | CompositeUnit:
+    symbols = _symbols()
+    if (unit := symbols.get(text)) is not None:
+        return unit
+    for prefix_symbol, prefix in _PREFIXES:
+        if text.startswith(prefix_symbol) and (unit := symbols.get(text[len(prefix_symbol) :])) is not None:
+            return prefix * unit
+    msg = f"unknown unit {text!r}"
+    raise ValueError(msg)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_unit(text: str) -> CompositeUnit:
+    """Parse a unit expression of (prefixed) unit symbols or names, e.g. ``"kg m^2 s^-2"`` or ``"km/h"``.
+
+    Terms are separated by spaces or ``*``. Terms after a ``/`` are in the denominator.
+    """
+    unit = units.unum.as_composite()
+    for i, part in enumerate(text.split("/")):
+        terms = list(_TERM.finditer(part))
+        if "".join(t.group(0) for t in terms) != "".join(part.replace("*", "").split()) or (i and not terms):
+            msg = f"cannot parse unit {text!r}"
+            raise ValueError(msg)
+        for term in terms:
+            power = _parse_number(term.group(2)) if term.group(2) else 1
+            unit = unit * _symbol(term.group(1)) ** (power if i == 0 else -power)
+    return unit
+
+
+@functools.lru_cache(maxsize=1024)
+def conversion_factor(source: str, target: str) -> float:
+    """The factor that converts values in unit ``source`` to unit ``target``."""
+    source_unit, target_unit = parse_unit(source), parse_unit(target)
+    if source_unit.signature != target_unit.signature:
+        msg = f"{source!r} cannot be converted to {target!r}"
+        raise ValueError(msg)
+    return source_unit.factor / target_unit.factor
+
+
+def _check_value(value) -> None:
+    # a request value is a number or a (possibly empty) list of numbers
+    items = value if isinstance(value, list) else (value,)
+    if not all(isinstance(v, int | float) and not isinstance(v, bool) for v in items):
+        msg = f"value must be a number or a list of numbers, not {value!r}"
+        raise ValueError(msg)
+
+
+def convert_batch(values: list, source: str, target: str) -> list:
+    """Convert the values of several requests, each a number or a list, with one multiplication."""
+    factor = conversion_factor(source, target)
+    for value in values:
+        _check_value(value)
+    sizes = [len(v) if isinstance(v, list) else None for v in values]
+    flat = np.fromiter(
+        itertools.chain.from_iterable(v if isinstance(v, list) else (v,) for v in values),
+        dtype=float,
+        count=sum(1 if s is None else s for s in sizes),
+    )
+    converted = (flat * factor).tolist()
+    results, start = [], 0
+    for size in sizes:
+        if size is None:
+            results.append(converted[start])
+            start += 1
+        else:
+            results.append(converted[start : start + size])
+            start += size
+    return results
+
+
+class Coalescer:
+    """Collects conversion requests and converts them in batches grouped by unit pair."""
+
+    def __init__(self, window: float = DEFAULT_WINDOW, max_batch: int = MAX_BATCH):
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[tuple[str, str], list[tuple[object, asyncio.Future]]] = {}
+        self._count = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self.batches = 0  # number of batches converted, for monitoring
+
+    def submit(self, value, source: str, target: str) -> asyncio.Future:
+        """Queue one request. An invalid value raises here, so it never fails a batch."""
+        _check_value(value)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault((source, target), []).append((value, future))
+        self._count += 1
+        if self._count >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending, self._count = self._pending, {}, 0
+        for (source, target), requests in pending.items():
+            self.batches += 1
+            # any failure, e.g. an OverflowError from "km^99999999", fails only this group,
+            # and every future is resolved so that no client waits forever
+            try:
+                results: Iterable = convert_batch([v for v, _ in requests], source, target)
+            except Exception as e:  # noqa: BLE001
+                results = itertools.repeat(e)
+            for (_, future), result in zip(requests, results, strict=False):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+async def _reply(coalescer: Coalescer, line: bytes, writer: asyncio.StreamWriter) -> None:
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+        value = await coalescer.submit(request["value"], request["from"], request["to"])
+        reply = {"id": request_id, "value": value}
+    except Exception as e:  # noqa: BLE001
+        reply = {"id": request_id, "error": str(e) or type(e).__name__}
+    writer.write(json.dumps(reply).encode() + b"\n")
+    await writer.drain()
+
+
+async def _handle(coalescer: Coalescer, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    tasks = set()
+    try:
+        while line := await reader.readline():
+            task = asyncio.create_task(_reply(coalescer, line, writer))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(
+    path: str | None = None,
+    *,
+    host: str = "127.0.0.1",
+    port: int | None = None,
+    window: float = DEFAULT_WINDOW,
+    max_batch: int = MAX_BATCH,
+) -> asyncio.Server:
+    """Start the server on the unix socket ``path``, or on TCP ``host:port`` if ``port`` is given.
+
+    ``path`` defaults to ``default_socket()``. A socket left behind by a server that is no
+    longer running is replaced. Raises ``FileExistsError`` if a server is listening on
+    ``path``, or if ``path`` is not a socket.
+    """
+    coalescer = Coalescer(window, max_batch)
+    handler = functools.partial(_handle, coalescer)
+    if port is not None:
+        return await asyncio.start_server(handler, host, port)
+    path = default_socket() if path is None else path
+    _remove_stale_socket(path)
+    return await asyncio.start_unix_server(handler, path)
+
+
+class Client:
+    """An asyncio client that pipelines requests to a ``cubit.serve`` server over one connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._waiting: dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(
+        cls,
+        path: str | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+    ) -> "Client":
+        if port is not None:
+            return cls(*await asyncio.open_connection(host, port))
+        return cls(*await asyncio.open_unix_connection(default_socket() if path is None else path))
+
+    async def _receive(self) -> None:
+        while line := await self._reader.readline():
+            reply = json.loads(line)
+            future = self._waiting.pop(reply.get("id"), None)
+            if future is None or future.done():
+                continue  # e.g. an error about a line the server could not read as a request
+            if "error" in reply:
+                future.set_exception(ValueError(reply["error"]))
+            else:
+                future.set_result(reply["value"])
+        for future in self._waiting.values():
+            future.set_exception(ConnectionError("the server closed the connection"))
+
+    async def convert(self, value: float | list[float], source: str, target: str) -> float | list[float]:
+        """``value`` in unit ``source`` converted to unit ``target``."""
+        request_id = next(self._ids)
+        future = self._waiting[request_id] = asyncio.get_running_loop().create_future()
+        request = {"id": request_id, "value": value, "from": source, "to": target}
+        self._writer.write(json.dumps(request).encode() + b"\n")
+        return await future
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+        await self._receiver
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m cubit.serve", description=__doc__.splitlines()[0])
+    parser.add_argument("--socket", help="unix socket path (default: cubit.sock in the user's runtime dir)")
+    parser.add_argument("--port", type=int, help="listen on TCP 127.0.0.1:PORT instead of a unix socket")
+    parser.add_argument("--window", type=float, default=DEFAULT_WINDOW * 1e3, help="batching window in ms")
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        server = await serve(args.socket, port=args.port, window=args.window / 1e3)
+        async with server:
+            await server.serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
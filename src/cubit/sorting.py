@@ -0,0 +1,106 @@
+"""Sorting, binary search and range queries over collections of quantities.
+
+Quantities may carry different units as long as they are compatible (e.g. a mix
+of ms, s and min). Their values are converted to the unscaled base units once,
+after which sorting and searching are vectorized NumPy operations.
+"""
+from collections.abc import Sequence
+from operator import attrgetter
+
+import numpy as np
+
+from .system import CompositeUnit, Quantity
+
+Quantities = Quantity | Sequence[Quantity]
+
+_unit = attrgetter("unit")
+_value = attrgetter("value")
+
+
+def base_values(quantities: Quantities) -> tuple[np.ndarray, frozenset | None]:
+    """Return the values of ``quantities`` in unscaled base units, and their unit signature.
+
+    ``quantities`` is either a sequence of scalar quantities or a single quantity with an
+    array value. Conversion factors are resolved once per distinct unit. The signature of
+    an empty sequence is None.
+    """
+    if isinstance(quantities, Quantity):
+        return np.asarray(quantities.base_value, dtype=float), quantities.unit.signature
+    if len(quantities) == 0:
+        return np.empty(0), None
+    # map/attrgetter keep the per-element work in C, Python code only runs per distinct unit
+    units = list(map(_unit, quantities))
+    unit_ids = list(map(id, units))
+    distinct: dict[int, CompositeUnit] = dict(zip(unit_ids, units, strict=True))
+    signatures = {u.signature for u in distinct.values()}
+    if len(signatures) > 1:
+        msg = "Only quantities of compatible units can be compared"
+        raise TypeError(msg)
+    factors = {k: u.factor for k, u in distinct.items()}
+    values = np.fromiter(map(_value, quantities), dtype=float, count=len(units))
+    values *= np.fromiter(map(factors.__getitem__, unit_ids), dtype=float, count=len(units))
+    return values, signatures.pop()
+
+
+def _check(signature: frozenset | None, other: frozenset | None) -> None:
+    if None not in (signature, other) and signature != other:
+        msg = "Only quantities of compatible units can be compared"
+        raise TypeError(msg)
+
+
+def argsort(quantities: Quantities, kind: str = "stable") -> np.ndarray:
+    """Indices that sort ``quantities`` in ascending order."""
+    return np.argsort(base_values(quantities)[0], kind=kind)
+
+
+def sort(quantities: Quantities) -> Quantities:
+    """Sort ``quantities`` in ascending order, keeping every element in its own unit."""
+    order = argsort(quantities)
+    if isinstance(quantities, Quantity):
+        return quantities.but(value=np.asarray(quantities.value)[order])
+    return [quantities[i] for i in order]
+
+
+def searchsorted(sorted_quantities: Quantities, quantities: Quantity | Quantities, side: str = "left"):
+    """Indices at which ``quantities`` would be inserted into ``sorted_quantities`` to keep it sorted.
+
+    See ``numpy.searchsorted``. A single scalar quantity yields a single index.
+    """
+    haystack, signature = base_values(sorted_quantities)
+    needles, other = base_values(quantities)
+    _check(signature, other)
+    return np.searchsorted(haystack, needles, side=side)
+
+
+class SortedQuantities:
+    """An index of quantities that answers repeated search and range queries in O(log n).
+
+    The quantities are converted to base units and sorted once on construction. Query
+    results are indices into the original, unsorted collection.
+    """
+
+    def __init__(self, quantities: Quantities):
+        values, self.signature = base_values(quantities)
+        self.order = np.argsort(values, kind="stable")
+        self.values = values[self.order]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def searchsorted(self, quantities: Quantity | Quantities, side: str = "left"):
+        """Positions in the sorted order at which ``quantities`` would be inserted."""
+        needles, signature = base_values(quantities)
+        _check(self.signature, signature)
+        return np.searchsorted(self.values, needles, side=side)
+
+    def range(self, low: Quantity, high: Quantity) -> np.ndarray:
+        """Original indices of the quantities ``q`` with ``low <= q <= high``, in ascending order of ``q``."""
+        start = self.searchsorted(low, side="left")
+        stop = self.searchsorted(high, side="right")
+        return self.order[start:stop]
+
+    def ranges(self, low: Quantities, high: Quantities) -> list[np.ndarray]:
+        """Batched ``range`` for element-wise pairs of bounds."""
+        starts = self.searchsorted(low, side="left")
+        stops = self.searchsorted(high, side="right")
+        return [self.order[i:j] for i, j in zip(starts, stops, strict=True)]
@@ -0,0 +1,126 @@
+"""Unit-aware Fourier transforms of sampled signals, e.g. NMR free induction decays.
+
+The sampling interval (dwell time) is a ``Quantity`` in any time unit, and the
+frequency axis of the spectrum is derived from it in hertz. The transforms run along
+one axis of an array of any shape, so many scans are transformed in one batched call.
+The values keep their unit and single or double precision. ``rfft`` transforms real
+signals into half spectra, and ``fft(..., inplace=True)`` writes the spectrum into the
+signal's own buffer.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .system import CompositeUnit, Quantity
+from .units import hertz, second
+
+# np.fft functions take out= from NumPy 2.0
+_FFT_OUT = np.lib.NumpyVersion(np.__version__) >= "2.0.0"
+
+
+class Spectrum(NamedTuple):
+    """A spectrum and its frequency axis."""
+
+    frequency: Quantity  # in hertz, ascending if shifted
+    values: Quantity
+    shifted: bool = True  # whether zero frequency is at the centre rather than at index 0
+
+
+class Signal(NamedTuple):
+    """A sampled time-domain signal and its time axis."""
+
+    time: Quantity  # in seconds, starting at zero
+    values: Quantity
+
+
+def _seconds(interval: Quantity) -> float:
+    seconds = Quantity(1, second).unit
+    if not isinstance(interval, Quantity) or interval.unit.signature != seconds.signature:
+        msg = "the sampling interval must be a time quantity"
+        raise TypeError(msg)
+    return float(interval.value * interval.unit.factor)
+
+
+def _signal_values(signal: Quantity) -> tuple[np.ndarray, CompositeUnit]:
+    if isinstance(signal, Quantity):
+        return np.asarray(signal.value), signal.unit
+    return np.asarray(signal), Quantity(1).unit
+
+
+def _fft_into(values: np.ndarray, axis: int) -> np.ndarray:
+    if _FFT_OUT:
+        return np.fft.fft(values, axis=axis, out=values)
+    values[...] = np.fft.fft(values, axis=axis)
+    return values
+
+
+def fft(signal: Quantity, dwell: Quantity, *, axis: int = -1, shift: bool = True, inplace: bool = False) -> Spectrum:
+    """Fourier transform a (complex) signal sampled every ``dwell`` along ``axis``.
+
+    Parameters
+    ----------
+    signal : Quantity
+        complex64 or complex128 samples; leading axes are transformed independently,
+        e.g. one row per scan
+    dwell : Quantity
+        sampling interval
+    shift : bool
+        centre zero frequency, so that the frequency axis is ascending
+    inplace : bool
+        write the spectrum into the signal's buffer, which must be a complex array. An
+        even number of points is shifted in place as well, by modulating the signal with
+        (-1)^k before the transform. NumPy < 2 has no ``out=`` for transforms, so there
+        the spectrum is computed into a temporary array and copied into the buffer.
+    """
+    values, unit = _signal_values(signal)
+    seconds = _seconds(dwell)
+    n = values.shape[axis]
+    if inplace:
+        if not np.iscomplexobj(values):
+            msg = "an in-place transform needs a complex signal"
+            raise TypeError(msg)
+        if shift and n % 2 == 0:
+            sign = np.ones(n, dtype=values.real.dtype)
+            sign[1::2] = -1
+            values *= sign.reshape([-1 if i == axis % values.ndim else 1 for i in range(values.ndim)])
+            spectrum = _fft_into(values, axis)
+        else:
+            spectrum = _fft_into(values, axis)
+            if shift:
+                spectrum[...] = np.fft.fftshift(spectrum, axes=axis)
+    else:
+        spectrum = np.fft.fft(values, axis=axis)
+        if shift:
+            spectrum = np.fft.fftshift(spectrum, axes=axis)
+
+    frequency = np.fft.fftfreq(n, seconds)
+    if shift:
+        frequency = np.fft.fftshift(frequency)
+    return Spectrum(Quantity(frequency, hertz), Quantity(spectrum, unit), shift)
+
+
+def rfft(signal: Quantity, dwell: Quantity, *, axis: int = -1) -> Spectrum:
+    """Fourier transform a real signal, keeping only the non-negative frequencies."""
+    values, unit = _signal_values(signal)
+    n = values.shape[axis]
+    spectrum = np.fft.rfft(values, axis=axis)
+    return Spectrum(Quantity(np.fft.rfftfreq(n, _seconds(dwell)), hertz), Quantity(spectrum, unit), False)
+
+
+def ifft(spectrum: Spectrum, *, axis: int = -1) -> Signal:
+    """Inverse of ``fft``, with the time axis derived from the frequency spacing."""
+    values = np.asarray(spectrum.values.value)
+    if spectrum.shifted:
+        values = np.fft.ifftshift(values, axes=axis)
+    n = values.shape[axis]
+    frequency = np.asarray(spectrum.frequency.value) * spectrum.frequency.unit.factor
+    spacing = abs(frequency[1] - frequency[0]) if n > 1 else 1.0
+    dwell = 1 / (n * spacing)
+    time = Quantity(np.arange(n) * dwell, Quantity(1, second).unit)
+    return Signal(time, Quantity(np.fft.ifft(values, axis=axis), spectrum.values.unit))
+
+
+def time_axis(n: int, dwell: Quantity) -> Quantity:
+    """Sampling times ``0, dwell, 2 dwell, ...`` of ``n`` points, in the unit of ``dwell``."""
+    _seconds(dwell)
+    return Quantity(np.arange(n) * dwell.value, dwell.unit)
@@ -1,17 +1,38 @@
-from collections.abc import Iterable
-from copy import copy
+import functools
+import math
+from collections.abc import Callable, Iterable
 from enum import Enum
 from fractions import Fraction
-from typing import NotRequired, Optional, Self, TypedDict, Union, overload
-from typing_extensions import Unpack
+from typing import NotRequired, Optional, Self, TypedDict, Union, Unpack, overload
 
-from ._base import Default, MultitonMeta, NumberLike, Sentinel
+from ._base import ArrayLike, Default, MultitonMeta, NumberLike, Sentinel
 
 UNIT_REGISTRY: dict[
     str,
     Union["Unit", "CompositeUnit"],
 ] = {}
 
+# named composite units indexed by (signature, factor) and, for coherent SI units, by signature alone
+PREFERRED_UNITS: dict[tuple[frozenset, str], "CompositeUnit"] = {}
+COHERENT_UNITS: dict[frozenset, "CompositeUnit"] = {}
+
+# catalogues of units that are only created when first needed, see defer_units
+_DEFERRED_UNITS: list[Callable[[], object]] = []
+
+
+def defer_units(materialize: Callable[[], object]) -> None:
+    """Register a callable that creates and registers a catalogue of units on demand.
+
+    It is called before the first registry or preferred-unit lookup, and before any
+    other named unit is registered so that the catalogue keeps precedence in the index.
+    """
+    _DEFERRED_UNITS.append(materialize)
+
+
+def _materialize_deferred() -> None:
+    while _DEFERRED_UNITS:
+        _DEFERRED_UNITS.pop(0)()
+
 PhysicalDimension = Enum(
     "PhysicalDimension",
     [
@@ -28,6 +49,8 @@ PhysicalDimension = Enum(
 
 
 class ScalingFactor(metaclass=MultitonMeta, key=("factor",)):
+    __array_ufunc__ = None  # make NumPy defer to our reflected operators
+
     def __init__(
         self,
         name: str,
@@ -46,6 +69,40 @@ class ScalingFactor(metaclass=MultitonMeta, key=("factor",)):
 
     __str__ = __repr__
 
+    @property
+    def power(self) -> tuple[int, int] | None:
+        """The factor as an exact ``(base, exponent)`` pair, base 10 or 2, e.g. ``(10, 3)`` for kilo.
+
+        ``None`` if the factor is not an integer power of ten or two.
+        """
+        if "_power" not in self.__dict__:
+            self.__dict__["_power"] = _prefix_power(self.factor)
+        return self.__dict__["_power"]
+
+    def _combine(self, other: Self, sign: int) -> Self:
+        # self * other**sign, by adding exponents if both are powers of the same base
+        power, other_power = self.power, other.power
+        if power is not None and other_power is not None:
+            if power[1] == 0:
+                power = (other_power[0], 0)
+            elif other_power[1] == 0:
+                other_power = (power[0], 0)
+            if power[0] == other_power[0]:
+                power = (power[0], power[1] + sign * other_power[1])
+                if (prefix := _prefix_table().get(power)) is not None:
+                    return prefix
+                factor = Fraction(power[0]) ** power[1]
+                factor = int(factor) if power[0] == 2 and power[1] > 0 else float(factor)
+                return self._joined(other, factor)
+        return self._joined(other, self.factor * other.factor**sign)
+
+    def _joined(self, other: Self, factor: NumberLike) -> Self:
+        return type(self).intern(
+            name="+".join((self.name, other.name)),
+            symbol="+".join((self.symbol, other.symbol)),
+            factor=factor,
+        )
+
     @overload
     def __mul__(self, other: Self) -> Self:
         ...
@@ -57,12 +114,8 @@ class ScalingFactor(metaclass=MultitonMeta, key=("factor",)):
     def __mul__(self, other):
         match other:
             case ScalingFactor():
-                return type(self)(
-                    "+".join((self.name, other.name)),
-                    "+".join((self.symbol, other.symbol)),
-                    self.factor * other.factor,
-                )
-            case int() | float() | complex() | Fraction():
+                return self._combine(other, 1)
+            case int() | float() | complex() | Fraction() | ArrayLike():
                 return Quantity(other, self * unum)
             case _:
                 return NotImplemented
@@ -81,25 +134,40 @@ class ScalingFactor(metaclass=MultitonMeta, key=("factor",)):
     def __truediv__(self, other):
         match other:
             case ScalingFactor():
-                return type(self)(
-                    "+".join((self.name, other.name)),
-                    "+".join((self.symbol, other.symbol)),
-                    self.factor / other.factor,
-                )
-            case int() | float() | complex() | Fraction():
+                return self._combine(other, -1)
+            case int() | float() | complex() | Fraction() | ArrayLike():
                 return Quantity(1 / other, self * unum)
             case _:
                 return NotImplemented
 
     def __rtruediv__(self, other: NumberLike) -> "Quantity":
         match other:
-            case int() | float() | complex() | Fraction():
+            case int() | float() | complex() | Fraction() | ArrayLike():
                 return Quantity(other, CompositeUnit((unum / self,), (1,)))
             case _:
                 return NotImplemented
 
 
-uni: ScalingFactor = ScalingFactor("", "", 1e0)
+uni: ScalingFactor = ScalingFactor.intern(name="", symbol="", factor=1e0)
+
+
+def _prefix_power(factor: NumberLike) -> tuple[int, int] | None:
+    if isinstance(factor, int) and factor > 1 and factor & (factor - 1) == 0:
+        return 2, factor.bit_length() - 1
+    if isinstance(factor, int | float) and factor > 0:
+        exponent = round(math.log10(factor))
+        if float(Fraction(10) ** exponent) == factor:
+            return 10, exponent
+    return None
+
+
+@functools.cache
+def _prefix_table() -> dict[tuple[int, int], ScalingFactor]:
+    """The canonical prefixes of ``cubit.units`` by ``(base, exponent)``, and ``uni`` as ``(10, 0)``."""
+    from . import _catalogue
+
+    prefixes = (ScalingFactor.intern(name=k, symbol=s, factor=f) for k, (s, f) in _catalogue.PREFIXES.items())
+    return {(10, 0): uni} | {p.power: p for p in prefixes}
 
 
 class QuantityData(TypedDict):
@@ -107,24 +175,20 @@ class QuantityData(TypedDict):
     unit: NotRequired[Optional["CompositeUnit"]]
 
 class Quantity:
+    __array_ufunc__ = None  # make NumPy defer to our reflected operators
+
     def __init__(
         self,
         value: NumberLike,
         unit: Optional["CompositeUnit"] = None,
     ):
         self.value = value
-        if unit is None:
-            self.unit: CompositeUnit = CompositeUnit(
-                component_units=(unum,),
-                component_powers=(1,),
-            )
+        if isinstance(unit, CompositeUnit):
+            self.unit: CompositeUnit = unit
+        elif unit is None:
+            self.unit = _DIMENSIONLESS
         elif isinstance(unit, Unit):
-            self.unit = CompositeUnit(
-                component_units=(unit,),
-                component_powers=(1,),
-            )
-        elif isinstance(unit, CompositeUnit):
-            self.unit = unit
+            self.unit = unit.as_composite()
         else:
             msg = (
                 "unit can only be of type Unit or CompositeUnit. If unit is None,"
@@ -132,6 +196,14 @@ class Quantity:
             )
             raise TypeError(msg)
 
+    @classmethod
+    def _make(cls, value: NumberLike, unit: "CompositeUnit") -> Self:
+        # the constructor used by the operators, whose results always have a CompositeUnit
+        self = cls.__new__(cls)
+        self.value = value
+        self.unit = unit
+        return self
+
     def __copy__(self):
         return Quantity(self.value, self.unit)
 
@@ -153,41 +225,119 @@ class Quantity:
 
 
     def __hash__(self):
-        return hash((self.unit, self.value))
+        # consistent with __eq__, which compares base values
+        if not self.unit.signature:
+            return hash(self.base_value)
+        return hash((self.unit.signature, self.base_value))
 
     def __repr__(self) -> str:
-        return f"{self.value} {self.unit}"
+        return f"{self.value} {self.unit.simplify()}"
+
+    def simplify(self) -> Self:
+        """Express this quantity in the registered named unit equal to its unit, if any."""
+        return self.but(unit=self.unit.simplify())
+
+    def to_preferred(self) -> Self:
+        """Convert this quantity to the coherent named SI unit of the same signature, if any.
+
+        e.g. ``5 g m^2 s^-2`` becomes ``0.005 J``. Quantities without such a unit are only
+        simplified.
+        """
+        _materialize_deferred()
+        unit = COHERENT_UNITS.get(self.unit.signature)
+        if unit is None:
+            return self.simplify()
+        return self.but(value=self.value * (self.unit.factor / unit.factor), unit=unit)
 
     def __eq__(self, other: object) -> bool:
+        """Whether the quantities are equal in base units, e.g. ``60 s == 1 min``.
+
+        Like the ordering operators, this compares base values, so ``==``, ``<=`` and
+        ``>=`` agree. Quantities of different dimensions are never equal. Values are
+        compared exactly, so rounding in the conversion can make e.g. ``1.001 km != 1001 m``.
+        """
         match other:
             case Quantity():
-                return self.value == other.value and self.unit == other.unit
+                if other.unit is self.unit:
+                    return self.value == other.value
+                return self.unit.signature == other.unit.signature and self.base_value == other.base_value
             case int() | float() | complex() | Fraction():
-                return self.value == other and self.unit == unum
+                return not self.unit.signature and self.base_value == other
             case _:
                 return False
 
+    @property
+    def base_value(self):
+        """The value of this quantity expressed in the unscaled base units of its unit."""
+        return self.value * self.unit.factor
+
+    def _base_values(self, other: object) -> tuple | None:
+        match other:
+            case Quantity():
+                if self.unit.signature != other.unit.signature:
+                    msg = "Only quantities of compatible units can be compared"
+                    raise TypeError(msg)
+                return self.base_value, other.base_value
+            case int() | float() | Fraction() | ArrayLike():
+                if self.unit.signature:
+                    msg = "Only non-dimensional quantities can be compared with numbers"
+                    raise TypeError(msg)
+                return self.base_value, other
+            case _:
+                return None
+
+    def __lt__(self, other: object) -> bool:
+        if (values := self._base_values(other)) is None:
+            return NotImplemented
+        return values[0] < values[1]
+
+    def __le__(self, other: object) -> bool:
+        if (values := self._base_values(other)) is None:
+            return NotImplemented
+        return values[0] <= values[1]
+
+    def __gt__(self, other: object) -> bool:
+        if (values := self._base_values(other)) is None:
+            return NotImplemented
+        return values[0] > values[1]
+
+    def __ge__(self, other: object) -> bool:
+        if (values := self._base_values(other)) is None:
+            return NotImplemented
+        return values[0] >= values[1]
+
     def __pow__(self, other: NumberLike) -> Self:
         match other:
             case int() | float() | complex() | Fraction():
-                return type(self)(self.value**other, self.unit**other)
+                return self._make(self.value**other, self.unit**other)
             case _:
                 return NotImplemented
 
     def __neg__(self) -> Self:
-        return type(self)(-self.value, self.unit)
+        return self._make(-self.value, self.unit)
+
+    def _converted_value(self, other: Self) -> NumberLike:
+        # the value of other expressed in self's unit
+        if other.unit is self.unit:
+            return other.value
+        if self.unit.signature != other.unit.signature:
+            msg = "Only quantities of compatible units can be added or subtracted"
+            raise TypeError(msg)
+        if other.unit.factor == self.unit.factor:
+            return other.value
+        return other.value * (other.unit.factor / self.unit.factor)
 
     def __sub__(self, other: Self) -> Self:
-        if self.unit != other.unit:
-            msg = "Only quantities of the same type can be subtracted"
-            raise TypeError(msg)
-        return type(self)(self.value - other.value, self.unit)
+        return self._make(self.value - self._converted_value(other), self.unit)
 
     def __add__(self, other: Self) -> Self:
-        if self.unit != other.unit:
-            msg = "Only quantities of the same type can be added"
-            raise TypeError(msg)
-        return type(self)(self.value + other.value, self.unit)
+        return self._make(self.value + self._converted_value(other), self.unit)
+
+    def __radd__(self, other: NumberLike) -> Self:
+        # lets the builtin sum() start from 0
+        if isinstance(other, int | float) and other == 0:
+            return self
+        return NotImplemented
 
     @overload
     def __mul__(self, other: Self) -> Self:
@@ -204,11 +354,11 @@ class Quantity:
     def __mul__(self, other):
         match other:
             case Quantity():
-                return type(self)(self.value * other.value, self.unit * other.unit)
-            case int() | float() | complex() | Fraction():
-                return type(self)(self.value * other, self.unit)
+                return self._make(self.value * other.value, self.unit * other.unit)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return self._make(self.value * other, self.unit)
             case ScalingFactor():
-                return type(self)(self.value, self.unit * other)
+                return self._make(self.value, self.unit * other)
             case _:
                 return NotImplemented
 
@@ -238,11 +388,11 @@ class Quantity:
     def __truediv__(self, other):
         match other:
             case Quantity():
-                return type(self)(self.value / other.value, self.unit / other.unit)
-            case int() | float() | complex() | Fraction():
-                return type(self)(self.value / other, self.unit)
+                return self._make(self.value / other.value, self.unit / other.unit)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return self._make(self.value / other, self.unit)
             case ScalingFactor():
-                return type(self)(self.value, self.unit / other)
+                return self._make(self.value, self.unit / other)
             case _:
                 return NotImplemented
 
@@ -256,14 +406,36 @@ class Quantity:
 
     def __rtruediv__(self, other):
         match other:
-            case int() | float() | complex() | Fraction():
-                return Quantity(other / self.value, self.unit)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return self._make(other / self.value, self.unit**-1)
             case ScalingFactor():
                 return Quantity(self.value, other / self.unit)
             case _:
                 return NotImplemented
 
 
+def _factor_key(factor: NumberLike) -> str:
+    # tolerate rounding differences between equal factors reached through different products
+    return format(complex(factor), ".12g")
+
+
+def _parse_number(text: str) -> NumberLike:
+    # inverse of str for the number types used as factors and powers
+    for parse in (int, float, Fraction, complex):
+        try:
+            return parse(text)
+        except ValueError:
+            pass
+    msg = f"{text!r} is not a number"
+    raise ValueError(msg)
+
+
+def _coherent_factor(unit_dict: dict["Unit", NumberLike]) -> NumberLike:
+    # the coherent SI unit of mass is the kilogram, but gram is the base unit
+    mass_power = sum(p for u, p in unit_dict.items() if u.physical_dimension == PhysicalDimension.MASS)
+    return 1000**mass_power
+
+
 class CompositeUnitData(TypedDict):
     component_units: NotRequired[Iterable["Unit"]]
     component_powers: NotRequired[Iterable[NumberLike]]
@@ -273,6 +445,8 @@ class CompositeUnitData(TypedDict):
 
 
 class CompositeUnit:
+    __array_ufunc__ = None  # make NumPy defer to our reflected operators
+
     def __init__(
         self,
         component_units: Iterable["Unit"],
@@ -284,15 +458,65 @@ class CompositeUnit:
         _unit_dict: dict[Unit, NumberLike] = {}
         for u, p in zip(component_units, component_powers, strict=True):
             factor *= u.scaling_factor.factor**p
-            base_u = u.but(scaling_factor=uni)
+            base_u = u if u.scaling_factor is uni else u.but(scaling_factor=uni)
             _unit_dict[base_u] = _unit_dict.get(base_u, 0) + p
         _unit_dict = {u: p for u, p in _unit_dict.items() if p != 0 and u != unum}
         self.factor = factor
         self.component_units = tuple(_unit_dict.keys())
         self.component_powers = tuple(_unit_dict.values())
+        self.signature = frozenset(_unit_dict.items())
         self.name = name
         self.symbol = symbol
+        self._products: dict = {}
         UNIT_REGISTRY[str(self)] = self
+        if symbol is not None:
+            _materialize_deferred()
+            factor_key = _factor_key(factor)
+            self._index(factor_key, coherent=factor_key == _factor_key(_coherent_factor(_unit_dict)))
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        component_units: tuple["Unit", ...],
+        component_powers: tuple[NumberLike, ...],
+        name: str,
+        symbol: str,
+        factor: NumberLike,
+        factor_key: str,
+        coherent: bool,
+    ) -> Self:
+        """Rehydrate a named unit from precomputed, already canonical components and keys."""
+        self = cls.__new__(cls)
+        self.factor = factor
+        self.component_units = component_units
+        self.component_powers = component_powers
+        self.signature = frozenset(zip(component_units, component_powers, strict=True))
+        self.name = name
+        self.symbol = symbol
+        self._products = {}
+        UNIT_REGISTRY[str(self)] = self
+        self._index(factor_key, coherent=coherent)
+        return self
+
+    def _combine(self, other: "CompositeUnit", power: NumberLike) -> "CompositeUnit":
+        """``self * other**power``, cached on self and keyed on the value of other.
+
+        Equal units built separately, e.g. by ``units.milli * units.joule`` in a loop,
+        share one entry, so the cache grows with the number of distinct units only.
+        """
+        key = (other.signature, other.factor, power)
+        if (cached := self._products.get(key)) is None:
+            cached = self._products[key] = type(self)(
+                component_units=self.component_units + other.component_units,
+                component_powers=self.component_powers + tuple(power * e for e in other.component_powers),
+                factor=self.factor * other.factor**power,
+            )
+        return cached
+
+    def _index(self, factor_key: str, *, coherent: bool) -> None:
+        PREFERRED_UNITS.setdefault((self.signature, factor_key), self)
+        if coherent:
+            COHERENT_UNITS.setdefault(self.signature, self)
 
     @classmethod
     def from_quantity(cls, q: Quantity, **kwargs):
@@ -339,6 +563,37 @@ class CompositeUnit:
     def decompose(self):
         return self.but(name=None, symbol=None)
 
+    def simplify(self) -> "CompositeUnit":
+        """Return the registered named unit equal to this one, or this unit if there is none."""
+        _materialize_deferred()
+        return PREFERRED_UNITS.get((self.signature, _factor_key(self.factor)), self)
+
+    @property
+    def canonical(self) -> str:
+        """An unambiguous string of the factor and base-unit powers, e.g. ``1000 g m^2 s^-2``.
+
+        Unlike ``str``, it keeps the factor, and it does not depend on the unit's name or the
+        order of its components. ``from_canonical`` parses it back.
+        """
+        components = sorted(f"{u}^{p}" for u, p in self.signature)
+        return " ".join([str(self.factor), *components])
+
+    @classmethod
+    def from_canonical(cls, string: str) -> "CompositeUnit":
+        """Parse a ``canonical`` unit string, returning the registered named unit if there is one."""
+        factor, *components = string.split()
+        units, powers = [], []
+        for component in components:
+            text, _, power = component.rpartition("^")
+            symbol, _, referent = text.partition("[")
+            unit = Unit.base(symbol, referent.removesuffix("]") or None)
+            if unit is None:
+                msg = f"unknown base unit {text!r} in {string!r}"
+                raise ValueError(msg)
+            units.append(unit)
+            powers.append(_parse_number(power))
+        return cls(units, powers, factor=_parse_number(factor)).simplify()
+
     @overload
     def __mul__(self, other: Self) -> Self:
         ...
@@ -358,21 +613,17 @@ class CompositeUnit:
     def __mul__(self, other):
         match other:
             case CompositeUnit():
-                return type(self)(
-                    component_units=self.component_units + other.component_units,
-                    component_powers=self.component_powers + other.component_powers,
-                    factor=self.factor * other.factor,
-                )
+                return self._combine(other, 1)
             case ScalingFactor():
                 return type(self)(
                     component_units=self.component_units,
                     component_powers=self.component_powers,
                     factor=self.factor * other.factor,
                 )
-            case int() | float() | complex() | Fraction():
-                return Quantity(other, self)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return Quantity._make(other, self)
             case Quantity():
-                return Quantity(other.value, other.unit * self)
+                return Quantity._make(other.value, other.unit * self)
             case _:
                 return NotImplemented
 
@@ -392,10 +643,10 @@ class CompositeUnit:
         match other:
             case ScalingFactor():
                 return self.__mul__(other)
-            case int() | float() | complex() | Fraction():
+            case int() | float() | complex() | Fraction() | ArrayLike():
                 return self.__mul__(other)
             case Quantity():
-                return Quantity(other.value, other.unit * self)
+                return Quantity._make(other.value, other.unit * self)
             case _:
                 return NotImplemented
 
@@ -418,21 +669,17 @@ class CompositeUnit:
     def __truediv__(self, other):
         match other:
             case CompositeUnit():
-                return type(self)(
-                    component_units=self.component_units + other.component_units,
-                    component_powers=(self.component_powers + tuple(-e for e in other.component_powers)),
-                    factor=self.factor / other.factor,
-                )
+                return self._combine(other, -1)
             case ScalingFactor():
                 return type(self)(
                     component_units=self.component_units,
                     component_powers=self.component_powers,
                     factor=self.factor / other.factor,
                 )
-            case int() | float() | complex() | Fraction():
-                return Quantity(1 / other, self)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return Quantity._make(1 / other, self)
             case Quantity():
-                return Quantity(1 / other.value, self / other.unit)
+                return Quantity._make(1 / other.value, self / other.unit)
             case _:
                 return NotImplemented
 
@@ -456,19 +703,22 @@ class CompositeUnit:
                     component_powers=tuple(-e for e in self.component_powers),
                     factor=other.factor / self.factor,
                 )
-            case int() | float() | complex() | Fraction():
-                return Quantity(other, self**-1)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return Quantity._make(other, self**-1)
             case Quantity():
-                return Quantity(other.value, other.unit / self)
+                return Quantity._make(other.value, other.unit / self)
             case _:
                 return NotImplemented
 
     def __pow__(self, other: NumberLike) -> Self:
-        return type(self)(
-            component_units=self.component_units,
-            component_powers=tuple(other * e for e in self.component_powers),
-            factor=self.factor**other,
-        )
+        key = ("pow", other)
+        if (cached := self._products.get(key)) is None:
+            cached = self._products[key] = type(self)(
+                component_units=self.component_units,
+                component_powers=tuple(other * e for e in self.component_powers),
+                factor=self.factor**other,
+            )
+        return cached
 
     def __str__(self):
         if self.symbol is None:
@@ -505,6 +755,8 @@ class UnitData(TypedDict):
     scaling_factor: NotRequired[ScalingFactor]
 
 class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent")):
+    __array_ufunc__ = None  # make NumPy defer to our reflected operators
+
     def __init__(
         self,
         physical_dimension: PhysicalDimension,
@@ -520,10 +772,24 @@ class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent"))
         self.scaling_factor = scaling_factor
         UNIT_REGISTRY[str(self)] = self
 
+    @classmethod
+    def from_snapshot(cls, **kwargs: Unpack[UnitData]) -> Self:
+        """Rehydrate an interned unit without binding ``__init__``'s signature."""
+        self = cls.intern(**kwargs)
+        UNIT_REGISTRY[str(self)] = self
+        return self
+
     @classmethod
     def get(cls, key):
+        _materialize_deferred()
         return UNIT_REGISTRY.get(key)
 
+    @classmethod
+    def base(cls, symbol: str, referent: str | None = None) -> Self | None:
+        """Return the existing unprefixed unit with this symbol and referent, if any."""
+        key = (("referent", referent), ("scaling_factor", uni), ("symbol", symbol))
+        return cls._instances.get((cls, key))
+
     @overload
     def __mul__(self, other: ScalingFactor) -> Self:
         ...
@@ -547,34 +813,15 @@ class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent"))
     def __mul__(self, other):
         match other:
             case ScalingFactor():
-                return type(self)(
-                    physical_dimension=self.physical_dimension,
-                    name=self.name,
-                    symbol=self.symbol,
-                    referent=self.referent,
-                    scaling_factor=self.scaling_factor * other,
-                )
+                return self.but(scaling_factor=self.scaling_factor * other)
             case CompositeUnit():
-                return CompositeUnit(
-                    component_units=(*other.component_units, self),
-                    component_powers=(*other.component_powers, -1),
-                    factor=other.factor,
-                )
+                return other * self.as_composite()
             case Unit():
-                return CompositeUnit(
-                    component_units=(self, other),
-                    component_powers=(1, 1),
-                )
-            case int() | float() | complex() | Fraction():
-                return Quantity(
-                    other,
-                    CompositeUnit((self,), (1,)),
-                )
+                return self.as_composite() * other.as_composite()
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return Quantity._make(other, self.as_composite())
             case Quantity():
-                return Quantity(
-                    other,
-                    other.unit * self,
-                )
+                return Quantity._make(other.value, other.unit * self.as_composite())
             case _:
                 return NotImplemented
 
@@ -601,20 +848,23 @@ class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent"))
         self,
         **kwargs: Unpack[UnitData],
     ) -> Self:
-        return type(self)(
-            **(
-                UnitData(
-                    {
-                        "physical_dimension": self.physical_dimension,
-                        "name": self.name,
-                        "symbol": self.symbol,
-                        "referent": self.referent,
-                        "scaling_factor": self.scaling_factor,
-                    },
-                )
-                | kwargs
-            ),
+        attributes = (
+            UnitData(
+                {
+                    "physical_dimension": self.physical_dimension,
+                    "name": self.name,
+                    "symbol": self.symbol,
+                    "referent": self.referent,
+                    "scaling_factor": self.scaling_factor,
+                },
+            )
+            | kwargs
         )
+        # look up an existing unit directly, binding the constructor signature is slow
+        index = type(self), tuple(sorted((k, attributes[k]) for k in type(self).key))
+        if (unit := type(self)._instances.get(index)) is not None:
+            return unit
+        return type(self)(**attributes)
 
 
     def decompose(self):
@@ -642,27 +892,14 @@ class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent"))
 
     def __truediv__(self, other):
         match other:
-            case int() | float() | complex() | Fraction():
-                return Quantity(1 / other, self)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return Quantity._make(1 / other, self.as_composite())
             case Unit():
-                return CompositeUnit(
-                    component_units=(self, other),
-                    component_powers=(1, -1),
-                )
+                return self.as_composite() / other.as_composite()
             case CompositeUnit():
-                return CompositeUnit(
-                    component_units=(*other.component_units, self),
-                    component_powers=(
-                        *tuple(-e for e in other.component_powers),
-                        1,
-                    ),
-                    factor=1 / other.factor,
-                )
+                return other**-1 * self.as_composite()
             case Quantity():
-                return Quantity(
-                    1 / other.value,
-                    self / other.unit,
-                )
+                return Quantity._make(1 / other.value, self.as_composite() / other.unit)
             case ScalingFactor():
                 return self.but(
                     scaling_factor=self.scaling_factor / other,
@@ -692,19 +929,15 @@ class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent"))
 
     def __rtruediv__(self, other):
         match other:
-            case int() | float() | complex() | Fraction():
-                return Quantity(other, self**-1)
+            case int() | float() | complex() | Fraction() | ArrayLike():
+                return Quantity._make(other, self**-1)
             case Unit():
                 return CompositeUnit(
                     component_units=(self, other),
                     component_powers=(-1, 1),
                 )
             case CompositeUnit():
-                return CompositeUnit(
-                    component_units=(*other.component_units, self),
-                    component_powers=(*other.component_powers, 1),
-                    factor=other.factor,
-                )
+                return other / self.as_composite()
             case ScalingFactor():
                 return CompositeUnit(
                     (self,),
@@ -717,10 +950,14 @@ class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent"))
                 return NotImplemented
 
     def __pow__(self, power: NumberLike) -> CompositeUnit:
-        return CompositeUnit(
-            component_units=(self,),
-            component_powers=(power,),
-        )
+        return self.as_composite() ** power
+
+    def as_composite(self) -> CompositeUnit:
+        """This unit as a CompositeUnit, created once and shared."""
+        if (composite := self.__dict__.get("_composite")) is None:
+            composite = CompositeUnit(component_units=(self,), component_powers=(1,))
+            self.__dict__["_composite"] = composite
+        return composite
 
     def __hash__(self):
         return hash(
@@ -745,8 +982,12 @@ class Unit(metaclass=MultitonMeta, key=("symbol", "scaling_factor", "referent"))
         return f"[{self}]"
 
 
-unum: Unit = Unit(
+unum: Unit = Unit.from_snapshot(
     physical_dimension=PhysicalDimension.NONDIMENSIONAL,
     name="unum",
     symbol="",
+    referent=None,
+    scaling_factor=uni,
 )
+# the unit of plain numbers, shared by all dimensionless quantities created without a unit
+_DIMENSIONLESS: CompositeUnit = unum.as_composite()
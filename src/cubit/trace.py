@@ -0,0 +1,245 @@
+"""Trace unit-bearing functions once and compile them to plain numeric kernels.
+
+``compile(fn, **input_units)`` calls ``fn`` with quantities whose values are
+symbolic placeholders. All unit bookkeeping, including dimension checks, happens
+during that single trace through the normal ``Quantity`` arithmetic, while the
+values build an expression tree in which constant factors are folded. The tree is
+then turned into a single Python function over plain numbers or NumPy arrays.
+"""
+import numbers
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .system import CompositeUnit, Quantity, Unit, _factor_key
+
+
+class Expr:
+    """A node of a traced numeric expression."""
+
+    __array_ufunc__ = None  # make NumPy defer to our reflected operators
+
+    def __init__(self, op: str, *args):
+        self.op = op
+        self.args = args
+
+    def __repr__(self):
+        return _source(self, [])
+
+    def __add__(self, other):
+        return _add(self, _wrap(other))
+
+    def __radd__(self, other):
+        return _add(_wrap(other), self)
+
+    def __sub__(self, other):
+        return _add(self, _neg(_wrap(other)))
+
+    def __rsub__(self, other):
+        return _add(_wrap(other), _neg(self))
+
+    def __mul__(self, other):
+        return _mul(self, _wrap(other))
+
+    def __rmul__(self, other):
+        return _mul(_wrap(other), self)
+
+    def __truediv__(self, other):
+        return _div(self, _wrap(other))
+
+    def __rtruediv__(self, other):
+        return _div(_wrap(other), self)
+
+    def __pow__(self, other):
+        if isinstance(other, Expr):
+            msg = "exponents must be constant when tracing, as they determine the unit"
+            raise TypeError(msg)
+        return _pow(self, other)
+
+    def __neg__(self):
+        return _neg(self)
+
+    def __pos__(self):
+        return self
+
+
+def _const(value) -> Expr:
+    return Expr("const", value)
+
+
+def _wrap(value) -> Expr:
+    return value if isinstance(value, Expr) else _const(value)
+
+
+def _is(k, value) -> bool:
+    # constants may be arrays, e.g. a captured array of weights, which never fold away
+    return isinstance(k, numbers.Number) and k == value
+
+
+def _is_const(e: Expr, value=None) -> bool:
+    return e.op == "const" and (value is None or _is(e.args[0], value))
+
+
+def _split(e: Expr) -> tuple[object, Expr | None]:
+    # split e into constant coefficient and non-constant rest
+    if _is_const(e):
+        return e.args[0], None
+    if e.op == "*" and _is_const(e.args[0]):
+        return e.args[0].args[0], e.args[1]
+    return 1, e
+
+
+def _mul(a: Expr, b: Expr) -> Expr:
+    ka, ra = _split(a)
+    kb, rb = _split(b)
+    k = ka * kb
+    if ra is None or rb is None:
+        rest = rb if ra is None else ra
+    else:
+        rest = Expr("*", ra, rb)
+    if rest is None:
+        return _const(k)
+    if _is(k, 1):
+        return rest
+    return Expr("*", _const(k), rest)
+
+
+def _div(a: Expr, b: Expr) -> Expr:
+    kb, rb = _split(b)
+    if rb is None:
+        return _mul(_const(1 / kb), a)
+    ka, ra = _split(a)
+    if not _is(kb, 1):
+        a = _mul(_const(ka / kb), ra) if ra is not None else _const(ka / kb)
+        b = rb
+    return Expr("/", a, b)
+
+
+def _add(a: Expr, b: Expr) -> Expr:
+    if _is_const(a) and _is_const(b):
+        return _const(a.args[0] + b.args[0])
+    if _is_const(a, 0):
+        return b
+    if _is_const(b, 0):
+        return a
+    return Expr("+", a, b)
+
+
+def _neg(a: Expr) -> Expr:
+    return _mul(_const(-1), a)
+
+
+def _pow(a: Expr, p) -> Expr:
+    if p == 1:
+        return a
+    if _is_const(a):
+        return _const(a.args[0] ** p)
+    k, rest = _split(a)
+    if not _is(k, 1):
+        return _mul(_const(k**p), Expr("**", rest, _const(p)))
+    return Expr("**", a, _const(p))
+
+
+def _source(e: Expr, constants: list) -> str:
+    match e.op:
+        case "const":
+            constants.append(e.args[0])
+            return f"c{len(constants) - 1}"
+        case "var":
+            return e.args[0]
+        case op:
+            left, right = (_source(a, constants) for a in e.args)
+            return f"({left} {op} {right})"
+
+
+class Kernel:
+    """A compiled, unit-free function.
+
+    Calling it with plain numbers or arrays expressed in ``input_units`` returns the
+    plain result expressed in ``unit``.
+    """
+
+    def __init__(self, fn: Callable, input_units: dict[str, CompositeUnit], output: Quantity):
+        self.__wrapped__ = fn
+        self.input_units = input_units
+        self.unit = output.unit
+        self.expr = _wrap(output.value)
+
+        constants: list = []
+        body = _source(self.expr, constants)
+        self.source = f"def kernel({', '.join(input_units)}):\n    return {body}\n"
+        self.constants = tuple(constants)
+        namespace = {f"c{i}": c for i, c in enumerate(constants)}
+        exec(self.source, namespace)  # noqa: S102
+        self._kernel = namespace["kernel"]
+
+    def __call__(self, *args, **kwargs):
+        return self._kernel(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<Kernel {self.__wrapped__.__qualname__}({', '.join(self.input_units)}) -> [{self.unit}]>"
+
+    def apply(self, **quantities: Quantity) -> Quantity:
+        """Evaluate on quantities, converting each to its declared input unit first."""
+        values = {}
+        for k, unit in self.input_units.items():
+            q = quantities[k]
+            if q.unit.signature != unit.signature:
+                msg = f"{k} must be compatible with {unit}"
+                raise TypeError(msg)
+            values[k] = q.value if q.unit.factor == unit.factor else q.value * (q.unit.factor / unit.factor)
+        return Quantity(self._kernel(**values), self.unit)
+
+
+KERNEL_CACHE_SIZE = 256  # kernels compile keeps, least recently used are dropped first
+# bounded, as callers such as chunked.evaluate may trace a new lambda on every call
+_KERNELS: OrderedDict[tuple, Kernel] = OrderedDict()
+_kernels_lock = threading.Lock()
+
+
+def _as_composite(unit: Unit | CompositeUnit) -> CompositeUnit:
+    return unit if isinstance(unit, CompositeUnit) else Quantity(1, unit).unit
+
+
+def compile(  # noqa: A001
+    fn: Callable[..., Quantity],
+    /,
+    output_unit: Unit | CompositeUnit | None = None,
+    **input_units: Unit | CompositeUnit,
+) -> Kernel:
+    """Trace ``fn`` once with the given input units and compile it to a numeric kernel.
+
+    Incompatible units raise during the trace, not when the kernel is called. The
+    kernel is cached per function, input-unit signature and output unit, keeping the
+    ``KERNEL_CACHE_SIZE`` most recently used. If ``output_unit`` is given, the result
+    is converted to it.
+
+    Example
+    -------
+    larmor = compile(lambda field: ELEMENTARY_CHARGE * field / (2 * ELECTRON_MASS), field=tesla)
+    larmor(np.linspace(0, 20, 1000))  # plain array, in units of larmor.unit
+    """
+    input_units = {k: _as_composite(u) for k, u in input_units.items()}
+    if output_unit is not None:
+        output_unit = _as_composite(output_unit)
+    key = (
+        fn,
+        tuple((k, u.signature, _factor_key(u.factor)) for k, u in input_units.items()),
+        None if output_unit is None else (output_unit.signature, _factor_key(output_unit.factor)),
+    )
+    with _kernels_lock:
+        if (kernel := _KERNELS.get(key)) is not None:
+            _KERNELS.move_to_end(key)
+            return kernel
+    output = fn(**{k: Quantity(Expr("var", k), u) for k, u in input_units.items()})
+    if not isinstance(output, Quantity):
+        output = Quantity(output)
+    output = output.simplify()
+    if output_unit is not None:
+        output = Quantity(0, output_unit) + output
+    kernel = Kernel(fn, input_units, output)
+    with _kernels_lock:
+        kernel = _KERNELS.setdefault(key, kernel)
+        while len(_KERNELS) > KERNEL_CACHE_SIZE:
+            _KERNELS.popitem(last=False)
+    return kernel
@@ -0,0 +1,144 @@
+"""Systems of units, and conversion of whole tables of values between them.
+
+A ``UnitSystem`` defines one base unit per ``PhysicalDimension``, given as a
+``Quantity``, e.g. the Bohr radius for length in atomic units. The value of a quantity
+of dimension L^a M^b T^c ... in one system converts to another system with a single
+factor, the product of the ratios of the base units raised to those exponents. The
+factor only depends on the two systems and the dimension exponents, so it is
+computed once per (source system, target system, dimension signature) and cached,
+and a table converts with one vectorized multiplication per column.
+
+Dimensions a system does not define are measured in the SI base unit.
+"""
+import functools
+import math
+from collections.abc import Mapping
+from fractions import Fraction
+
+import numpy as np
+
+from .buckingham import _dimensions
+from .physical_data import BOHR_RADIUS, ELECTRON_MASS, ELEMENTARY_CHARGE, HBAR
+from .system import CompositeUnit, PhysicalDimension, Quantity, Unit
+from .units import ampere, candela, centi, gram, kelvin, kilogram, meter, mole, second
+
+_DIMENSIONS = tuple(d for d in PhysicalDimension if d is not PhysicalDimension.NONDIMENSIONAL)
+# the cubit base unit of each dimension, that the scales of base units are expressed in
+_BASE_UNITS = {
+    PhysicalDimension.LENGTH: meter,
+    PhysicalDimension.MASS: gram,
+    PhysicalDimension.TIME: second,
+    PhysicalDimension.CURRENT: ampere,
+    PhysicalDimension.TEMPERATURE: kelvin,
+    PhysicalDimension.AMOUNT_OF_SUBSTANCE: mole,
+    PhysicalDimension.LUMINOUS_INTENSITY: candela,
+}
+SI_BASE_UNITS = _BASE_UNITS | {PhysicalDimension.MASS: kilogram}
+
+Dimensions = tuple[Fraction, ...]  # exponent of each dimension, in the order of PhysicalDimension
+
+
+def dimensions(unit: Unit | CompositeUnit | Quantity) -> Dimensions:
+    """The dimension exponents of ``unit``, the signature conversion factors are cached by."""
+    if isinstance(unit, Quantity):
+        unit = unit.unit
+    exponents = _dimensions(unit.as_composite() if isinstance(unit, Unit) else unit)
+    return tuple(exponents.get(d, Fraction(0)) for d in _DIMENSIONS)
+
+
+class UnitSystem:
+    """A system of units with one base unit per physical dimension.
+
+    Parameters
+    ----------
+    name : str
+    base_units : Mapping[PhysicalDimension, Quantity | Unit | CompositeUnit]
+        the base unit of each dimension, as a quantity of that dimension alone, e.g.
+        ``{PhysicalDimension.LENGTH: BOHR_RADIUS}``. Missing dimensions use SI units.
+    """
+
+    def __init__(self, name: str, base_units: Mapping[PhysicalDimension, Quantity | Unit | CompositeUnit]):
+        self.name = name
+        self.scales: dict[PhysicalDimension, float] = {}  # base unit in cubit base units
+        for dimension in _DIMENSIONS:
+            base = base_units.get(dimension, SI_BASE_UNITS[dimension])
+            quantity = base if isinstance(base, Quantity) else 1 * base
+            expected = tuple(Fraction(d is dimension) for d in _DIMENSIONS)
+            if dimensions(quantity) != expected:
+                msg = (
+                    f"the {dimension.name.lower()} base unit of {name} "
+                    f"has dimensions {dimensions(quantity)}"
+                )
+                raise ValueError(msg)
+            self.scales[dimension] = float(quantity.base_value)
+
+    def __repr__(self):
+        return f"<UnitSystem: {self.name}>"
+
+    def factor(self, target: "UnitSystem", signature: Dimensions) -> float:
+        """The factor converting values of dimensions ``signature`` in this system to ``target``."""
+        return _factor(self, target, signature)
+
+    def convert(self, values, unit: Unit | CompositeUnit | Quantity, target: "UnitSystem"):
+        """``values`` of the dimensions of ``unit``, in this system, expressed in ``target``."""
+        return np.multiply(values, _factor(self, target, dimensions(unit)))
+
+    def convert_table(
+        self,
+        columns,
+        units: Mapping[str, Unit | CompositeUnit | Quantity],
+        target: "UnitSystem",
+    ):
+        """Convert each column of ``columns`` (a mapping of arrays, or a DataFrame) to ``target``.
+
+        ``units`` gives a unit of the dimensions of each column to convert. Other columns
+        are passed through. The result is a dict of arrays, or a DataFrame if
+        ``columns`` is one.
+        """
+        factors = {name: _factor(self, target, dimensions(unit)) for name, unit in units.items()}
+        result = {
+            name: np.multiply(column, factors[name]) if name in factors else column
+            for name, column in columns.items()
+        }
+        if hasattr(columns, "columns") and hasattr(columns, "index"):
+            return type(columns)(result, index=columns.index)
+        return result
+
+    def to_quantity(self, values, unit: Unit | CompositeUnit) -> Quantity:
+        """``values`` given in this system as a ``Quantity`` in ``unit``, of the same dimensions."""
+        unit = unit.as_composite() if isinstance(unit, Unit) else unit
+        return Quantity(np.multiply(values, _factor(self, BASE, dimensions(unit)) / unit.factor), unit)
+
+    def from_quantity(self, quantity: Quantity):
+        """The value of ``quantity`` in this system."""
+        return np.multiply(quantity.base_value, _factor(BASE, self, dimensions(quantity)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _factor(source: UnitSystem, target: UnitSystem, signature: Dimensions) -> float:
+    return math.prod(
+        (source.scales[d] / target.scales[d]) ** p for d, p in zip(_DIMENSIONS, signature, strict=True) if p
+    )
+
+
+# the cubit base units, with gram for mass, which quantities are converted through
+BASE = UnitSystem("cubit base units", _BASE_UNITS)
+SI = UnitSystem("SI", SI_BASE_UNITS)
+CGS = UnitSystem(
+    "CGS",
+    {
+        PhysicalDimension.LENGTH: centi * meter,
+        PhysicalDimension.MASS: gram,
+        PhysicalDimension.TIME: second,
+    },
+)
+_ATOMIC_TIME = ELECTRON_MASS * BOHR_RADIUS**2 / HBAR  # hbar / hartree energy
+ATOMIC = UnitSystem(
+    "Hartree atomic units",
+    {
+        PhysicalDimension.LENGTH: BOHR_RADIUS,
+        PhysicalDimension.MASS: ELECTRON_MASS,
+        PhysicalDimension.TIME: _ATOMIC_TIME,
+        PhysicalDimension.CURRENT: ELEMENTARY_CHARGE / _ATOMIC_TIME,
+    },
+)
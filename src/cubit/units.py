@@ -1,124 +1,277 @@
-from .system import CompositeUnit, PhysicalDimension, ScalingFactor, Unit, uni, unum
+from . import _catalogue
+from ._base import MultitonMeta
+from .system import (
+    CompositeUnit,
+    PhysicalDimension,
+    ScalingFactor,
+    Unit,
+    _coherent_factor,
+    _factor_key,
+    _materialize_deferred,
+    defer_units,
+    uni,
+    unum,
+)
 
 PI = 3.1415926535897932384626433832795028841971693993751058
 
 
-# SI prefixes
-quetta = ScalingFactor("quetta", "Q", 1e30)
-ronna = ScalingFactor("ronna", "R", 1e27)
-yotta = ScalingFactor("yotta", "Y", 1e24)
-zetta = ScalingFactor("zetta", "Z", 1e21)
-exa = ScalingFactor("exa", "E", 1e18)
-peta = ScalingFactor("peta", "P", 1e15)
-tera = ScalingFactor("tera", "T", 1e12)
-giga = ScalingFactor("giga", "G", 1e9)
-mega = ScalingFactor("mega", "M", 1e6)
-kilo = ScalingFactor("kilo", "k", 1e3)
-hecto = ScalingFactor("hecto", "h", 1e2)
-deca = ScalingFactor("deca", "da", 1e1)
-deci = ScalingFactor("deci", "d", 1e-1)
-centi = ScalingFactor("centi", "c", 1e-2)
-milli = ScalingFactor("milli", "m", 1e-3)
-micro = ScalingFactor("micro", "μ", 1e-6)
-nano = ScalingFactor("nano", "n", 1e-9)
-pico = ScalingFactor("pico", "p", 1e-12)
-femto = ScalingFactor("femto", "f", 1e-15)
-atto = ScalingFactor("atto", "a", 1e-18)
-zepto = ScalingFactor("zepto", "z", 1e-21)
-yocto = ScalingFactor("yocto", "y", 1e-24)
-ronto = ScalingFactor("ronto", "r", 1e-27)
-quecto = ScalingFactor("quecto", "q", 1e-30)
-
-# IEC prefixes
-yobi = ScalingFactor("yobi", "Yi", 2**80)
-zebi = ScalingFactor("zebi", "Zi", 2**70)
-exbi = ScalingFactor("exbi", "Ei", 2**60)
-pebi = ScalingFactor("pebi", "Pi", 2**50)
-tebi = ScalingFactor("tebi", "Ti", 2**40)
-gibi = ScalingFactor("gibi", "Gi", 2**30)
-mebi = ScalingFactor("mebi", "Mi", 2**20)
-kibi = ScalingFactor("kibi", "ki", 2**10)
-
-# SI base units
-second = Unit(physical_dimension=PhysicalDimension.TIME, name="second", symbol="s")
-meter = Unit(physical_dimension=PhysicalDimension.LENGTH, name="meter", symbol="m")
-gram = Unit(physical_dimension=PhysicalDimension.MASS, name="gram", symbol="g")
-ampere = Unit(physical_dimension=PhysicalDimension.CURRENT, name="ampere", symbol="A")
-kelvin = Unit(
-    physical_dimension=PhysicalDimension.TEMPERATURE,
-    name="kelvin",
-    symbol="K",
-)
-mole = Unit(
-    physical_dimension=PhysicalDimension.AMOUNT_OF_SUBSTANCE,
-    name="mole",
-    symbol="mol",
-)
-candela = Unit(
-    physical_dimension=PhysicalDimension.LUMINOUS_INTENSITY,
-    name="candela",
-    symbol="cd",
-)
-radian = Unit(
-    physical_dimension=PhysicalDimension.NONDIMENSIONAL,
-    name="radian",
-    symbol="rad",
-)
+def _build_catalogue() -> dict[str, ScalingFactor | Unit | CompositeUnit]:
+    """Construct the standard catalogue of prefixes and units from their definitions.
 
-kilogram = kilo * gram
+    Importing this module does not call this, it rehydrates the snapshot in
+    ``cubit._catalogue`` instead. Run ``python -m cubit.units`` to regenerate the
+    snapshot after changing a definition. The named units built here register
+    themselves over the rehydrated ones, so only call this in a separate process.
+    """
+    # SI prefixes
+    quetta = ScalingFactor("quetta", "Q", 1e30)
+    ronna = ScalingFactor("ronna", "R", 1e27)
+    yotta = ScalingFactor("yotta", "Y", 1e24)
+    zetta = ScalingFactor("zetta", "Z", 1e21)
+    exa = ScalingFactor("exa", "E", 1e18)
+    peta = ScalingFactor("peta", "P", 1e15)
+    tera = ScalingFactor("tera", "T", 1e12)
+    giga = ScalingFactor("giga", "G", 1e9)
+    mega = ScalingFactor("mega", "M", 1e6)
+    kilo = ScalingFactor("kilo", "k", 1e3)
+    hecto = ScalingFactor("hecto", "h", 1e2)
+    deca = ScalingFactor("deca", "da", 1e1)
+    deci = ScalingFactor("deci", "d", 1e-1)
+    centi = ScalingFactor("centi", "c", 1e-2)
+    milli = ScalingFactor("milli", "m", 1e-3)
+    micro = ScalingFactor("micro", "μ", 1e-6)
+    nano = ScalingFactor("nano", "n", 1e-9)
+    pico = ScalingFactor("pico", "p", 1e-12)
+    femto = ScalingFactor("femto", "f", 1e-15)
+    atto = ScalingFactor("atto", "a", 1e-18)
+    zepto = ScalingFactor("zepto", "z", 1e-21)
+    yocto = ScalingFactor("yocto", "y", 1e-24)
+    ronto = ScalingFactor("ronto", "r", 1e-27)
+    quecto = ScalingFactor("quecto", "q", 1e-30)
 
-turn = CompositeUnit.from_quantity(
-    2 * PI * radian,
-    name="turn",
-    symbol="turn",
-)
-cycle = unum.but(name="cycle", referent="cycle")
-disintegration = unum.but(name="disintegration", referent="disintegration")
-
-# SI derived units
-hertz = (cycle / second).but(name="hertz", symbol="Hz")
-steradian = (radian**2).but(name="steradian", symbol="sr")
-liter = (milli * meter**3).but(name="liter", symbol="L")
-newton = (kilo * gram * meter / second**2).but(name="newton", symbol="N")
-joule = (kilo * gram * meter**2 / second**2).but(name="joule", symbol="J")
-watt = (joule / second).but(name="watt", symbol="W")
-coulomb = (ampere * second).but(name="coulomb", symbol="C")
-volt = (joule / coulomb).but(name="volt", symbol="V")
-farad = (coulomb / volt).but(name="farad", symbol="F")
-ohm = (volt / ampere).but(name="ohm", symbol="Ω")
-siemens = (ohm**-1).but(name="siemens", symbol="S")
-weber = (joule / ampere).but(name="weber", symbol="Wb")
-tesla = (volt * second / meter**2).but(name="tesla", symbol="T")
-henry = (volt * second / ampere).but(name="henry", symbol="H")
-lumen = (coulomb * steradian).but(name="lumen", symbol="lm")
-lux = (lumen / meter**2).but(name="lux", symbol="lx")
-becquerel = (disintegration / second).but(name="becquerel", symbol="Bq")
-
-minute = CompositeUnit(
-    component_units=[second],
-    component_powers=[1],
-    factor=60,
-    name="minute",
-    symbol="min",
-)
-hour = CompositeUnit(
-    component_units=[second],
-    component_powers=[1],
-    factor=3600,
-    name="hour",
-    symbol="h",
-)
-barn = CompositeUnit(
-    component_units=[meter],
-    component_powers=[2],
-    factor=1e-28,
-    name="barn",
-    symbol="b",
-)
-dalton = CompositeUnit(
-    component_units=[kilogram],
-    component_powers=[2],
-    factor=1.66053906660e-27,
-    name="dalton",
-    symbol="Da",
-)
+    # IEC prefixes
+    yobi = ScalingFactor("yobi", "Yi", 2**80)
+    zebi = ScalingFactor("zebi", "Zi", 2**70)
+    exbi = ScalingFactor("exbi", "Ei", 2**60)
+    pebi = ScalingFactor("pebi", "Pi", 2**50)
+    tebi = ScalingFactor("tebi", "Ti", 2**40)
+    gibi = ScalingFactor("gibi", "Gi", 2**30)
+    mebi = ScalingFactor("mebi", "Mi", 2**20)
+    kibi = ScalingFactor("kibi", "ki", 2**10)
+
+    # SI base units
+    second = Unit(physical_dimension=PhysicalDimension.TIME, name="second", symbol="s")
+    meter = Unit(physical_dimension=PhysicalDimension.LENGTH, name="meter", symbol="m")
+    gram = Unit(physical_dimension=PhysicalDimension.MASS, name="gram", symbol="g")
+    ampere = Unit(physical_dimension=PhysicalDimension.CURRENT, name="ampere", symbol="A")
+    kelvin = Unit(
+        physical_dimension=PhysicalDimension.TEMPERATURE,
+        name="kelvin",
+        symbol="K",
+    )
+    mole = Unit(
+        physical_dimension=PhysicalDimension.AMOUNT_OF_SUBSTANCE,
+        name="mole",
+        symbol="mol",
+    )
+    candela = Unit(
+        physical_dimension=PhysicalDimension.LUMINOUS_INTENSITY,
+        name="candela",
+        symbol="cd",
+    )
+    radian = Unit(
+        physical_dimension=PhysicalDimension.NONDIMENSIONAL,
+        name="radian",
+        symbol="rad",
+    )
+
+    kilogram = kilo * gram
+
+    turn = CompositeUnit.from_quantity(
+        2 * PI * radian,
+        name="turn",
+        symbol="turn",
+    )
+    cycle = unum.but(name="cycle", referent="cycle")
+    disintegration = unum.but(name="disintegration", referent="disintegration")
+    binary_digit = unum.but(name="binary digit", referent="bit")
+
+    # SI derived units
+    hertz = (cycle / second).but(name="hertz", symbol="Hz")
+    steradian = (radian**2).but(name="steradian", symbol="sr")
+    liter = (milli * meter**3).but(name="liter", symbol="L")
+    newton = (kilo * gram * meter / second**2).but(name="newton", symbol="N")
+    joule = (kilo * gram * meter**2 / second**2).but(name="joule", symbol="J")
+    watt = (joule / second).but(name="watt", symbol="W")
+    coulomb = (ampere * second).but(name="coulomb", symbol="C")
+    volt = (joule / coulomb).but(name="volt", symbol="V")
+    farad = (coulomb / volt).but(name="farad", symbol="F")
+    ohm = (volt / ampere).but(name="ohm", symbol="Ω")
+    siemens = (ohm**-1).but(name="siemens", symbol="S")
+    weber = (joule / ampere).but(name="weber", symbol="Wb")
+    tesla = (volt * second / meter**2).but(name="tesla", symbol="T")
+    henry = (volt * second / ampere).but(name="henry", symbol="H")
+    lumen = (candela * steradian).but(name="lumen", symbol="lm")
+    lux = (lumen / meter**2).but(name="lux", symbol="lx")
+    becquerel = (disintegration / second).but(name="becquerel", symbol="Bq")
+
+    minute = CompositeUnit(
+        component_units=[second],
+        component_powers=[1],
+        factor=60,
+        name="minute",
+        symbol="min",
+    )
+    hour = CompositeUnit(
+        component_units=[second],
+        component_powers=[1],
+        factor=3600,
+        name="hour",
+        symbol="h",
+    )
+    day = CompositeUnit(
+        component_units=[second],
+        component_powers=[1],
+        factor=86400,
+        name="day",
+        symbol="d",
+    )
+    year = CompositeUnit(
+        component_units=[second],
+        component_powers=[1],
+        factor=31557600,
+        name="year",
+        symbol="a",
+    )  # Julian year, 365.25 d
+    barn = CompositeUnit(
+        component_units=[meter],
+        component_powers=[2],
+        factor=1e-28,
+        name="barn",
+        symbol="b",
+    )
+    bit = CompositeUnit(
+        component_units=[binary_digit],
+        component_powers=[1],
+        name="bit",
+        symbol="bit",
+    )
+    byte = CompositeUnit(
+        component_units=[binary_digit],
+        component_powers=[1],
+        factor=8,
+        name="byte",
+        symbol="B",
+    )
+    dalton = CompositeUnit(
+        component_units=[kilogram],
+        component_powers=[1],
+        factor=1.66053906660e-27,
+        name="dalton",
+        symbol="Da",
+    )
+
+    return {k: v for k, v in locals().items() if isinstance(v, ScalingFactor | Unit | CompositeUnit)}
+
+
+def _write_snapshot(path: str | None = None) -> None:
+    """Write the snapshot of ``_build_catalogue()`` that this module rehydrates on import.
+
+    ``path`` defaults to the ``cubit._catalogue`` module. Like ``_build_catalogue``,
+    only call this in a separate process.
+    """
+    from pathlib import Path
+
+    catalogue = _build_catalogue()
+    attr = {id(v): k for k, v in catalogue.items()}
+    prefixes = [(k, v.symbol, v.factor) for k, v in catalogue.items() if isinstance(v, ScalingFactor)]
+    base_units = [
+        (k, v.physical_dimension.name, v.name, v.symbol, v.referent, attr.get(id(v.scaling_factor), ""))
+        for k, v in catalogue.items()
+        if isinstance(v, Unit)
+    ]
+    derived_units = {
+        k: (
+            v.name,
+            v.symbol,
+            v.factor,
+            tuple(zip((attr[id(u)] for u in v.component_units), v.component_powers, strict=True)),
+            _factor_key(v.factor),
+            _factor_key(v.factor) == _factor_key(_coherent_factor(dict(v.signature))),
+        )
+        for k, v in catalogue.items()
+        if isinstance(v, CompositeUnit)
+    }
+    lines = [
+        "# generated by `python -m cubit.units` from cubit.units._build_catalogue(), do not edit",
+        "# fmt: off",
+        "# prefix: (symbol, factor)",
+        "PREFIXES = {",
+        *(f"    {k!r}: ({s!r}, {f!r})," for k, s, f in prefixes),
+        "}",
+        "# unit: (physical dimension, name, symbol, referent, prefix)",
+        "BASE_UNITS = {",
+        *(f"    {k!r}: {tuple(v)!r}," for k, *v in base_units),
+        "}",
+        "# unit: (name, symbol, factor, ((base unit, power), ...), factor key, coherent)",
+        "DERIVED_UNITS = {",
+        *(f"    {k!r}: {v!r}," for k, v in derived_units.items()),
+        "}",
+    ]
+    Path(path or _catalogue.__file__).write_text("\n".join(lines) + "\n")
+
+
+for _k, (_symbol, _factor) in _catalogue.PREFIXES.items():
+    globals()[_k] = ScalingFactor.intern(name=_k, symbol=_symbol, factor=_factor)
+
+for _k, (_dimension, _name, _symbol, _referent, _prefix) in _catalogue.BASE_UNITS.items():
+    globals()[_k] = Unit.from_snapshot(
+        physical_dimension=PhysicalDimension[_dimension],
+        name=_name,
+        symbol=_symbol,
+        referent=_referent,
+        scaling_factor=globals()[_prefix] if _prefix else uni,
+    )
+
+
+def _rehydrate(k: str) -> CompositeUnit:
+    # units are compared by identity, so two threads must not both create the same one
+    with MultitonMeta._lock:
+        if (unit := globals().get(k)) is not None:
+            return unit
+        name, symbol, factor, components, factor_key, coherent = _catalogue.DERIVED_UNITS[k]
+        unit = globals()[k] = CompositeUnit.from_snapshot(
+            component_units=tuple(globals()[u] for u, _ in components),
+            component_powers=tuple(p for _, p in components),
+            name=name,
+            symbol=symbol,
+            factor=factor,
+            factor_key=factor_key,
+            coherent=coherent,
+        )
+        return unit
+
+
+def _rehydrate_all() -> None:
+    for k in _catalogue.DERIVED_UNITS:
+        if k not in globals():
+            _rehydrate(k)
+
+
+def __getattr__(name: str) -> CompositeUnit:
+    # named derived units are only created on first use
+    if name not in _catalogue.DERIVED_UNITS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return _rehydrate(name)
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | _catalogue.DERIVED_UNITS.keys())
+
+
+defer_units(_rehydrate_all)
+
+if __name__ == "__main__":
+    _write_snapshot()
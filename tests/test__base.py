@@ -31,3 +31,23 @@ def test_MultitonMeta_multitonicity():
 
         snowflakes = [a_0, a_2, a_5, a_6, a_7, a_9, a_11, a_12]
         assert len(set(snowflakes)) == len(snowflakes)
+
+
+def test_MultitonMeta_is_thread_safe():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    barrier = threading.Barrier(8)
+
+    class Slow(metaclass=MultitonMeta):
+        def __init__(self, key):
+            time.sleep(0.01)  # widen the window between the lookup and the insert
+
+    def create(_):
+        barrier.wait()
+        return Slow("key")
+
+    with ThreadPoolExecutor(8) as pool:
+        instances = list(pool.map(create, range(8)))
+    assert all(instance is instances[0] for instance in instances)
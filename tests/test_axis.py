@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cubit import spectral, units
+from cubit.axis import LinearAxis
+
+
+def test_conversion_slicing_and_lookup_keep_the_axis_linear():
+    ms = units.milli * units.second
+    time = LinearAxis(0, 1e-4 * units.second, 4096)
+    assert time[10].value == pytest.approx(1e-3)
+    assert time.index_of(1e-3 * units.second) == 10
+    np.testing.assert_array_equal(time.index_of(np.array([0.1, 0.2]) * ms), [1, 2])
+    in_ms = time.to(ms)
+    assert in_ms.step == pytest.approx(0.1)
+    np.testing.assert_allclose(in_ms.base_value, time.base_value)
+    flipped = time[::-2]
+    assert isinstance(flipped, LinearAxis)
+    np.testing.assert_allclose(np.asarray(flipped), np.asarray(time)[::-2])
+    assert time.flip().flip() == time
+    with pytest.raises(KeyError):
+        time.index_of(1 * units.second)
+    with pytest.raises(TypeError):
+        time.to(units.meter)
+    with pytest.raises(IndexError):
+        time[4096]
+
+
+def test_frequency_axis_and_chemical_shift():
+    spectrum = spectral.fft(np.ones(1024) * units.volt, 1e-4 * units.second)
+    frequency = LinearAxis.from_quantity(spectrum.frequency)
+    assert frequency.unit is units.hertz
+    np.testing.assert_allclose(np.asarray(frequency), spectrum.frequency.value)
+    reference = 600e6 * units.hertz
+    shift = (frequency + reference).to_ppm(reference)
+    assert not shift.unit.signature
+    assert shift.index_of(0.0) == 512
+    np.testing.assert_allclose(shift.from_ppm(reference).value, frequency.value + 600e6)
+    with pytest.raises(ValueError, match="evenly spaced"):
+        LinearAxis.from_quantity(np.array([0.0, 1.0, 3.0]) * units.hertz)
+
+
+def test_pandas_index():
+    assert LinearAxis(0, 2, 5).to_index().equals(pd.RangeIndex(0, 10, 2))
+    series = pd.Series(np.arange(3.0), index=LinearAxis(0.5, 0.25, 3).to_index("t"))
+    assert list(series.index) == [0.5, 0.75, 1.0]
+
+
+def test_single_point_axis_and_array_scaling():
+    assert list(LinearAxis(5, 0, 1).to_index()) == [5]
+    assert len(LinearAxis(5, 0, 0).to_index()) == 0
+    axis = LinearAxis(0, 1e-4 * units.second, 8)
+    assert (axis * (2 * units.hertz)).step == pytest.approx(2e-4)
+    with pytest.raises(TypeError, match="scalar"):
+        axis * (np.arange(8.0) * units.hertz)
+    with pytest.raises(TypeError, match="scalar"):
+        axis / (np.arange(8.0) * units.hertz)
+    with pytest.raises(TypeError, match="scalar"):
+        axis + np.arange(8.0) * units.second
+
+
+def test_numpy_scalars_and_reflected_subtraction():
+    axis = LinearAxis(1, 2, 4)
+    assert axis * np.float64(2) == np.int64(2) * axis == LinearAxis(2, 4, 4)
+    assert axis / np.float32(2) == LinearAxis(0.5, 1, 4)
+    assert list((10 - axis).value) == [9, 7, 5, 3]
+    time = LinearAxis(0, 1e-4 * units.second, 4)
+    np.testing.assert_allclose((1e-3 * units.second - time).value, [1e-3, 9e-4, 8e-4, 7e-4])
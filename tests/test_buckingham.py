@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cubit import units
+from cubit.buckingham import _nullspace, dimension_matrix, nondimensionalize, pi_groups
+from cubit.system import Quantity
+
+PIPE_FLOW = {
+    "rho": units.kilogram / units.meter**3,
+    "v": units.meter / units.second,
+    "D": units.meter,
+    "mu": units.newton * units.second / units.meter**2,
+    "dp": units.newton / units.meter**2,
+}
+
+
+def test_pi_groups_are_dimensionless():
+    groups = pi_groups(PIPE_FLOW)
+    assert [g.exponents for g in groups] == [
+        {"rho": -1, "v": -1, "D": -1, "mu": 1},
+        {"rho": -1, "v": -2, "dp": 1},
+    ]
+    matrix = np.array(dimension_matrix(PIPE_FLOW))
+    for g in groups:
+        assert not (matrix @ np.array([g.exponents.get(k, 0) for k in PIPE_FLOW])).any()
+
+
+def test_bases_are_cached_across_units():
+    _nullspace.cache_clear()
+    pi_groups(PIPE_FLOW)
+    groups = pi_groups(PIPE_FLOW | {"D": units.milli * units.meter})
+    assert _nullspace.cache_info().hits == 1
+    assert groups[0].factor == pytest.approx(1e3)
+
+
+def test_nondimensionalize_columns():
+    rng = np.random.default_rng(0)
+    columns = {k: rng.uniform(-2, 3, 100) for k in PIPE_FLOW}
+    columns["D"][0] = 0
+    frame = pd.DataFrame(columns)
+    result, groups = nondimensionalize(frame, PIPE_FLOW)
+    assert list(result.columns) == [str(g) for g in groups]
+    expected = frame.mu / (frame.rho * frame.v * frame.D)
+    np.testing.assert_allclose(result.iloc[:, 0], expected, rtol=1e-12)
+
+    quantities = {k: Quantity(v, PIPE_FLOW[k]) for k, v in columns.items()}
+    array, _ = nondimensionalize(quantities)
+    np.testing.assert_allclose(array, result.to_numpy(), rtol=1e-12)
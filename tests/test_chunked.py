@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from cubit import units
+from cubit.chunked import evaluate
+from cubit.memmap import QuantityMemmap
+from cubit.physical_data import ELEMENTARY_CHARGE, PROTON_MASS
+
+MHZ = units.mega * units.second**-1
+
+
+def larmor(field):
+    return ELEMENTARY_CHARGE * field / (2 * PROTON_MASS)
+
+
+@pytest.mark.parametrize(("workers", "processes"), [(1, False), (3, False), (2, True)])
+def test_evaluate_matches_quantity_arithmetic(workers, processes):
+    fields = np.linspace(0, 20, 10_001) * units.tesla
+    result = evaluate(larmor, MHZ, field=fields, block_size=1000, workers=workers, processes=processes)
+    expected = larmor(fields)
+    assert result.unit.signature == expected.unit.signature
+    assert result.value == pytest.approx(expected.value * (expected.unit.factor / MHZ.factor))
+
+
+def test_evaluate_memmap_to_memmap(tmp_path):
+    fields = QuantityMemmap.save(tmp_path / "field", np.linspace(1, 2, 5000) * units.milli * units.tesla)
+    out = QuantityMemmap.create(tmp_path / "larmor", 5000, units.second**-1, dtype="float32")
+    evaluate(larmor, field=QuantityMemmap.open(tmp_path / "field"), out=out, block_size=700, workers=2, processes=True)
+    expected = larmor(fields.read())
+    assert out.read().value == pytest.approx(expected.value * expected.unit.factor, rel=1e-6)
+
+
+def test_evaluate_checks_units_before_reading():
+    fields = np.ones(10) * units.tesla
+    with pytest.raises(TypeError):
+        evaluate(larmor, units.meter, field=fields)
+    with pytest.raises(ValueError):
+        evaluate(lambda a, b: a + b, a=np.ones(3) * units.meter, b=np.ones(4) * units.meter)
+    offset = evaluate(lambda a, b: a + b, a=np.zeros(3) * units.meter, b=2 * units.meter, workers=1)
+    assert offset.value.tolist() == [2, 2, 2]
+
+
+def test_evaluate_with_array_constants_and_colliding_names():
+    weights = np.array([1.0, 2.0, 3.0]) * units.meter
+    fields = np.ones((1000, 3)) * units.tesla
+    result = evaluate(lambda field: field * weights, field=fields, block_size=100, workers=2, processes=True)
+    assert result.value[0].tolist() == [1.0, 2.0, 3.0]
+    with pytest.raises(TypeError, match="out"):
+        evaluate(lambda field, out: field, field=fields, out=None)
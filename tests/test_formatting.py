@@ -0,0 +1,35 @@
+import numpy as np
+
+from cubit import units
+from cubit.formatting import format_quantities, format_quantity
+
+
+def test_si_prefixes_per_value():
+    values = np.array([1500, 0.002, 4.2e7, 0, -999.96, 999.4, np.nan])
+    assert format_quantities(values * units.hertz) == [
+        "1.5 kHz",
+        "2 mHz",
+        "42 MHz",
+        "0 Hz",
+        "-1 kHz",
+        "999 Hz",
+        "nan Hz",
+    ]
+    assert format_quantities(np.array([1500, 0.002]) * units.kilogram) == ["1.5 Mg", "2 g"]
+    assert format_quantities(np.array([1500, 0.002]) * units.meter / units.second) == ["1.5 km s^-1", "2 mm s^-1"]
+    assert format_quantities(np.array([1500.0]) * units.meter**2) == ["1.5e+03 m^2"]
+    assert format_quantity(3 * units.kilogram * units.meter**2 / units.second**2) == "3 J"
+    assert format_quantity(12345.678 * units.joule, precision=5) == "12.346 kJ"
+
+
+def test_iec_prefixes_for_data_units():
+    sizes = np.array([1, 1023, 1024, 1.5 * 2**20]) * units.byte
+    assert format_quantities(sizes) == ["1 B", "0.999 kiB", "1 kiB", "1.5 MiB"]
+    assert format_quantities(sizes, binary=False) == ["1 B", "1.02 kB", "1.02 kB", "1.57 MB"]
+
+
+def test_formats_large_tables():
+    values = np.random.default_rng(0).lognormal(0, 10, 1_000_000) * units.watt
+    formatted = format_quantities(values)
+    assert len(formatted) == 1_000_000
+    assert all(s.endswith("W") for s in formatted[:100])
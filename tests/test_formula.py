@@ -0,0 +1,96 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from cubit import physical_data, units
+from cubit.formula import (
+    average_masses,
+    composition_columns,
+    composition_matrix,
+    isotopic_distribution,
+    isotopic_distributions,
+    monoisotopic_masses,
+    parse_formula,
+)
+
+
+def test_parse_formula():
+    assert parse_formula("C6H12O6") == {"C": 6, "H": 12, "O": 6}
+    assert parse_formula("Ca(OH)2") == {"Ca": 1, "O": 2, "H": 2}
+    assert parse_formula("[13C]H4") == {("C", 13): 1, "H": 4}
+    assert parse_formula("CH3(CH2)2CH3") == {"C": 4, "H": 10}
+    for formula in ["", "c", "C(", ")C", "2C", "C[13]"]:
+        with pytest.raises(ValueError):
+            parse_formula(formula)
+
+
+def _enumerate(formula, resolution):
+    # brute-force reference: every combination of isotopes, binned like the FFT grid
+    natural = {}
+    for symbol in parse_formula(formula):
+        isotopes = [i for (s, _), i in physical_data.ISOTOPES.items() if s == symbol and i.natural_abundance > 0]
+        lightest = min(i.monoisotopic_mass.value for i in isotopes)
+        total = sum(i.natural_abundance for i in isotopes)
+        natural[symbol] = [
+            (m, i.natural_abundance / total, round((m - lightest) / resolution))
+            for i in isotopes
+            for m in [i.monoisotopic_mass.value]
+        ]
+    atoms = [natural[s] for s, n in parse_formula(formula).items() for _ in range(n)]
+    peaks = {}
+    for combination in itertools.product(*atoms):
+        abundance = math.prod(a for _, a, _ in combination)
+        mass = sum(m for m, _, _ in combination)
+        b = sum(b for _, _, b in combination)
+        total, weighted = peaks.get(b, (0, 0))
+        peaks[b] = (total + abundance, weighted + abundance * mass)
+    return sorted((w / a, a) for a, w in peaks.values() if a > 1e-9)
+
+
+@pytest.mark.parametrize(("formula", "resolution"), [("C2H6O", 1.0), ("CH4S", 0.01), ("C3Cl2", 0.001)])
+def test_isotopic_distribution_matches_enumeration(formula, resolution):
+    expected = np.array(_enumerate(formula, resolution))
+    distribution = isotopic_distribution(formula, resolution, threshold=1e-9)
+    assert distribution.mass.unit is units.dalton
+    assert distribution.mass.value == pytest.approx(expected[:, 0], rel=1e-9)
+    assert distribution.abundance == pytest.approx(expected[:, 1], abs=1e-12)
+
+
+def test_isotopic_distribution_labels_and_batches():
+    labelled = isotopic_distribution("[13C]H4")
+    assert labelled.mass.value[0] == pytest.approx(13.00335484 + 4 * 1.007825032)
+    assert isotopic_distribution("C6H12O6", 0.5 * units.dalton).abundance.sum() == pytest.approx(1, abs=1e-5)
+    formulas = ["H2O", "C6H12O6", "C254H377N65O75S6", {"C": 1, "O": 2}]
+    for batched, formula in zip(isotopic_distributions(formulas), formulas, strict=True):
+        single = isotopic_distribution(formula)
+        assert batched.abundance == pytest.approx(single.abundance)
+        assert batched.mass.value == pytest.approx(single.mass.value)
+    with pytest.raises(ValueError):
+        isotopic_distribution("Tc")
+    with pytest.raises(ValueError):
+        isotopic_distribution("H2O", resolution=0)
+
+
+def test_batched_masses():
+    formulas = ["C6H12O6", "[13C]H4", "H2O", "Ca(OH)2"]
+    monoisotopic = monoisotopic_masses(formulas)
+    assert monoisotopic.unit is units.dalton
+    assert monoisotopic.value[:3] == pytest.approx([180.0633881, 13.00335484 + 4 * 1.007825032, 18.01056468])
+    assert average_masses(formulas).value == pytest.approx([180.156, 17.035, 18.015, 74.093], abs=1e-3)
+    matrix = composition_matrix(formulas)
+    assert matrix.shape == (4, len(composition_columns()))
+    assert matrix.toarray().sum(axis=1).tolist() == [24, 5, 3, 5]
+    assert average_masses(matrix).value == pytest.approx(average_masses(formulas).value)
+    assert average_masses([]).value.shape == (0,)
+    with pytest.raises(ValueError):
+        average_masses(["Tc"])
+    with pytest.raises(ValueError):
+        average_masses(["Xy"])
+
+
+def test_empty_composition_has_zero_mass():
+    assert parse_formula("C0") == {}
+    assert composition_matrix(["C0", "H2"]).toarray().sum(axis=1).tolist() == [0, 2]
+    assert monoisotopic_masses(["C0", "H2O"]).value[0] == 0
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cubit import ingest
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_parse_spin():
+    spins = pd.Series(["1/2+", "(3/2-)", "2+", "1-", "unknown", "14- or 15-"])
+    parsed = ingest.parse_spin(spins)
+    assert parsed.iloc[:4].tolist() == [0.5, 1.5, 2, 1]
+    assert np.isnan(parsed.iloc[4])
+    assert parsed.iloc[5] == repr("14- or 15")
+
+
+def test_parse_half_life():
+    parsed = ingest.parse_half_life(pd.Series(["10.6 m", "842 ms", "2 h", "stable"]))
+    assert parsed.dtype == float
+    assert parsed.tolist() == pytest.approx([636.0, 0.842, 7200.0, np.inf])
+    assert ingest.parse_half_life(pd.Series(["<60 ps"])).iloc[0] == "<60 ps"
+
+
+def test_remove_error():
+    parsed = ingest.remove_error(pd.Series(["+2.79284734(3)", "-0.0406", None]))
+    assert parsed.iloc[:2].tolist() == [2.79284734, -0.0406]
+    assert np.isnan(parsed.iloc[2])
+
+
+def test_rebuild_matches_committed_data(tmp_path):
+    out = tmp_path / "nuclear_moments.csv"
+    ingest.rebuild_nuclear_moments(ROOT / "scripts" / "indc-nds-0658.csv", out)
+    assert out.read_text() == (ROOT / "data" / "nuclear_moments.csv").read_text()
+
+
+def test_rebuild_is_incremental(tmp_path):
+    rows = ingest.read_indc_nds_0658(ROOT / "scripts" / "indc-nds-0658.csv")
+    out = tmp_path / "nuclear_moments.csv"
+
+    assert ingest.rebuild(rows, ingest.clean_indc_nds_0658, out) == len(rows)
+    assert ingest.rebuild(rows, ingest.clean_indc_nds_0658, out) == 0
+
+    rows.loc[rows.index[1], "half_life"] = "2 h"
+    assert ingest.rebuild(rows, ingest.clean_indc_nds_0658, out) == 1
+    assert pd.read_csv(out)["half_life_s"].iloc[1] == "7200.0"
+
+    assert ingest.rebuild(rows, ingest.clean_indc_nds_0658, out, full=True) == len(rows)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from cubit import physical_data, units
+from cubit.larmor import LarmorIndex, larmor_index, match_frequencies, nuclear_states
+
+
+def test_ground_states_agree_with_isotopes():
+    h1 = physical_data.ISOTOPES[("H", 1)]
+    (state,) = [s for s in nuclear_states() if s.isotope is h1]
+    assert state.gyromagnetic_ratio == pytest.approx(h1.gyromagnetic_ratio.value)
+    assert state.spin == 0.5
+    # the sign of a ratio follows the moment whether the spin is half-integer or integer
+    h2 = physical_data.ISOTOPES[("H", 2)]
+    assert h2.spin == 1
+    assert h1.gyromagnetic_ratio.value > 0 and h2.gyromagnetic_ratio.value > 0
+    assert any(s.energy_level_keV > 0 for s in nuclear_states())
+
+
+def test_match_agrees_with_scan():
+    field = 14.1 * units.tesla
+    index = LarmorIndex(field)
+    frequencies = index.frequencies.value
+    observed = np.random.default_rng(2).uniform(1e6, 700e6, 500)
+    pairs = index.match_pairs(observed * units.hertz, window=200 * units.kilo * units.hertz)
+    expected = {(i, j) for i, f in enumerate(observed) for j in np.flatnonzero(np.abs(frequencies - f) <= 2e5)}
+    assert set(zip(pairs.observation.tolist(), pairs.state.tolist(), strict=True)) == expected
+
+
+def test_match_frequencies_cached_per_field():
+    larmor_index.cache_clear()
+    c13 = physical_data.ISOTOPES[("C", 13)]
+    (matches,) = match_frequencies([150.94e6], 14.1 * units.tesla, window=50 * units.kilo * units.hertz)
+    assert matches[-1].isotope is c13
+    match_frequencies([150.94e6], 14100 * units.milli * units.tesla, ppm=1)
+    assert larmor_index.cache_info().hits == 1
+    with pytest.raises(TypeError):
+        match_frequencies([1.0], 1 * units.second, ppm=1)
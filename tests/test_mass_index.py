@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from cubit import physical_data, units
+from cubit.mass_index import MassIndex, match_masses
+
+
+def test_match_isotopes_within_ppm():
+    observed = np.array([12.0, 13.00336, 5.0]) * units.dalton
+    assert match_masses(observed, ppm=1) == [
+        [physical_data.ISOTOPES[("C", 12)]],
+        [physical_data.ISOTOPES[("C", 13)]],
+        [],
+    ]
+    # plain numbers are in dalton, other mass units are converted
+    assert match_masses([2.0141], ppm=50) == [[physical_data.ISOTOPES[("H", 2)]]]
+    assert match_masses(13.00336e-3 * units.kilo * units.dalton, ppm=1) == [[physical_data.ISOTOPES[("C", 13)]]]
+
+
+def test_match_agrees_with_scan():
+    index = MassIndex.isotopes()
+    observed = np.random.default_rng(1).uniform(1, 250, 2000)
+    masses = index.masses.value
+    pairs = index.match_pairs(observed, ppm=20)
+    expected = {
+        (i, j) for i, m in enumerate(observed) for j in np.flatnonzero(np.abs(masses - m) <= m * 20e-6)
+    }
+    assert set(zip(pairs.observation.tolist(), pairs.candidate.tolist(), strict=True)) == expected
+    assert np.all(np.abs(pairs.error_ppm) <= 20)
+
+
+def test_match_formulas_nearest_first():
+    index = MassIndex.formulas(["C6H12O6", "C2H6O", "CH4", "[13C]H4", "H2O", "NH3", "OH"])
+    assert index.match([180.0634, 17.0347, 1.0], ppm=5) == [["C6H12O6"], ["[13C]H4"], []]
+    assert index.match([17.0], ppm=3000) == [["OH", "NH3", "[13C]H4"]]
+    with pytest.raises(TypeError):
+        index.match(np.array([1.0]) * units.second)
@@ -0,0 +1,46 @@
+import json
+
+import numpy as np
+import pytest
+
+from cubit import units
+from cubit.memmap import QuantityMemmap
+
+
+def test_save_and_open_round_trip(tmp_path):
+    path = tmp_path / "signal.f32"
+    values = np.arange(12.0).reshape(4, 3)
+    QuantityMemmap.save(path, values * units.milli * units.volt, dtype="float32")
+    header = json.loads((tmp_path / "signal.f32.json").read_text())
+    assert header["shape"] == [4, 3]
+    assert header["dtype"] == "<f4"
+
+    array = QuantityMemmap.open(path)
+    assert array.shape == (4, 3)
+    assert array.dtype == np.float32
+    assert array.unit == (values * units.milli * units.volt).unit
+    assert np.array_equal(array.read().value, values)
+    assert array.to(units.volt)[1:3, 0].read().value == pytest.approx([0.003, 0.006])
+    assert array.to(units.volt).read().unit is units.volt
+
+
+def test_slices_are_lazy_views(tmp_path):
+    path = tmp_path / "times.f64"
+    array = QuantityMemmap.create(path, 1000, units.second)
+    array[10:20] = np.ones(10) * units.milli * units.second
+    view = array[::2]
+    assert isinstance(view.data, np.memmap)
+    assert np.shares_memory(view.data, array.data)
+    array.flush()
+
+    reopened = QuantityMemmap.open(path, mode="r+")
+    assert reopened[10:20].read().value == pytest.approx(np.full(10, 1e-3))
+    chunks = list(reopened.to(units.milli * units.second).chunks(300))
+    assert [len(c.value) for c in chunks] == [300, 300, 300, 100]
+    assert sum(c.value.sum() for c in chunks) == pytest.approx(10)
+    with pytest.raises(TypeError):
+        reopened.to(units.meter)
+    with pytest.raises(TypeError):
+        reopened[0:1] = np.ones(1) * units.meter
+    with pytest.raises(ValueError):
+        QuantityMemmap.create(tmp_path / "ints", 10, units.second, dtype="int32")
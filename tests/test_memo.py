@@ -0,0 +1,77 @@
+import functools
+import time
+from fractions import Fraction
+
+import numpy as np
+
+import cubit
+from cubit import units
+from cubit.physical_data import ISOTOPES
+
+
+def test_equivalent_quantities_share_an_entry():
+    calls = []
+
+    @cubit.memoize
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    double(1000 * units.meter)
+    double(1 * units.kilo * units.meter)
+    double(0.1 * units.kilo * units.meter)
+    double(100 * units.meter)
+    double(np.array([1.0, 2.0]) * units.kilo * units.meter)
+    double(np.array([1000.0, 2000.0]) * units.meter)
+    assert len(calls) == 3
+    assert double.cache_info()[:2] == (3, 3)
+
+    # Quantity equality is exact on base values, which unit conversion rounds
+    plain = functools.lru_cache(lambda x: x)
+    plain(1001 * units.meter)
+    plain(1.001 * units.kilo * units.meter)
+    assert plain.cache_info().misses == 2
+
+
+def test_tolerance_lru_and_ttl():
+    @cubit.memoize(rel_tol=1e-6, maxsize=2)
+    def identity(x):
+        return x
+
+    assert identity(1.0) == identity(1.0 + 1e-12) == 1.0
+    identity(2.0)
+    identity(3.0)
+    assert identity.cache_info().evictions == 1
+    assert identity.cache_info().currsize == 2
+
+    @cubit.memoize(ttl=0.01)
+    def now(_):
+        return time.monotonic()
+
+    first = now(1)
+    assert now(1) == first
+    time.sleep(0.02)
+    assert now(1) != first
+
+
+def test_large_ints_are_keyed_exactly():
+    @cubit.memoize
+    def identity(x):
+        return x
+
+    assert identity(2**49) == 2**49
+    assert identity(2**49 + 1) == 2**49 + 1
+    assert identity(1700000000000000000) == 1700000000000000000
+    assert identity(1700000000000000001) == 1700000000000000001
+    assert identity(Fraction(1, 3)) == Fraction(1, 3)
+    assert identity(Fraction(1, 3) + Fraction(1, 10**20)) != Fraction(1, 3)
+    assert identity.cache_info().misses == 6
+
+
+def test_methods_of_records():
+    larmor = cubit.memoize(type(ISOTOPES[("C", 13)]).larmor_freq_given_1H)
+    c13 = ISOTOPES[("C", 13)]
+    a = larmor(c13, 600 * units.mega * units.hertz)
+    b = larmor(c13, 0.6 * units.giga * units.hertz)
+    assert a is b
+    assert larmor.cache_info().hits == 1
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from cubit import units
+from cubit.mixed import MixedQuantities, unit_code, unit_of
+
+
+def test_unit_codes_are_interned():
+    assert unit_code(units.hertz) == unit_code(units.hertz)
+    assert unit_of(unit_code(units.hertz)) is units.hertz
+    assert unit_code(units.kilo * units.hertz) != unit_code(units.hertz)
+    assert unit_code(units.joule) == unit_code(units.kilogram * units.meter**2 / units.second**2)
+
+
+def test_new_codes_are_usable_from_other_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    def convert(i):
+        unit = units.meter ** (i % 7 + 2) * units.second ** -(i % 5 + 2)
+        mixed = MixedQuantities.from_quantities([2.0 * unit])
+        return mixed.to(unit).value[0]
+
+    with ThreadPoolExecutor(8) as pool:
+        assert list(pool.map(convert, range(200))) == [2.0] * 200
+
+
+def test_normalize_and_group_mixed_units():
+    readings = [1 * units.hertz, 2 * units.kilo * units.hertz, 3 * units.hertz, 4 * units.mega * units.hertz]
+    mixed = MixedQuantities.from_quantities(readings)
+    assert mixed.codes.dtype == np.uint16
+    assert mixed.to(units.hertz).value == pytest.approx([1, 2000, 3, 4e6])
+    assert mixed.to(units.kilo * units.hertz).value == pytest.approx([1e-3, 2, 3e-3, 4000])
+    groups = mixed.group_by_unit()
+    assert groups[units.hertz].tolist() == [0, 2]
+    assert len(groups) == 3
+    assert mixed[1] == readings[1]
+    assert list(mixed[::2]) == readings[::2]
+    with pytest.raises(TypeError):
+        mixed.to(units.second)
+
+
+def test_from_values_with_unit_column():
+    mixed = MixedQuantities.from_values(
+        np.array([300.0, 4.2, 77.0]), [units.kelvin, units.milli * units.kelvin], np.array([0, 1, 0])
+    )
+    assert mixed.to(units.kelvin).value == pytest.approx([300, 0.0042, 77])
+    assert len(mixed.units()) == 2
@@ -1,3 +1,13 @@
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cubit import physical_data
+
 # import pytest
 #
 # from cubit import physical_data, units
@@ -26,3 +36,43 @@
 
 # TODO: make CompositeUnit store all component units in base units
 # TODO: make CompositeUnit fold all scaling factors into one multiplier and store preferred printing units
+
+
+def test_ready_loads_tables():
+    asyncio.run(physical_data.ready())
+    assert "ISOTOPES" in vars(physical_data)
+    assert physical_data.ISOTOPES[("H", 1)].element is physical_data.ELEMENTS["H"]
+
+
+def test_preload_is_idempotent():
+    physical_data.preload()
+    physical_data.preload()
+    assert physical_data.nmr_active_isotopes("H") == [physical_data.ISOTOPES[("H", 1)], physical_data.ISOTOPES[("H", 2)]]
+
+
+def test_nuclear_moments_include_excited_states():
+    states = [r for r in physical_data.NUCLEAR_MOMENTS if (r["symbol"], r["A"]) == ("H", 1)]
+    assert states[0]["spin"] == physical_data.ISOTOPES[("H", 1)].spin
+    assert any(r["energy_level_keV"] > 0 for r in physical_data.NUCLEAR_MOMENTS)
+
+
+def test_records_are_interned_and_immutable():
+    h1 = physical_data.ISOTOPES[("H", 1)]
+    assert physical_data.Isotope(physical_data.ELEMENTS["H"], 1, 0, 0, 0, 0, 0, 0) is h1
+    assert physical_data.Element("H", "hydrogen", 1) is physical_data.ELEMENTS["H"]
+    assert hash(h1) == hash((physical_data.ELEMENTS["H"], 1))
+    assert {h1: 1}[physical_data.ISOTOPES[("H", 1)]] == 1
+    with pytest.raises(AttributeError):
+        h1.spin = 0
+
+
+def test_tables_load_without_pandas():
+    script = (
+        "import sys\n"
+        "sys.modules['pandas'] = None\n"
+        "from cubit import physical_data\n"
+        "print(physical_data.ISOTOPES[('C', 13)].spin, physical_data.ELEMENTS['C'].atomic_number)\n"
+    )
+    env = os.environ | {"PYTHONPATH": str(Path(physical_data.__file__).parent.parent)}
+    run = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    assert run.stdout.split() == ["0.5", "6"]
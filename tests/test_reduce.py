@@ -0,0 +1,36 @@
+import pytest
+
+from cubit import reduce, units
+
+
+def test_builtin_sum_of_compatible_quantities():
+    total = sum([1 * units.kilo * units.meter, 500 * units.meter])
+    assert total.value == pytest.approx(1.5)
+    assert 2 * units.meter + 3 * units.meter == 5 * units.meter
+    with pytest.raises(TypeError):
+        sum([1 * units.meter, 1 * units.second])
+
+
+def test_reductions_mixed_units():
+    readings = [1 * units.kilo * units.meter, 500 * units.meter, 2 * units.kilo * units.meter]
+    assert reduce.sum(readings).value == pytest.approx(3.5)
+    assert reduce.sum(readings, unit=readings[1].unit).value == pytest.approx(3500)
+    assert reduce.mean(readings).value == pytest.approx(3.5 / 3)
+    assert reduce.min(readings).value == pytest.approx(0.5)
+    assert reduce.max(readings).value == pytest.approx(2)
+    assert reduce.max(readings).unit is readings[0].unit
+
+
+def test_reduce_empty_and_incompatible():
+    with pytest.raises(ValueError):
+        reduce.sum([])
+    assert reduce.sum([], unit=units.joule).value == 0
+    with pytest.raises(TypeError):
+        reduce.sum([1 * units.second], unit=units.joule)
+
+
+def test_reduce_into_plain_unit():
+    total = reduce.sum([1 * units.second, 2 * units.second], unit=units.second)
+    assert total.value == pytest.approx(3)
+    assert total.unit is units.second.as_composite()
+    assert reduce.mean([1 * units.kilo * units.meter], unit=units.meter).value == pytest.approx(1000)
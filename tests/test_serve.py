@@ -0,0 +1,124 @@
+import asyncio
+import socket
+import stat
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from cubit import serve as serve_module
+from cubit.serve import Client, Coalescer, conversion_factor, convert_batch, default_socket, parse_unit, serve
+
+
+def test_parse_unit():
+    assert parse_unit("km/h").factor == pytest.approx(1 / 3.6)
+    assert parse_unit("kg m^2 s^-2").signature == parse_unit("J").signature
+    assert parse_unit("kilometer").factor == 1000
+    assert conversion_factor("MiB", "bit") == 8 * 2**20
+    with pytest.raises(ValueError, match="unknown unit"):
+        parse_unit("furlong")
+    with pytest.raises(ValueError, match="cannot be converted"):
+        conversion_factor("m", "s")
+
+
+def test_convert_batch_handles_empty_lists():
+    assert convert_batch([1.0, [], [2.0, 3.0], []], "km", "m") == [1000.0, [], [2000.0, 3000.0], []]
+    assert convert_batch([[], [1.0]], "km", "m") == [[], [1000.0]]
+    with pytest.raises(ValueError, match="list of numbers"):
+        convert_batch([1.0, "x"], "km", "m")
+
+
+def test_failing_group_does_not_block_later_groups():
+    async def run():
+        coalescer = Coalescer(window=60)
+        good = coalescer.submit(1.0, "km", "m")
+        bad = coalescer.submit(1.0, "km^99999999", "m")
+        good2 = coalescer.submit(1.0, "h", "s")
+        coalescer.flush()
+        assert good.done() and bad.done() and good2.done()
+        return await good, bad.exception(), await good2
+
+    good, error, good2 = asyncio.run(run())
+    assert (good, good2) == (1000.0, 3600.0)
+    assert isinstance(error, OverflowError)
+
+
+def test_requests_are_coalesced(tmp_path, monkeypatch):
+    path = str(tmp_path / "cubit.sock")
+    coalescers = []
+
+    class RecordingCoalescer(Coalescer):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            coalescers.append(self)
+
+    monkeypatch.setattr(serve_module, "Coalescer", RecordingCoalescer)
+
+    async def run():
+        server = await serve(path, window=0.01)
+        async with server:
+            client = await Client.connect(path)
+            requests = [(float(i), "km", "m") for i in range(50)] + [([1.0, 2.0], "h", "s")]
+            results = await asyncio.gather(*(client.convert(*r) for r in requests))
+            batches = coalescers[0].batches
+            # a bad value fails only its own request, not the others converted with it
+            mixed = await asyncio.gather(
+                client.convert(1.0, "km", "m"),
+                client.convert("x", "km", "m"),
+                client.convert([], "km", "m"),
+                return_exceptions=True,
+            )
+            with pytest.raises(ValueError, match="cannot be converted"):
+                await client.convert(1.0, "m", "s")
+            # a reply without a matching request does not stop the client
+            client._writer.write(b"not json\n")
+            assert await client.convert(2.0, "km", "m") == 2000.0
+            await client.close()
+            return results, batches, mixed
+
+    results, batches, mixed = asyncio.run(run())
+    assert results[:50] == [1000.0 * i for i in range(50)]
+    assert results[50] == [3600.0, 7200.0]
+    assert 2 <= batches <= 4  # one per unit pair, unless a window ends mid-way
+    assert mixed[0] == 1000.0
+    assert isinstance(mixed[1], ValueError)
+    assert mixed[2] == []
+
+
+def test_default_socket_is_private(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket() == str(tmp_path / "cubit.sock")
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    path = Path(default_socket())
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+    path.parent.chmod(0o755)
+    with pytest.raises(PermissionError):
+        default_socket()
+
+
+def test_serve_replaces_only_stale_sockets(tmp_path):
+    path = str(tmp_path / "cubit.sock")
+
+    async def run():
+        server = await serve(path)
+        with pytest.raises(FileExistsError, match="already listening"):
+            await serve(path)
+        server.close()
+        await server.wait_closed()
+        # a socket file without a listener, as left by a server that was killed
+        if not Path(path).exists():  # Python >= 3.13 removes it on close
+            stale = socket.socket(socket.AF_UNIX)
+            stale.bind(path)
+            stale.close()
+        assert stat.S_ISSOCK(Path(path).lstat().st_mode)
+        server = await serve(path)
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+    planted = tmp_path / "planted"
+    planted.write_text("")
+    with pytest.raises(FileExistsError, match="not a socket"):
+        asyncio.run(serve(str(planted)))
+    assert planted.exists()
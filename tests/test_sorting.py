@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from cubit import sorting, units
+
+
+def test_quantity_ordering():
+    assert 999 * units.milli * units.second < 1 * units.second
+    assert 2 * units.minute > 119 * units.second
+    assert 60 * units.second >= 1 * units.minute
+    assert 1 * units.hour <= 3600 * units.second
+    with pytest.raises(TypeError):
+        assert 1 * units.second < 1 * units.meter
+
+
+def test_equality_agrees_with_ordering():
+    second, minute = 60 * units.second, 1 * units.minute
+    assert second <= minute and second >= minute and second == minute
+    assert hash(second) == hash(minute)
+    assert len({second, minute, 61 * units.second}) == 2
+    assert 1 * units.second != 1 * units.meter
+    assert 1 * units.second != 1.001 * units.second
+
+
+def test_sort_mixed_units():
+    times = [2 * units.minute, 5 * units.second, 300 * units.milli * units.second, 1 * units.minute]
+    assert list(sorting.argsort(times)) == [2, 1, 3, 0]
+    assert sorting.sort(times) == [times[2], times[1], times[3], times[0]]
+
+
+def test_sort_array_quantity():
+    q = sorting.sort(np.array([3.0, 1.0, 2.0]) * units.second)
+    assert list(q.value) == [1.0, 2.0, 3.0]
+
+
+def test_searchsorted():
+    times = [1 * units.second, 1 * units.minute, 1 * units.hour]
+    assert sorting.searchsorted(times, 30 * units.second) == 1
+    assert list(sorting.searchsorted(times, [500 * units.milli * units.second, 2 * units.hour])) == [0, 3]
+    with pytest.raises(TypeError):
+        sorting.searchsorted(times, 1 * units.meter)
+
+
+def test_sorted_quantities_range():
+    times = [2 * units.minute, 5 * units.second, 300 * units.milli * units.second, 1 * units.minute]
+    index = sorting.SortedQuantities(times)
+    assert list(index.range(1 * units.second, 60 * units.second)) == [1, 3]
+    ranges = index.ranges([0 * units.second, 90 * units.second], [1 * units.second, 1 * units.hour])
+    assert [list(r) for r in ranges] == [[2], [0]]
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from cubit import spectral, units
+
+
+def _fid(n=1024, scans=3, dwell=1e-4, offset=1250.0, dtype=np.complex128):
+    t = np.arange(n) * dwell
+    fid = np.exp(2j * np.pi * offset * t - t / 0.05).astype(dtype)
+    return np.tile(fid, (scans, 1)) * units.volt
+
+
+def test_fft_frequency_axis_and_peak():
+    fid = _fid()
+    spectrum = spectral.fft(fid, 0.1 * units.milli * units.second)
+    assert spectrum.frequency.unit is units.hertz
+    assert spectrum.frequency.value[0] == pytest.approx(-5000)
+    assert np.all(np.diff(spectrum.frequency.value) > 0)
+    assert spectrum.values.unit == fid.unit
+    assert spectrum.values.value.shape == (3, 1024)
+    peaks = spectrum.frequency.value[np.argmax(np.abs(spectrum.values.value), axis=-1)]
+    assert peaks == pytest.approx([1250] * 3, abs=10)
+    with pytest.raises(TypeError):
+        spectral.fft(fid, 1 * units.meter)
+
+
+@pytest.mark.parametrize("n", [1024, 1023])
+@pytest.mark.parametrize("fft_out", [True, False], ids=["numpy2", "numpy1-fallback"])
+def test_inplace_matches_copy_and_keeps_precision(n, fft_out, monkeypatch):
+    if fft_out and not spectral._FFT_OUT:
+        pytest.skip("np.fft has no out= before NumPy 2")
+    monkeypatch.setattr(spectral, "_FFT_OUT", fft_out)
+    fid = _fid(n=n, dtype=np.complex64)
+    expected = spectral.fft(fid, 1e-4 * units.second)
+    buffer = fid.value
+    spectrum = spectral.fft(fid, 1e-4 * units.second, inplace=True)
+    assert spectrum.values.value is buffer
+    assert spectrum.values.value.dtype == np.complex64
+    assert np.allclose(spectrum.values.value, expected.values.value, atol=1e-3)
+    assert np.array_equal(spectrum.frequency.value, expected.frequency.value)
+
+
+def test_round_trip_and_real_fft():
+    fid = _fid(n=256, scans=1)
+    signal = spectral.ifft(spectral.fft(fid, 1e-4 * units.second))
+    assert np.allclose(signal.values.value, fid.value)
+    assert signal.time.value[1] == pytest.approx(1e-4)
+    real = spectral.rfft(fid.value.real[0] * units.volt, 1e-4 * units.second)
+    assert real.frequency.value[-1] == pytest.approx(5000)
+    assert real.values.value.shape == (129,)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import cubit
+from cubit import units
+from cubit.system import Quantity
+
+ELEMENTARY_CHARGE = 1.602176487e-19 * units.coulomb
+ELECTRON_MASS = 9.1093835611e-31 * units.kilogram
+
+
+def larmor(field):
+    return ELEMENTARY_CHARGE * field / (2 * ELECTRON_MASS)
+
+
+def test_compile_matches_quantity_arithmetic():
+    kernel = cubit.compile(larmor, field=units.tesla)
+    field = np.linspace(0, 20, 101)
+    expected = larmor(Quantity(field, units.tesla))
+    assert kernel.unit == expected.unit
+    assert np.allclose(kernel(field), expected.value)
+    assert kernel.source.count("c0") == 1
+
+
+def test_compile_is_cached_per_unit_signature():
+    assert cubit.compile(larmor, field=units.tesla) is cubit.compile(larmor, field=units.tesla)
+    assert cubit.compile(larmor, field=units.tesla) is not cubit.compile(larmor, field=units.milli * units.tesla)
+
+
+def test_kernel_cache_is_bounded():
+    from cubit import trace
+
+    for i in range(trace.KERNEL_CACHE_SIZE + 10):
+        cubit.compile(lambda x, i=i: x * i, x=units.meter)
+    assert len(trace._KERNELS) == trace.KERNEL_CACHE_SIZE
+
+
+def test_compile_output_unit_and_apply():
+    def energy(x, t):
+        return (x / t) ** 2 * ELECTRON_MASS / 2 + 3 * units.joule
+
+    kernel = cubit.compile(energy, x=units.meter, t=units.milli * units.second, output_unit=units.joule)
+    assert kernel.unit is units.joule
+    assert kernel(1.0, 1.0) == pytest.approx(3 + 9.1093835611e-31 * 1e6 / 2)
+    result = kernel.apply(x=1 * units.kilo * units.meter, t=1 * units.second)
+    assert result.value == pytest.approx(3 + 9.1093835611e-31 * 1e6 / 2)
+
+
+def test_compile_checks_units_at_trace_time():
+    with pytest.raises(TypeError):
+        cubit.compile(lambda x: x + 1 * units.second, x=units.meter)
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cubit import units
+from cubit.physical_data import BOHR_RADIUS, ELECTRON_MASS, HBAR
+from cubit.system import PhysicalDimension
+from cubit.unit_systems import ATOMIC, CGS, SI, UnitSystem, _factor, dimensions
+
+
+def test_atomic_units():
+    assert ATOMIC.from_quantity(HBAR) == pytest.approx(1)
+    assert ATOMIC.from_quantity(ELECTRON_MASS) == pytest.approx(1)
+    assert ATOMIC.from_quantity(BOHR_RADIUS) == pytest.approx(1)
+    hartree = ATOMIC.to_quantity(1.0, units.joule)
+    assert hartree.value == pytest.approx(4.3597447e-18)
+    assert ATOMIC.convert(1.0, units.joule, CGS) == pytest.approx(4.3597447e-11)  # erg
+
+
+def test_table_conversion_uses_cached_factors():
+    _factor.cache_clear()
+    table = pd.DataFrame({"energy": np.arange(3.0), "length": [1.0, 2.0, 3.0], "label": ["a", "b", "c"]})
+    si = ATOMIC.convert_table(table, {"energy": units.joule, "length": units.meter}, SI)
+    np.testing.assert_allclose(si["length"], table["length"] * BOHR_RADIUS.base_value)
+    assert list(si["label"]) == ["a", "b", "c"]
+    ATOMIC.convert_table(table, {"energy": units.newton * units.meter}, SI)
+    assert _factor.cache_info().hits == 1
+    back = SI.convert(si["energy"], units.joule, ATOMIC)
+    np.testing.assert_allclose(back, table["energy"])
+    assert dimensions(units.joule) == (2, 1, -2, 0, 0, 0, 0)
+
+
+def test_base_units_must_have_one_dimension():
+    with pytest.raises(ValueError, match="length base unit"):
+        UnitSystem("broken", {PhysicalDimension.LENGTH: units.second})
@@ -1,4 +1,8 @@
 import itertools
+import os
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
@@ -69,3 +73,117 @@ def test_div(a, b):
         assert isinstance(c, float)
     else:
         assert isinstance(c, type_combinations_div.get((type(a), type(b)), int))
+
+
+def test_simplify_to_named_unit():
+    q = 3 * units.kilogram * units.meter**2 / units.second**2
+    assert q.simplify().unit is units.joule
+    assert repr(q) == "3 J"
+    assert (units.volt * units.ampere).simplify() is units.watt
+    assert (units.meter / units.second).simplify() == units.meter / units.second
+
+
+def test_to_preferred_converts_to_coherent_unit():
+    q = (5 * units.gram * units.meter**2 / units.second**2).to_preferred()
+    assert q.unit is units.joule
+    assert q.value == pytest.approx(0.005)
+    assert (2 * units.minute).to_preferred().unit is units.minute
+
+
+def test_canonical_unit_string_round_trip():
+    assert units.joule.canonical == "1000.0 g^1 m^2 s^-2"
+    assert CompositeUnit.from_canonical(units.joule.canonical) is units.joule
+    assert CompositeUnit.from_canonical(units.hertz.canonical) is units.hertz
+    km = Quantity(1, units.kilo * units.meter).unit
+    assert CompositeUnit.from_canonical(km.canonical) == km
+    with pytest.raises(ValueError):
+        CompositeUnit.from_canonical("1 furlong^1")
+
+
+def test_prefix_algebra_returns_canonical_prefixes():
+    assert units.kilo * units.milli is units.uni
+    assert units.nano / units.micro is units.milli
+    assert units.kibi * units.kibi is units.mebi
+    assert units.milli.power == (10, -3)
+    assert units.gibi.power == (2, 30)
+    # products without a named prefix get an exact factor
+    assert (units.kilo * units.deca).factor == 1e4
+    assert (units.kilo * units.meter).scaling_factor is units.kilo
+
+
+def test_scalar_arithmetic_reuses_units():
+    velocity = 3.0 * units.meter / units.second
+    assert (2.0 * units.meter).unit is units.meter.as_composite()
+    assert (velocity * velocity).unit is (velocity * velocity).unit
+    assert Quantity(1).unit is Quantity(2).unit
+
+    inverse = 2 / (4 * units.meter)
+    assert inverse.value == 0.5
+    assert inverse.unit.signature == (units.meter**-1).signature
+
+
+def test_product_cache_is_keyed_on_unit_values():
+    energy = 2.0 * units.joule
+    size = len(energy.unit._products)
+    for _ in range(1000):
+        product = energy * (units.milli * units.joule)
+    assert len(energy.unit._products) <= size + 1
+    assert product.unit.factor == pytest.approx(1e-3 * units.joule.factor**2)
+
+
+def _run(script: str, tmp_path: Path) -> str:
+    # the catalogue registers duplicates of the live units when built, so it is only
+    # built in a separate process
+    src = str(Path(units.__file__).parent.parent)
+    env = os.environ | {"PYTHONPATH": src, "PYTHONPYCACHEPREFIX": str(tmp_path)}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [sys.executable, "-c", script]
+    return subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+
+
+def test_snapshot_matches_definitions(tmp_path):
+    from cubit import _catalogue
+
+    snapshot = tmp_path / "_catalogue.py"
+    _run(f"import cubit.units\ncubit.units._write_snapshot({str(snapshot)!r})\n", tmp_path)
+    assert snapshot.read_text() == Path(_catalogue.__file__).read_text()
+
+
+def test_rehydration_is_thread_safe(tmp_path):
+    script = (
+        "import threading, time\n"
+        "from concurrent.futures import ThreadPoolExecutor\n"
+        "from cubit.system import CompositeUnit\n"
+        "import cubit.units\n"
+        "from_snapshot = CompositeUnit.from_snapshot.__func__\n"
+        "def slow(cls, **kwargs):\n"
+        "    time.sleep(0.01)  # widen the window between the lookup and the insert\n"
+        "    return from_snapshot(cls, **kwargs)\n"
+        "CompositeUnit.from_snapshot = classmethod(slow)\n"
+        "barrier = threading.Barrier(8)\n"
+        "def get(_):\n"
+        "    barrier.wait()\n"
+        "    return cubit.units.tesla\n"
+        "with ThreadPoolExecutor(8) as pool:\n"
+        "    print(len({id(unit) for unit in pool.map(get, range(8))}))\n"
+    )
+    assert _run(script, tmp_path).split() == ["1"]
+
+
+def test_import_time_budget(tmp_path):
+    # rehydrating the snapshot must be much cheaper than building the catalogue, measured
+    # in the same process so that a loaded machine slows both alike
+    script = (
+        "import time, cubit.system\n"
+        "t = time.perf_counter()\n"
+        "import cubit.units\n"
+        "rehydrate = time.perf_counter() - t\n"
+        "joule_defined = 'joule' in vars(cubit.units)\n"
+        "t = time.perf_counter()\n"
+        "cubit.units._build_catalogue()\n"
+        "print(rehydrate / (time.perf_counter() - t), joule_defined)\n"
+    )
+    runs = [_run(script, tmp_path).split() for _ in range(4)]
+    ratios = [float(r[0]) for r in runs[1:]]
+    assert min(ratios) < 1 / 3
+    assert runs[-1][1] == "False"